@@ -0,0 +1,216 @@
+"""Backends de banco de dados do DatabaseManager
+
+O DatabaseManager fala com o banco usando a API do mysql-connector
+(connection.cursor(dictionary=..., prepared=...), cursor.column_names,
+placeholders %s). Cada backend sabe abrir e validar conexões e informa o
+dialeto SQL usado pelas migrações. O backend SQLite embrulha o módulo sqlite3
+para expor essa mesma API, de modo que o restante do código não precisa saber
+qual banco está em uso.
+"""
+import functools
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import mysql.connector
+
+# Exceções de banco de todos os backends, para uso em `except Error as e`
+Error = (mysql.connector.Error, sqlite3.Error)
+
+# Falhas de conexão ou do servidor, não relacionadas aos dados de uma linha
+OperationalError = (mysql.connector.errors.OperationalError,
+                    mysql.connector.errors.InterfaceError,
+                    sqlite3.OperationalError)
+
+
+class MySQLBackend:
+    """Conexões com um servidor MySQL (mysql-connector-python)"""
+    
+    dialect = 'mysql'
+    
+    def __init__(self, db_config, pool_config):
+        self.params = {key: value for key, value in db_config.items()
+                       if key in ('host', 'port', 'database', 'user', 'password')}
+        self.reconnect_attempts = pool_config['reconnect_attempts']
+    
+    @property
+    def description(self):
+        return f"MySQL ({self.params.get('database')} em {self.params.get('host')})"
+    
+    def connect(self):
+        """Abre uma nova conexão MySQL para o pool"""
+        return mysql.connector.connect(**self.params)
+    
+    def validate(self, connection):
+        """Verifica a conexão emprestada, reconectando se o servidor a derrubou"""
+        connection_id = connection.connection_id
+        connection.ping(reconnect=True, attempts=self.reconnect_attempts, delay=1)
+        if connection.connection_id != connection_id:
+            # Statements preparados não sobrevivem a uma reconexão
+            getattr(connection, 'statement_cache', {}).clear()
+        return connection.is_connected()
+
+
+# Conversões entre os tipos de coluna e os tipos Python devolvidos pelo
+# mysql-connector: DATETIME <-> datetime e TIME <-> timedelta
+
+def _adapt_datetime(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+def _adapt_timedelta(value):
+    seconds = int(value.total_seconds())
+    sign = '-' if seconds < 0 else ''
+    hours, rest = divmod(abs(seconds), 3600)
+    return f"{sign}{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+
+def _convert_datetime(value):
+    return datetime.fromisoformat(value.decode())
+
+def _convert_time(value):
+    text = value.decode()
+    sign = -1 if text.startswith('-') else 1
+    hours, minutes, seconds = text.lstrip('-').split(':')
+    return sign * timedelta(hours=int(hours), minutes=int(minutes), seconds=float(seconds))
+
+sqlite3.register_adapter(datetime, _adapt_datetime)
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(timedelta, _adapt_timedelta)
+sqlite3.register_converter('DATETIME', _convert_datetime)
+sqlite3.register_converter('TIME', _convert_time)
+
+
+@functools.lru_cache(maxsize=512)
+def _translate(operation):
+    """Troca os placeholders %s do mysql-connector pelos ? do sqlite3"""
+    return operation.replace('%s', '?')
+
+
+class SQLiteCursor:
+    """Cursor sqlite3 com a interface usada do cursor do mysql-connector"""
+    
+    def __init__(self, cursor, dictionary=False):
+        self._cursor = cursor
+        self.dictionary = dictionary
+    
+    def execute(self, operation, params=()):
+        self._cursor.execute(_translate(operation), params or ())
+    
+    def executemany(self, operation, seq_params):
+        self._cursor.executemany(_translate(operation), seq_params)
+    
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is None or not self.dictionary:
+            return row
+        return dict(zip(self.column_names, row))
+    
+    def fetchmany(self, size=1):
+        return self._rows(self._cursor.fetchmany(size))
+    
+    def fetchall(self):
+        return self._rows(self._cursor.fetchall())
+    
+    def _rows(self, rows):
+        if not self.dictionary:
+            return rows
+        columns = self.column_names
+        return [dict(zip(columns, row)) for row in rows]
+    
+    @property
+    def column_names(self):
+        return tuple(column[0] for column in self._cursor.description or ())
+    
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+    
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+    
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """Conexão sqlite3 com a interface usada da conexão do mysql-connector"""
+    
+    def __init__(self, connection):
+        self._connection = connection
+        self.connection_id = id(connection)
+    
+    def cursor(self, dictionary=False, prepared=False):
+        # O sqlite3 já mantém seu próprio cache de statements compilados
+        return SQLiteCursor(self._connection.cursor(), dictionary)
+    
+    @property
+    def in_transaction(self):
+        return self._connection.in_transaction
+    
+    def commit(self):
+        self._connection.commit()
+    
+    def rollback(self):
+        self._connection.rollback()
+    
+    def is_connected(self):
+        try:
+            self._connection.execute("SELECT 1")
+        except sqlite3.ProgrammingError:  # conexão já fechada
+            return False
+        return True
+    
+    def close(self):
+        self._connection.close()
+
+
+class SQLiteBackend:
+    """Banco local em um arquivo SQLite, em modo WAL
+    
+    No modo WAL leitores não bloqueiam o escritor nem uns aos outros, então as
+    conexões do pool podem consultar em paralelo enquanto outra grava. ENUMs
+    viram colunas TEXT com CHECK e DATETIME/TIME são convertidos para
+    datetime/timedelta, como no MySQL.
+    """
+    
+    dialect = 'sqlite'
+    
+    def __init__(self, sqlite_config, pool_config):
+        self.config = sqlite_config
+        self.path = sqlite_config['path']
+        self.statement_cache_size = pool_config['statement_cache_size']
+    
+    @property
+    def description(self):
+        return f"SQLite ({self.path})"
+    
+    def connect(self):
+        """Abre uma nova conexão com o arquivo e aplica os pragmas configurados"""
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.config['busy_timeout'] / 1000,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=self.statement_cache_size,
+            # Cada conexão é usada por uma thread por vez, controlado pelo pool
+            check_same_thread=False
+        )
+        connection.execute(f"PRAGMA journal_mode = {self.config['journal_mode']}")
+        connection.execute(f"PRAGMA synchronous = {self.config['synchronous']}")
+        connection.execute(f"PRAGMA cache_size = {int(self.config['cache_size'])}")
+        connection.execute(f"PRAGMA mmap_size = {int(self.config['mmap_size'])}")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        connection.execute("PRAGMA foreign_keys = ON")
+        return SQLiteConnection(connection)
+    
+    def validate(self, connection):
+        """Conexões com arquivo local não caem; apenas confirma que segue aberta"""
+        return connection.is_connected()
+
+
+def create_backend(db_config, sqlite_config, pool_config):
+    """Cria o backend escolhido em DB_CONFIG['backend'] ('mysql' ou 'sqlite')"""
+    name = db_config.get('backend', 'mysql')
+    if name == 'mysql':
+        return MySQLBackend(db_config, pool_config)
+    if name == 'sqlite':
+        return SQLiteBackend(sqlite_config, pool_config)
+    raise ValueError(f"Backend de banco desconhecido: {name}")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gera o arquivo binário de recursos resource.rcc a partir de resource.qrc
+
+Uso:
+    python build_resources.py
+
+O resource.rcc é registrado em tempo de execução por resource_loader.py com
+QResource.registerResource, que mapeia o arquivo em memória em vez de
+interpretar o literal de bytes de ~660 KB do resource_rc.py a cada import.
+
+O PyQt5 não traz o rcc do Qt com a opção -binary, então o pyrcc5 gera o
+módulo Python normalmente e os blocos de dados, nomes e estrutura são
+extraídos dele e gravados no formato binário do rcc (versão 2).
+"""
+
+import argparse
+import ast
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RCC_FORMAT_VERSION = 2
+HEADER_SIZE = 20  # 'qres' + versão + offsets da árvore, dos dados e dos nomes
+
+def read_resource_blobs(path):
+    """Lê os literais de bytes de um módulo gerado pelo pyrcc5 sem importá-lo"""
+    with open(path, encoding='utf-8') as source:
+        tree = ast.parse(source.read(), path)
+    
+    blobs = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id.startswith('qt_resource_'):
+                blobs[target.id] = ast.literal_eval(node.value)
+    return blobs['qt_resource_data'], blobs['qt_resource_name'], blobs['qt_resource_struct_v2']
+
+def write_rcc(output, data, names, tree):
+    """Grava os blocos no formato binário do rcc"""
+    data_offset = HEADER_SIZE
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = b'qres' + struct.pack('>IIII', RCC_FORMAT_VERSION, tree_offset, data_offset, names_offset)
+    with open(output, 'wb') as rcc:
+        rcc.write(header)
+        rcc.write(data)
+        rcc.write(names)
+        rcc.write(tree)
+    return tree_offset + len(tree)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera resource.rcc a partir de resource.qrc")
+    parser.add_argument('--qrc', default=os.path.join(BASE_DIR, 'resource.qrc'))
+    parser.add_argument('-o', '--output', default=os.path.join(BASE_DIR, 'resource.rcc'))
+    args = parser.parse_args(argv)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        module = os.path.join(tmp, 'resource_tmp.py')
+        subprocess.run([sys.executable, '-m', 'PyQt5.pyrcc_main', args.qrc, '-o', module],
+                       check=True, cwd=os.path.dirname(os.path.abspath(args.qrc)))
+        size = write_rcc(args.output, *read_resource_blobs(module))
+    
+    print(f"✅ {os.path.basename(args.output)} gerado ({size / 1024:.1f} KB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gera as classes Python das interfaces do Qt Designer
+
+Uso:
+    python build_ui.py          # gera apenas os formulários desatualizados
+    python build_ui.py --force  # gera todos
+
+Execute sempre que editar um arquivo .ui. Os módulos gerados são usados por
+ui_loader.py no lugar de uic.loadUi. Nos formulários com ícones do
+resource.qrc, os caminhos ':/icon/icon/...' são trocados por chamadas a
+resource_loader.icon()/pixmap(), que funcionam com qualquer backend de
+recursos (inclusive 'files') e reaproveitam os ícones já carregados.
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+
+from PyQt5.uic import compileUi
+
+from ui_loader import BASE_DIR
+
+FORMS = ['login', 'register', 'tickets_main', 'ticket_details', 'sidebar']
+
+RESOURCE_PIXMAP = r'QtGui\.QPixmap\(":/icon/icon/([^"]+)"\)'
+# QIcon montado com o arquivo normal e, opcionalmente, o do estado marcado
+RESOURCE_ICON = re.compile(
+    r'^(?P<indent> +)(?P<var>\w+) = QtGui\.QIcon\(\)\n'
+    r'(?P=indent)(?P=var)\.addPixmap\(' + RESOURCE_PIXMAP + r', QtGui\.QIcon\.Normal, QtGui\.QIcon\.Off\)\n'
+    r'(?:(?P=indent)(?P=var)\.addPixmap\(' + RESOURCE_PIXMAP + r', QtGui\.QIcon\.Normal, QtGui\.QIcon\.On\)\n)?',
+    re.MULTILINE)
+
+def use_resource_loader(code):
+    """Troca os ícones do resource.qrc no código gerado por resource_loader"""
+    def replace_icon(match):
+        indent, var, name, checked = match.group('indent', 'var', 3, 4)
+        args = f'"{name}"' + (f', "{checked}"' if checked else '')
+        return f'{indent}{var} = resource_loader.icon({args})\n'
+    
+    code = RESOURCE_ICON.sub(replace_icon, code)
+    code = re.sub(RESOURCE_PIXMAP, r'resource_loader.pixmap("\1")', code)
+    return code.replace('\nimport resource_rc\n', '\nimport resource_loader\n')
+
+def build(name, force=False):
+    """Gera <name>_ui.py a partir de <name>.ui se necessário"""
+    ui_path = os.path.join(BASE_DIR, f'{name}.ui')
+    py_path = os.path.join(BASE_DIR, f'{name}_ui.py')
+    if not force and os.path.exists(py_path) and os.path.getmtime(py_path) >= os.path.getmtime(ui_path):
+        return False
+    
+    output = io.StringIO()
+    compileUi(f'{name}.ui', output, from_imports=False)
+    with open(py_path, 'w', encoding='utf-8') as file:
+        file.write(use_resource_loader(output.getvalue()))
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera as classes Python dos arquivos .ui")
+    parser.add_argument('--force', action='store_true', help="gera todos os formulários")
+    args = parser.parse_args(argv)
+    
+    os.chdir(BASE_DIR)
+    for name in FORMS:
+        if build(name, args.force):
+            print(f"✅ {name}.ui -> {name}_ui.py")
+        else:
+            print(f"   {name}_ui.py já está atualizado")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 # Configurações do Banco de Dados
 DB_CONFIG = {
+    'backend': 'mysql',      # 'mysql' ou 'sqlite' (arquivo local, ver SQLITE_CONFIG)
     'host': 'localhost',
     'database': 'gestao_tickets',
     'user': 'root',
@@ -7,9 +8,65 @@ DB_CONFIG = {
     'port': 3306
 }
 
+# Banco SQLite local, usado quando DB_CONFIG['backend'] == 'sqlite'
+SQLITE_CONFIG = {
+    'path': 'gestao_tickets.db',
+    'journal_mode': 'WAL',   # Leitores não bloqueiam o escritor
+    'synchronous': 'NORMAL', # Seguro com WAL e bem mais rápido que FULL
+    'cache_size': -16000,    # Cache de páginas por conexão (negativo = KiB)
+    'mmap_size': 67108864,   # Leitura do arquivo via memória mapeada (64 MiB)
+    'busy_timeout': 5000     # Milissegundos aguardando o banco ser liberado
+}
+
+# Pool de conexões do DatabaseManager
+POOL_CONFIG = {
+    'enabled': True,         # False mantém uma única conexão compartilhada
+    'min_size': 1,           # Conexões abertas ao iniciar
+    'max_size': 5,           # Limite de conexões simultâneas
+    'timeout': 10,           # Segundos aguardando uma conexão livre
+    'ping_interval': 30,     # Segundos ociosa antes de validar a conexão no empréstimo
+    'reconnect_attempts': 3, # Tentativas de reconexão quando a validação falha
+    'statement_cache_size': 32  # Statements preparados mantidos por conexão
+}
+
+# Hash das senhas (ver passwords.py). Ajuste o custo com
+# `python manage_db.py calibrate-hash`; senhas com custo antigo são refeitas no login.
+PASSWORD_CONFIG = {
+    'algorithm': 'scrypt',   # 'scrypt' ou 'pbkdf2_sha256'
+    'scrypt_n': 2 ** 15,     # Custo de CPU/memória (128 * n * r bytes = 32 MiB)
+    'scrypt_r': 8,
+    'scrypt_p': 1,
+    'pbkdf2_iterations': 600000
+}
+
+# Cache das consultas de leitura do DatabaseManager
+CACHE_CONFIG = {
+    'enabled': True,
+    'max_size': 256,         # Consultas distintas mantidas (LRU)
+    'ttl': 30                # Segundos até uma entrada expirar
+}
+
+# Sessão local ("Manter conectado" no login, ver sessions.py)
+SESSION_CONFIG = {
+    'enabled': True,         # False sempre pede e-mail e senha
+    'directory': '~/.gestao_tickets',  # Pasta do token e da chave de assinatura
+    'days': 7,               # Validade do token
+    'recent_tickets': 20     # Últimos tickets abertos, pré-carregados ao retomar a sessão
+}
+
 # Configurações da Aplicação
 APP_CONFIG = {
     'title': 'Sistema de Gestão de Tickets',
     'version': '1.0.0',
-    'company': 'Sua Empresa'
+    'company': 'Sua Empresa',
+    'page_size': 100,        # Tickets carregados por página na lista de tickets
+    'local_index_max_mb': 64,  # Limite do índice em memória da lista; acima dele a busca vai ao servidor
+    'filter_delay_ms': 250,  # Espera após a última tecla/troca de filtro antes de consultar o banco
+    'poll_interval_ms': 5000,  # Intervalo de consulta ao diário de eventos (atualização das telas)
+    'comments_page_size': 50,  # Comentários carregados por vez nos detalhes do ticket
+    'comment_threads_cached': 20,  # Conversas de tickets mantidas na memória para reabrir na hora
+    'prefetch_tickets': 20,  # Tickets em vista cujos comentários são buscados antes de abrir
+    'prefetch_cache_size': 100,  # Primeiras páginas de comentários guardadas pela busca antecipada
+    'ui_dev_mode': False,    # True lê os arquivos .ui a cada execução (uic.loadUi)
+    'resources': 'auto'      # 'auto' (resource.rcc, senão resource_rc.py), 'rcc', 'rc' ou 'files' (icon/)
 }
@@ -1,231 +1,1040 @@
-import mysql.connector
-from mysql.connector import Error
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-import hashlib
+import html
+import time
+
+from backends import Error, OperationalError, create_backend
+from config import DB_CONFIG, SQLITE_CONFIG, POOL_CONFIG, CACHE_CONFIG
+from db_pool import ConnectionPool
+import migrations
+import passwords
+from query_builder import TicketQuery
+from query_cache import QueryCache, cached, invalidates
+import search
+
+TICKET_STATUSES = ('aberto', 'pausado', 'fechado')
+
+BULK_TICKET_INSERT = """
+    INSERT INTO tickets (titulo, descricao, cliente_id, status, data_criacao)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+BULK_COMMENT_INSERT = """
+    INSERT INTO comentarios (ticket_id, usuario_id, texto, data_comentario)
+    VALUES (%s, %s, %s, %s)
+"""
+
+COMMENT_FIELDS = ('ticket_id', 'usuario_id', 'texto', 'data_comentario')
+
+# Diário de eventos lido pelo ChangeFeed (workers.py) para atualizar as telas
+EVENT_INSERT = "INSERT INTO ticket_events (ticket_id, tipo) VALUES (%s, %s)"
+
+# Eventos de um lote: as linhas com id acima do maior id anterior ao lote.
+# Inserções concorrentes podem sair duplicadas no diário, o que é inofensivo
+# (o evento só faz a tela buscar o ticket de novo).
+BULK_EVENTS = {
+    'tickets': """
+        INSERT INTO ticket_events (ticket_id, tipo)
+        SELECT id, 'criado' FROM tickets WHERE id > %s
+    """,
+    'comentarios': """
+        INSERT INTO ticket_events (ticket_id, tipo)
+        SELECT DISTINCT ticket_id, 'comentario' FROM comentarios WHERE id > %s
+    """,
+}
+
+# Soma deltas aos contadores de ticket_counters (uma linha por cliente e a
+# linha 0 com o total geral), criando a linha se ainda não existir
+COUNTER_UPSERT = {
+    'mysql': """
+        INSERT INTO ticket_counters (cliente_id, aberto, pausado, fechado)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE aberto = aberto + VALUES(aberto),
+                                pausado = pausado + VALUES(pausado),
+                                fechado = fechado + VALUES(fechado)
+    """,
+    'sqlite': """
+        INSERT INTO ticket_counters (cliente_id, aberto, pausado, fechado)
+        VALUES (%s, %s, %s, %s)
+        ON CONFLICT (cliente_id) DO UPDATE SET aberto = aberto + excluded.aberto,
+                                               pausado = pausado + excluded.pausado,
+                                               fechado = fechado + excluded.fechado
+    """,
+}
+
+def _update_rate(result, started):
+    """Atualiza o tempo decorrido e as linhas inseridas por segundo de uma importação"""
+    result['seconds'] = time.perf_counter() - started
+    result['rate'] = result['inserted'] / result['seconds'] if result['seconds'] else 0.0
+
+def _parse_datetime(value, field):
+    """Aceita datetime ou texto ISO ('2024-01-31 10:00:00'); None vira a hora atual"""
+    if not value:
+        return datetime.now().replace(microsecond=0)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.strip())
+        except ValueError:
+            raise ValueError(f"{field} inválida: {value}")
+    return value
+
+def _user_id(record, field, users):
+    """Id do usuário em record[field] ou, na falta dele, pelo e-mail em record[field_email]"""
+    user_id = record.get(field)
+    if user_id in (None, ''):
+        email = (record.get(f'{field[:-3]}_email') or '').strip().lower()
+        user_id = users.get(email)
+        if user_id is None:
+            raise ValueError(f"{field[:-3]} não encontrado: {email or '(sem e-mail)'}")
+        return user_id
+    try:
+        return int(user_id)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} inválido: {user_id}")
+
+def _ticket_values(ticket, clients):
+    """Valida um ticket da importação e retorna os valores de BULK_TICKET_INSERT
+    
+    clients mapeia e-mail (em minúsculas) para o id do usuário. Levanta
+    ValueError com o motivo da rejeição.
+    """
+    if not isinstance(ticket, dict):
+        raise ValueError("registro inválido")
+    
+    titulo = (ticket.get('titulo') or '').strip()
+    if not titulo:
+        raise ValueError("título vazio")
+    if len(titulo) > 255:
+        raise ValueError("título com mais de 255 caracteres")
+    
+    cliente_id = _user_id(ticket, 'cliente_id', clients)
+    
+    status = (ticket.get('status') or 'aberto').strip().lower()
+    if status not in TICKET_STATUSES:
+        raise ValueError(f"status inválido: {status}")
+    
+    data_criacao = _parse_datetime(ticket.get('data_criacao'), 'data_criacao')
+    return titulo, ticket.get('descricao') or '', cliente_id, status, data_criacao
+
+def _comment_values(comment, users):
+    """Valida um comentário da importação e retorna os valores de BULK_COMMENT_INSERT
+    
+    Aceita um dicionário ou uma tupla (ticket_id, usuario_id, texto[, data_comentario]).
+    O autor pode vir em usuario_id ou usuario_email.
+    """
+    if isinstance(comment, (tuple, list)):
+        comment = dict(zip(COMMENT_FIELDS, comment))
+    if not isinstance(comment, dict):
+        raise ValueError("registro inválido")
+    
+    try:
+        ticket_id = int(comment.get('ticket_id'))
+    except (TypeError, ValueError):
+        raise ValueError(f"ticket_id inválido: {comment.get('ticket_id')}")
+    usuario_id = _user_id(comment, 'usuario_id', users)
+    
+    texto = comment.get('texto') or ''
+    if not texto.strip():
+        raise ValueError("comentário vazio")
+    
+    data_comentario = _parse_datetime(comment.get('data_comentario'), 'data_comentario')
+    return ticket_id, usuario_id, texto, data_comentario
 
 class DatabaseManager:
-    def __init__(self):
-        self.connection = None
+    def __init__(self, pool_config=None, cache_config=None, db_config=None, sqlite_config=None):
+        self.pool_config = dict(POOL_CONFIG, **(pool_config or {}))
+        self.backend = create_backend(dict(DB_CONFIG, **(db_config or {})),
+                                      dict(SQLITE_CONFIG, **(sqlite_config or {})),
+                                      self.pool_config)
+        self.cache = QueryCache(**dict(CACHE_CONFIG, **(cache_config or {})))
+        self.pool = None
         self.connect()
     
     def connect(self):
-        """Conecta ao banco de dados MySQL"""
-        try:
-            self.connection = mysql.connector.connect(
-                host='localhost',
-                database='tiflux_db',
-                user='root',
-                password=''
-            )
-            if self.connection.is_connected():
-                print("Conectado ao banco de dados MySQL")
-                self.create_tables()
-        except Error as e:
-            print(f"Erro ao conectar ao MySQL: {e}")
-    
-    def create_tables(self):
-        """Cria as tabelas se não existirem"""
-        try:
-            cursor = self.connection.cursor()
-            
-            # Tabela de usuários
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS usuarios (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    nome VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) NOT NULL UNIQUE,
-                    senha VARCHAR(255) NOT NULL,
-                    tipo ENUM('admin', 'cliente') NOT NULL
-                )
-            """)
-            
-            # Tabela de tickets
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tickets (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    titulo VARCHAR(255) NOT NULL,
-                    descricao TEXT,
-                    cliente_id INT NOT NULL,
-                    status ENUM('aberto', 'pausado', 'fechado') DEFAULT 'aberto',
-                    data_criacao DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    tempo_resposta TIME DEFAULT '00:00:00',
-                    FOREIGN KEY (cliente_id) REFERENCES usuarios(id)
-                )
-            """)
-            
-            # Tabela de comentários
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS comentarios (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    ticket_id INT NOT NULL,
-                    usuario_id INT NOT NULL,
-                    texto TEXT NOT NULL,
-                    data_comentario DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (ticket_id) REFERENCES tickets(id),
-                    FOREIGN KEY (usuario_id) REFERENCES usuarios(id)
-                )
-            """)
-            
-            self.connection.commit()
+        """Cria o pool de conexões com o banco configurado em DB_CONFIG['backend']"""
+        if self.pool_config['enabled']:
+            min_size = self.pool_config['min_size']
+            max_size = self.pool_config['max_size']
+        else:
+            min_size = max_size = 1
+        
+        self.pool = ConnectionPool(
+            self.backend.connect,
+            min_size=min_size,
+            max_size=max_size,
+            timeout=self.pool_config['timeout'],
+            validate=self.backend.validate,
+            ping_interval=self.pool_config['ping_interval']
+        )
+        try:
+            self.pool.fill()
+            print(f"Conectado ao banco de dados {self.backend.description}")
+            self.migrate_schema()
+        except Error as e:
+            print(f"Erro ao conectar ao banco de dados: {e}")
+    
+    @property
+    def dialect(self):
+        """Dialeto SQL do backend em uso ('mysql' ou 'sqlite')"""
+        return self.backend.dialect
+    
+    @contextmanager
+    def get_connection(self):
+        """Empresta uma conexão do pool pelo tempo do bloco with"""
+        connection = self.pool.acquire()
+        try:
+            yield connection
+        finally:
+            self.pool.release(connection)
+    
+    def _prepared_cursor(self, connection, query):
+        """Retorna um cursor preparado para o formato de consulta, reaproveitando-o
+        
+        Cada conexão guarda um cache LRU de cursores preparados indexado pelo
+        texto SQL, de modo que a consulta é analisada pelo servidor uma única vez
+        por conexão. O cursor precisa receber o mesmo objeto str em execute()
+        para não preparar de novo, por isso o texto guardado no cache é devolvido.
+        """
+        cache = getattr(connection, 'statement_cache', None)
+        if cache is None:
+            cache = connection.statement_cache = OrderedDict()
+        
+        entry = cache.get(query)
+        if entry is not None:
+            cache.move_to_end(query)
+            return entry
+        
+        entry = (query, connection.cursor(prepared=True))
+        cache[query] = entry
+        while len(cache) > self.pool_config['statement_cache_size']:
+            _, (_, old_cursor) = cache.popitem(last=False)
+            old_cursor.close()
+        return entry
+    
+    def _fetch_all(self, connection, query, params=()):
+        """Executa um SELECT preparado e retorna as linhas como dicionários"""
+        query, cursor = self._prepared_cursor(connection, query)
+        try:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        except Error:
+            # Descarta o statement; ele será preparado de novo na próxima chamada
+            connection.statement_cache.pop(query, None)
+            raise
+        columns = cursor.column_names
+        return [dict(zip(columns, row)) for row in rows]
+    
+    def find_tickets(self, query):
+        """Executa uma TicketQuery e retorna os tickets encontrados"""
+        sql, params = query.build()
+        with self.get_connection() as connection:
+            return self._fetch_all(connection, sql, params)
+    
+    def stream_query(self, query, params=(), fetch_size=1000):
+        """Executa um SELECT e gera (colunas, linhas) em blocos de fetch_size
+        
+        Usa um cursor sem buffer com fetchmany, de modo que o resultado é lido
+        do servidor aos poucos e a memória usada não depende do tamanho da
+        tabela. A conexão fica dedicada ao gerador até ele terminar; se for
+        interrompido antes, ela é descartada em vez de voltar ao pool com um
+        resultado pela metade.
+        """
+        connection = self.pool.acquire()
+        exhausted = False
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query, params)
+            columns = cursor.column_names
+            # O primeiro bloco é gerado mesmo vazio, para informar as colunas
+            rows = cursor.fetchmany(fetch_size)
+            yield columns, rows
+            while rows:
+                rows = cursor.fetchmany(fetch_size)
+                if rows:
+                    yield columns, rows
+            exhausted = True
             cursor.close()
-            print("Tabelas criadas/verificadas com sucesso")
-            
+        finally:
+            if exhausted:
+                self.pool.release(connection)
+            else:
+                self.pool.discard(connection)
+    
+    def stream_tickets(self, fetch_size=1000, **filters):
+        """Gera (colunas, linhas) de todos os tickets que atendem aos filtros de get_tickets"""
+        sql, params = TicketQuery.from_filters(**filters).build()
+        return self.stream_query(sql, params, fetch_size)
+    
+    def stream_comments(self, fetch_size=1000, **filters):
+        """Gera (colunas, linhas) dos comentários dos tickets que atendem aos filtros"""
+        query = """
+            SELECT c.*, u.nome as usuario_nome
+            FROM comentarios c
+            JOIN usuarios u ON c.usuario_id = u.id
+        """
+        params = ()
+        ticket_query = TicketQuery.from_filters(**filters)
+        if ticket_query.conditions:
+            ids_sql, params = ticket_query.build_ids()
+            query += f" WHERE c.ticket_id IN ({ids_sql})"
+        query += " ORDER BY c.ticket_id, c.data_comentario, c.id"
+        return self.stream_query(query, params, fetch_size)
+    
+    def migrate_schema(self):
+        """Aplica as migrações de esquema pendentes (ver migrations.py)"""
+        try:
+            with self.get_connection() as connection:
+                applied = migrations.migrate(connection, dialect=self.dialect)
+            if applied:
+                print(f"Esquema atualizado para a versão {applied[-1]}")
+        
         except Error as e:
-            print(f"Erro ao criar tabelas: {e}")
+            print(f"Erro ao aplicar migrações: {e}")
     
     def hash_password(self, password):
-        """Cria hash da senha"""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Cria hash da senha (com sal e custo de PASSWORD_CONFIG, ver passwords.py)"""
+        return passwords.hash_password(password)
     
     def create_user(self, nome, email, senha, tipo='cliente'):
         """Cria um novo usuário"""
         try:
-            cursor = self.connection.cursor()
-            hashed_password = self.hash_password(senha)
-            
-            query = "INSERT INTO usuarios (nome, email, senha, tipo) VALUES (%s, %s, %s, %s)"
-            cursor.execute(query, (nome, email, hashed_password, tipo))
-            
-            self.connection.commit()
-            cursor.close()
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                hashed_password = self.hash_password(senha)
+                
+                query = "INSERT INTO usuarios (nome, email, senha, tipo) VALUES (%s, %s, %s, %s)"
+                cursor.execute(query, (nome, email, hashed_password, tipo))
+                
+                connection.commit()
+                cursor.close()
             return True
         except Error as e:
             print(f"Erro ao criar usuário: {e}")
             return False
     
     def authenticate_user(self, email, senha):
-        """Autentica um usuário"""
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            hashed_password = self.hash_password(senha)
-            
-            query = "SELECT * FROM usuarios WHERE email = %s AND senha = %s"
-            cursor.execute(query, (email, hashed_password))
-            
-            user = cursor.fetchone()
-            cursor.close()
-            return user
+        """Autentica um usuário
+        
+        Busca o usuário pelo e-mail e confere a senha com o hash guardado, fora
+        da conexão (a verificação é lenta de propósito). Se o hash é do formato
+        antigo ou usa um custo diferente do configurado, grava o hash novo.
+        """
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("SELECT * FROM usuarios WHERE email = %s", (email,))
+                user = cursor.fetchone()
+                cursor.close()
         except Error as e:
             print(f"Erro na autenticação: {e}")
             return None
+        
+        if user is None:
+            # Mesmo tempo de resposta de uma senha errada
+            return passwords.dummy_verify(senha) or None
+        if not passwords.verify_password(senha, user['senha']):
+            return None
+        
+        if passwords.needs_rehash(user['senha']):
+            self._rehash_password(user, senha)
+        return user
+    
+    def _rehash_password(self, user, senha):
+        """Troca o hash da senha do usuário pelo formato e custo atuais"""
+        new_hash = self.hash_password(senha)
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                # Só troca se ninguém mudou a senha desde a leitura
+                query = "UPDATE usuarios SET senha = %s WHERE id = %s AND senha = %s"
+                cursor.execute(query, (new_hash, user['id'], user['senha']))
+                connection.commit()
+                cursor.close()
+            user['senha'] = new_hash
+        except Error as e:
+            print(f"Erro ao atualizar o hash da senha: {e}")
+    
+    def get_user(self, user_id):
+        """Busca um usuário pelo id (sem cache: usado para validar sessões)"""
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("SELECT * FROM usuarios WHERE id = %s", (user_id,))
+                user = cursor.fetchone()
+                cursor.close()
+                return user
+        except Error as e:
+            print(f"Erro ao buscar usuário: {e}")
+            return None
     
+    @invalidates('tickets')
     def create_ticket(self, titulo, descricao, cliente_id):
         """Cria um novo ticket"""
         try:
-            cursor = self.connection.cursor()
-            
-            query = "INSERT INTO tickets (titulo, descricao, cliente_id) VALUES (%s, %s, %s)"
-            cursor.execute(query, (titulo, descricao, cliente_id))
-            
-            self.connection.commit()
-            ticket_id = cursor.lastrowid
-            cursor.close()
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                
+                query = "INSERT INTO tickets (titulo, descricao, cliente_id) VALUES (%s, %s, %s)"
+                cursor.execute(query, (titulo, descricao, cliente_id))
+                ticket_id = cursor.lastrowid
+                cursor.execute(EVENT_INSERT, (ticket_id, 'criado'))
+                self._update_counters(cursor, {(cliente_id, 'aberto'): 1})
+                
+                connection.commit()
+                cursor.close()
             return ticket_id
         except Error as e:
             print(f"Erro ao criar ticket: {e}")
             return None
     
-    def get_tickets(self, user_id=None, status=None):
-        """Busca tickets com filtros opcionais"""
+    def _user_lookup(self, connection):
+        """Mapa e-mail (em minúsculas) -> id de todos os usuários"""
+        cursor = connection.cursor()
+        cursor.execute("SELECT id, email FROM usuarios")
+        clients = {email.lower(): user_id for user_id, email in cursor.fetchall()}
+        cursor.close()
+        return clients
+    
+    @invalidates('tickets')
+    def bulk_create_tickets(self, tickets, batch_size=1000, progress=None):
+        """Cria tickets em lote a partir de um iterável de dicionários
+        
+        Cada ticket tem titulo, descricao e o cliente em cliente_id ou
+        cliente_email (resolvido por um mapa de e-mails montado uma única vez);
+        status e data_criacao são opcionais. O iterável é consumido sob demanda
+        e as linhas são inseridas com executemany, um commit por lote. Se um
+        lote falhar, ele é refeito linha a linha para separar as linhas
+        problemáticas. progress(result) é chamado após cada lote.
+        
+        Retorna {'inserted': n, 'rejected': [(registro, motivo)], 'seconds': s,
+        'rate': tickets/s}, onde registro é a posição (a partir de 1) no iterável.
+        """
+        result = {'inserted': 0, 'rejected': [], 'seconds': 0.0, 'rate': 0.0}
+        started = time.perf_counter()
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            
-            if user_id and status:
-                query = """
-                    SELECT t.*, u.nome as cliente_nome 
-                    FROM tickets t 
-                    JOIN usuarios u ON t.cliente_id = u.id 
-                    WHERE t.cliente_id = %s AND t.status = %s
-                    ORDER BY t.data_criacao DESC
-                """
-                cursor.execute(query, (user_id, status))
-            elif user_id:
-                query = """
-                    SELECT t.*, u.nome as cliente_nome 
-                    FROM tickets t 
-                    JOIN usuarios u ON t.cliente_id = u.id 
-                    WHERE t.cliente_id = %s
-                    ORDER BY t.data_criacao DESC
-                """
-                cursor.execute(query, (user_id,))
-            elif status:
-                query = """
-                    SELECT t.*, u.nome as cliente_nome 
-                    FROM tickets t 
-                    JOIN usuarios u ON t.cliente_id = u.id 
-                    WHERE t.status = %s
-                    ORDER BY t.data_criacao DESC
-                """
-                cursor.execute(query, (status,))
-            else:
-                query = """
-                    SELECT t.*, u.nome as cliente_nome 
-                    FROM tickets t 
-                    JOIN usuarios u ON t.cliente_id = u.id 
-                    ORDER BY t.data_criacao DESC
-                """
-                cursor.execute(query)
-            
-            tickets = cursor.fetchall()
-            cursor.close()
-            return tickets
+            with self.get_connection() as connection:
+                clients = self._user_lookup(connection)
+                batch = []
+                
+                def flush():
+                    cursor = connection.cursor()
+                    try:
+                        inserted, rejected = self._insert_batch(connection, cursor, BULK_TICKET_INSERT, batch,
+                                                               journal='tickets')
+                        failed = {number for number, _ in rejected}
+                        self._update_counters(cursor, Counter(
+                            (values[2], values[3]) for number, values in batch if number not in failed))
+                        connection.commit()
+                    finally:
+                        cursor.close()
+                    result['inserted'] += inserted
+                    result['rejected'].extend(rejected)
+                    batch.clear()
+                    _update_rate(result, started)
+                    if progress:
+                        progress(result)
+                
+                for number, ticket in enumerate(tickets, 1):
+                    try:
+                        batch.append((number, _ticket_values(ticket, clients)))
+                    except ValueError as e:
+                        result['rejected'].append((number, str(e)))
+                        continue
+                    if len(batch) >= batch_size:
+                        flush()
+                if batch:
+                    flush()
+        except Error as e:
+            print(f"Erro na importação de tickets: {e}")
+        
+        _update_rate(result, started)
+        return result
+    
+    def _insert_batch(self, connection, cursor, query, batch, journal=None):
+        """Insere um lote [(registro, valores)] na transação atual, sem commit
+        
+        O lote vai em um único executemany dentro de um savepoint. Se falhar
+        por causa dos dados, o savepoint é desfeito e as linhas são inseridas
+        uma a uma para separar as problemáticas. Falhas de conexão são
+        propagadas. Com journal ('tickets' ou 'comentarios', a tabela do
+        lote), as linhas inseridas são registradas em ticket_events na mesma
+        transação. Retorna (inseridas, [(registro, motivo)]).
+        """
+        if not connection.in_transaction:
+            # Sem transação aberta, liberar o savepoint faria commit no SQLite
+            cursor.execute("BEGIN")
+        if journal:
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {journal}")
+            last_id = cursor.fetchone()[0]
+        cursor.execute("SAVEPOINT lote")
+        try:
+            cursor.executemany(query, [values for _, values in batch])
+            if journal:
+                cursor.execute(BULK_EVENTS[journal], (last_id,))
+            cursor.execute("RELEASE SAVEPOINT lote")
+            return len(batch), []
+        except OperationalError:
+            raise
+        except Error:
+            cursor.execute("ROLLBACK TO SAVEPOINT lote")
+        
+        inserted, rejected = 0, []
+        for number, values in batch:
+            try:
+                cursor.execute(query, values)
+                inserted += 1
+            except OperationalError:
+                raise
+            except Error as e:
+                rejected.append((number, str(e)))
+        if journal and inserted:
+            cursor.execute(BULK_EVENTS[journal], (last_id,))
+        cursor.execute("RELEASE SAVEPOINT lote")
+        return inserted, rejected
+    
+    @cached('tickets')
+    def get_tickets(self, user_id=None, status=None, **filters):
+        """Busca tickets com filtros opcionais (ver TicketQuery.from_filters)"""
+        try:
+            return self.find_tickets(TicketQuery.from_filters(user_id=user_id, status=status, **filters))
         except Error as e:
             print(f"Erro ao buscar tickets: {e}")
+            self.cache.mark_failed()
             return []
     
+    @cached('tickets')
+    def get_tickets_page(self, user_id=None, status=None, limit=100, cursor=None, **filters):
+        """Busca uma página de tickets usando cursor keyset em (data_criacao, id)
+        
+        Retorna (tickets, next_cursor). Passe next_cursor na chamada seguinte
+        para continuar; ele é None quando não há mais páginas.
+        """
+        query = TicketQuery.from_filters(user_id=user_id, status=status, **filters)
+        query.after(cursor).limit(limit + 1)
+        try:
+            tickets = self.find_tickets(query)
+        except Error as e:
+            print(f"Erro ao buscar página de tickets: {e}")
+            self.cache.mark_failed()
+            return [], None
+        
+        next_cursor = None
+        if len(tickets) > limit:
+            tickets = tickets[:limit]
+            last = tickets[-1]
+            next_cursor = (last['data_criacao'], last['id'])
+        return tickets, next_cursor
+    
+    @cached('tickets')
+    def get_ticket_stats(self, user_id=None, by_client=False):
+        """Contadores de tickets por status, lidos de ticket_counters
+        
+        Retorna {'aberto': n, 'pausado': n, 'fechado': n} do cliente (ou de
+        todos os tickets) com uma leitura pela chave primária, sem varrer
+        tickets. Com by_client=True retorna um dicionário desses contadores
+        por cliente_id.
+        """
+        query = "SELECT cliente_id, aberto, pausado, fechado FROM ticket_counters"
+        if by_client:
+            query += " WHERE cliente_id <> 0"
+            params = ()
+        else:
+            query += " WHERE cliente_id = %s"
+            params = (user_id or 0,)
+        try:
+            with self.get_connection() as connection:
+                rows = self._fetch_all(connection, query, params)
+        except Error as e:
+            print(f"Erro ao buscar estatísticas: {e}")
+            self.cache.mark_failed()
+            rows = []
+        
+        stats = {row['cliente_id']: {status: row[status] for status in TICKET_STATUSES} for row in rows}
+        if by_client:
+            return stats
+        return stats.get(user_id or 0, dict.fromkeys(TICKET_STATUSES, 0))
+    
+    def _update_counters(self, cursor, deltas):
+        """Soma deltas {(cliente_id, status): n} a ticket_counters na transação atual
+        
+        Atualiza a linha de cada cliente e a do total geral (cliente_id 0),
+        sempre em ordem de cliente_id para que gravações concorrentes travem
+        as linhas na mesma ordem.
+        """
+        rows = {}
+        for (cliente_id, status), delta in deltas.items():
+            for key in (0, cliente_id):
+                rows.setdefault(key, dict.fromkeys(TICKET_STATUSES, 0))[status] += delta
+        rows = [(key, *(counts[status] for status in TICKET_STATUSES))
+                for key, counts in sorted(rows.items()) if any(counts.values())]
+        if rows:
+            cursor.executemany(COUNTER_UPSERT[self.dialect], rows)
+    
+    def _count_tickets(self, connection):
+        """Contagem real por cliente e status: {cliente_id: {status: n}}, com 0 = total"""
+        query = "SELECT cliente_id, status, COUNT(*) AS total FROM tickets GROUP BY cliente_id, status"
+        counts = {0: dict.fromkeys(TICKET_STATUSES, 0)}
+        for row in self._fetch_all(connection, query):
+            for key in (0, row['cliente_id']):
+                counts.setdefault(key, dict.fromkeys(TICKET_STATUSES, 0))[row['status']] += row['total']
+        return counts
+    
+    def verify_ticket_counters(self):
+        """Compara ticket_counters com a contagem real dos tickets
+        
+        Retorna a lista de divergências (cliente_id, status, esperado,
+        registrado), vazia se os contadores estão corretos, ou None em caso de
+        erro. As duas leituras são feitas no mesmo snapshot, então gravações
+        simultâneas não aparecem como divergência.
+        """
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                if self.dialect == 'mysql':
+                    cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+                else:
+                    cursor.execute("BEGIN")
+                cursor.close()
+                try:
+                    expected = self._count_tickets(connection)
+                    rows = self._fetch_all(connection, "SELECT * FROM ticket_counters")
+                finally:
+                    connection.rollback()
+        except Error as e:
+            print(f"Erro ao verificar os contadores: {e}")
+            return None
+        
+        recorded = {row['cliente_id']: row for row in rows}
+        differences = []
+        for cliente_id in sorted(set(expected) | set(recorded)):
+            counts = expected.get(cliente_id, {})
+            row = recorded.get(cliente_id, {})
+            for status in TICKET_STATUSES:
+                if counts.get(status, 0) != row.get(status, 0):
+                    differences.append((cliente_id, status, counts.get(status, 0), row.get(status, 0)))
+        return differences
+    
+    @invalidates('tickets')
+    def rebuild_ticket_counters(self):
+        """Recalcula ticket_counters a partir da tabela de tickets"""
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                for sql in migrations.REBUILD_COUNTERS:
+                    cursor.execute(sql)
+                connection.commit()
+                cursor.close()
+            return True
+        except Error as e:
+            print(f"Erro ao recalcular os contadores: {e}")
+            return False
+    
+    @cached('tickets')
+    def get_recent_tickets(self, limit=5, user_id=None):
+        """Busca os tickets mais recentes, limitando no próprio SQL"""
+        try:
+            return self.find_tickets(TicketQuery().client(user_id).limit(limit))
+        except Error as e:
+            print(f"Erro ao buscar tickets recentes: {e}")
+            self.cache.mark_failed()
+            return []
+    
+    @cached('tickets', 'search')
+    def search_tickets(self, query, filters=None, limit=20, comments=True):
+        """Busca tickets pelo texto do título, da descrição e dos comentários
+        
+        Usa os índices FULLTEXT (MySQL) ou FTS5 (SQLite), ver search.py.
+        filters aceita os filtros de get_tickets (user_id, status, statuses,
+        date_from, date_to). Com comments=False apenas o título e a descrição
+        são considerados, como no filtro local da lista (TicketIndex). Retorna
+        até limit tickets, do mais para o menos relevante, cada um com
+        'score', 'title_snippet' e 'snippet' (trechos em HTML com os termos
+        destacados em <b>).
+        """
+        terms = search.parse_terms(query, self.dialect)
+        if not terms:
+            return []
+        expression = search.match_expression(terms, self.dialect)
+        ticket_query = TicketQuery.from_filters(**(filters or {}))
+        sql, params = search.search_query(self.dialect, expression, ticket_query.conditions,
+                                          ticket_query.params, limit, comments=comments)
+        try:
+            with self.get_connection() as connection:
+                tickets = self._fetch_all(connection, sql, params)
+                # Sem o termo na descrição, o trecho vem do comentário mais recente que casou
+                pending = {}
+                for ticket in tickets:
+                    comment_id = ticket.pop('comentario_id')
+                    ticket['title_snippet'] = (search.snippet(ticket['titulo'], terms, width=255)
+                                               or html.escape(ticket['titulo']))
+                    ticket['snippet'] = search.snippet(ticket['descricao'], terms)
+                    if ticket['snippet'] is None and comment_id is not None:
+                        pending[comment_id] = ticket
+                if pending:
+                    placeholders = ", ".join(["%s"] * len(pending))
+                    sql = f"SELECT id, texto FROM comentarios WHERE id IN ({placeholders})"
+                    for comment in self._fetch_all(connection, sql, tuple(pending)):
+                        pending[comment['id']]['snippet'] = search.snippet(comment['texto'], terms)
+            return tickets
+        except Error as e:
+            print(f"Erro na busca de tickets: {e}")
+            self.cache.mark_failed()
+            return []
+    
+    @invalidates('tickets')
     def update_ticket_status(self, ticket_id, status):
         """Atualiza o status de um ticket"""
         try:
-            cursor = self.connection.cursor()
-            
-            query = "UPDATE tickets SET status = %s WHERE id = %s"
-            cursor.execute(query, (status, ticket_id))
-            
-            self.connection.commit()
-            cursor.close()
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                if self.dialect == 'sqlite' and not connection.in_transaction:
+                    # Trava a escrita já na leitura, como o FOR UPDATE do MySQL
+                    cursor.execute("BEGIN IMMEDIATE")
+                
+                query = "SELECT cliente_id, status FROM tickets WHERE id = %s"
+                if self.dialect == 'mysql':
+                    query += " FOR UPDATE"  # o status lido é o que será descontado
+                cursor.execute(query, (ticket_id,))
+                current = cursor.fetchone()
+                
+                query = "UPDATE tickets SET status = %s WHERE id = %s"
+                cursor.execute(query, (status, ticket_id))
+                if cursor.rowcount:
+                    cursor.execute(EVENT_INSERT, (ticket_id, 'status'))
+                if current and current[1] != status:
+                    cliente_id, previous = current
+                    self._update_counters(cursor, {(cliente_id, previous): -1, (cliente_id, status): 1})
+                
+                connection.commit()
+                cursor.close()
             return True
         except Error as e:
             print(f"Erro ao atualizar ticket: {e}")
             return False
     
+    @invalidates('tickets')
+    def bulk_update_status(self, ticket_ids, status, chunk_size=500):
+        """Muda o status de vários tickets em uma única transação
+        
+        Os ids são processados em blocos de chunk_size, cada um com um SELECT
+        e um UPDATE ... WHERE id IN (...); só os tickets que de fato mudam de
+        status são gravados, registrados em ticket_events e descontados dos
+        contadores. Se algum bloco falhar, nada é gravado.
+        
+        Retorna {'updated': n, 'unchanged': n, 'missing': n}, ou None em caso
+        de erro.
+        """
+        if status not in TICKET_STATUSES:
+            raise ValueError(f"status inválido: {status}")
+        # Em ordem, para transações concorrentes travarem as linhas na mesma ordem
+        ticket_ids = sorted({int(ticket_id) for ticket_id in ticket_ids})
+        result = {'updated': 0, 'unchanged': 0, 'missing': 0}
+        if not ticket_ids:
+            return result
+        
+        deltas = Counter()
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                if self.dialect == 'sqlite' and not connection.in_transaction:
+                    # Trava a escrita já na leitura, como o FOR UPDATE do MySQL
+                    cursor.execute("BEGIN IMMEDIATE")
+                
+                for start in range(0, len(ticket_ids), chunk_size):
+                    chunk = ticket_ids[start:start + chunk_size]
+                    placeholders = ', '.join(['%s'] * len(chunk))
+                    query = f"SELECT id, cliente_id, status FROM tickets WHERE id IN ({placeholders})"
+                    if self.dialect == 'mysql':
+                        query += " FOR UPDATE"  # o status lido é o que será descontado
+                    cursor.execute(query, tuple(chunk))
+                    rows = cursor.fetchall()
+                    
+                    changed = [(ticket_id, cliente_id, previous)
+                               for ticket_id, cliente_id, previous in rows if previous != status]
+                    result['missing'] += len(chunk) - len(rows)
+                    result['unchanged'] += len(rows) - len(changed)
+                    if not changed:
+                        continue
+                    
+                    changed_ids = [ticket_id for ticket_id, _, _ in changed]
+                    placeholders = ', '.join(['%s'] * len(changed_ids))
+                    cursor.execute(f"UPDATE tickets SET status = %s WHERE id IN ({placeholders})",
+                                   (status, *changed_ids))
+                    cursor.executemany(EVENT_INSERT, [(ticket_id, 'status') for ticket_id in changed_ids])
+                    for _, cliente_id, previous in changed:
+                        deltas[(cliente_id, previous)] -= 1
+                        deltas[(cliente_id, status)] += 1
+                    result['updated'] += len(changed)
+                
+                self._update_counters(cursor, deltas)
+                connection.commit()
+                cursor.close()
+            return result
+        except Error as e:
+            print(f"Erro ao atualizar tickets em lote: {e}")
+            return None
+    
+    @invalidates('comments:{ticket_id}', 'search')
     def add_comment(self, ticket_id, usuario_id, texto):
         """Adiciona um comentário a um ticket"""
         try:
-            cursor = self.connection.cursor()
-            
-            query = "INSERT INTO comentarios (ticket_id, usuario_id, texto) VALUES (%s, %s, %s)"
-            cursor.execute(query, (ticket_id, usuario_id, texto))
-            
-            self.connection.commit()
-            cursor.close()
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                
+                query = "INSERT INTO comentarios (ticket_id, usuario_id, texto) VALUES (%s, %s, %s)"
+                cursor.execute(query, (ticket_id, usuario_id, texto))
+                cursor.execute(EVENT_INSERT, (ticket_id, 'comentario'))
+                
+                connection.commit()
+                cursor.close()
             return True
         except Error as e:
             print(f"Erro ao adicionar comentário: {e}")
             return False
     
+    def add_comments(self, comments, batch_size=1000):
+        """Adiciona comentários em lote (ver import_comments)
+        
+        Retorna {'inserted': n, 'rejected': [(registro, motivo)], 'seconds': s,
+        'rate': comentários/s}. Se o banco falhar, os lotes já gravados ficam
+        em 'inserted' e o erro é informado no console.
+        """
+        result = {'inserted': 0, 'rejected': [], 'seconds': 0.0, 'rate': 0.0}
+        started = time.perf_counter()
+        try:
+            for batch in self.import_comments(comments, batch_size=batch_size):
+                result['inserted'] += batch['inserted']
+                result['rejected'].extend(batch['rejected'])
+        except Error as e:
+            print(f"Erro na importação de comentários: {e}")
+        _update_rate(result, started)
+        return result
+    
+    def import_comments(self, comments, batch_size=1000, commit_every=1):
+        """Importa comentários de um iterável sob demanda, com memória constante
+        
+        Gerador: consome `comments` em lotes de batch_size (dicionários ou
+        tuplas, ver _comment_values), insere cada lote com executemany e faz
+        commit a cada commit_every lotes e no último. Para cada lote gera
+        {'batch': n, 'inserted': k, 'rejected': [(registro, motivo)],
+        'seconds': s, 'committed': bool, 'total': inseridos até aqui}; o
+        último lote sempre vem com 'committed' True. Erros do banco são
+        propagados a quem consome o gerador. Se o gerador for interrompido
+        (ou falhar), os lotes ainda sem commit são descartados.
+        """
+        total = 0
+        with self.get_connection() as connection:
+            users = self._user_lookup(connection)
+            cursor = connection.cursor()
+            try:
+                # Lê um registro à frente para saber se o lote é o último
+                records = enumerate(comments, 1)
+                following = next(records, None)
+                batch_number = 0
+                while following is not None:
+                    started = time.perf_counter()
+                    batch, rejected = [], []
+                    while following is not None and len(batch) < batch_size:
+                        number, comment = following
+                        following = next(records, None)
+                        try:
+                            batch.append((number, _comment_values(comment, users)))
+                        except ValueError as e:
+                            rejected.append((number, str(e)))
+                    
+                    batch_number += 1
+                    inserted = 0
+                    if batch:
+                        inserted, failed = self._insert_batch(connection, cursor, BULK_COMMENT_INSERT, batch,
+                                                              journal='comentarios')
+                        rejected.extend(failed)
+                    total += inserted
+                    committed = following is None or batch_number % commit_every == 0
+                    if committed:
+                        connection.commit()
+                        self.cache.invalidate('comments', 'search')
+                    yield {
+                        'batch': batch_number,
+                        'inserted': inserted,
+                        'rejected': rejected,
+                        'seconds': time.perf_counter() - started,
+                        'committed': committed,
+                        'total': total,
+                    }
+            finally:
+                cursor.close()
+    
+    def get_ticket_changes(self, since=None, user_id=None, seen=(), limit=500):
+        """Eventos de ticket_events com id > since e os tickets afetados
+        
+        Retorna {'last_event': maior id lido, 'events': [{'id', 'ticket_id',
+        'tipo'}], 'tickets': [tickets criados ou alterados], 'more': bool}.
+        Eventos com id em seen são ignorados: quem lê pode repetir uma janela
+        de ids já vistos para pegar eventos de transações que fizeram commit
+        fora de ordem. Com since=None só informa o último evento existente.
+        Com user_id, retorna apenas os tickets desse cliente. Os caches de
+        leitura afetados pelos eventos são invalidados, inclusive quando as
+        alterações vieram de outra instância do aplicativo.
+        """
+        result = {'last_event': since, 'events': [], 'tickets': [], 'more': False}
+        try:
+            with self.get_connection() as connection:
+                if since is None:
+                    rows = self._fetch_all(connection, "SELECT MAX(id) AS id FROM ticket_events")
+                    result['last_event'] = rows[0]['id'] or 0
+                    return result
+                
+                query = """
+                    SELECT id, ticket_id, tipo FROM ticket_events
+                    WHERE id > %s ORDER BY id LIMIT %s
+                """
+                events = self._fetch_all(connection, query, (since, limit))
+                if events:
+                    result['last_event'] = events[-1]['id']
+                    result['more'] = len(events) == limit
+                events = [event for event in events if event['id'] not in seen]
+                result['events'] = events
+                
+                changed = {event['ticket_id'] for event in events if event['tipo'] != 'comentario'}
+                commented = {event['ticket_id'] for event in events if event['tipo'] == 'comentario'}
+                if changed:
+                    self.cache.invalidate('tickets', 'search')
+                    sql, params = TicketQuery().client(user_id).ids(sorted(changed)).build()
+                    result['tickets'] = self._fetch_all(connection, sql, params)
+                if commented:
+                    self.cache.invalidate('search', *(f'comments:{ticket_id}' for ticket_id in commented))
+            return result
+        except Error as e:
+            print(f"Erro ao buscar alterações de tickets: {e}")
+            return result
+    
+    def prune_ticket_events(self, older_than):
+        """Remove do diário os eventos anteriores à data informada; retorna quantos"""
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("DELETE FROM ticket_events WHERE data_evento < %s", (older_than,))
+                removed = cursor.rowcount
+                connection.commit()
+                cursor.close()
+            return removed
+        except Error as e:
+            print(f"Erro ao limpar o diário de eventos: {e}")
+            return 0
+    
+    @cached('comments', 'comments:{ticket_id}')
     def get_comments(self, ticket_id):
         """Busca comentários de um ticket"""
+        query = """
+            SELECT c.*, u.nome as usuario_nome
+            FROM comentarios c
+            JOIN usuarios u ON c.usuario_id = u.id
+            WHERE c.ticket_id = %s
+            ORDER BY c.data_comentario ASC, c.id ASC
+        """
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            
-            query = """
-                SELECT c.*, u.nome as usuario_nome 
-                FROM comentarios c 
-                JOIN usuarios u ON c.usuario_id = u.id 
-                WHERE c.ticket_id = %s 
-                ORDER BY c.data_comentario ASC
-            """
-            cursor.execute(query, (ticket_id,))
-            
-            comments = cursor.fetchall()
-            cursor.close()
-            return comments
+            with self.get_connection() as connection:
+                return self._fetch_all(connection, query, (ticket_id,))
         except Error as e:
             print(f"Erro ao buscar comentários: {e}")
+            self.cache.mark_failed()
             return []
     
+    @cached('comments', 'comments:{ticket_id}')
+    def get_comments_page(self, ticket_id, limit=50, cursor=None):
+        """Busca uma página de comentários de um ticket, em ordem cronológica
+        
+        Usa cursor keyset em (data_comentario, id), percorrendo o índice
+        (ticket_id, data_comentario) sem OFFSET. Retorna (comentarios,
+        next_cursor); next_cursor é None quando não há mais páginas.
+        """
+        query = """
+            SELECT c.*, u.nome as usuario_nome
+            FROM comentarios c
+            JOIN usuarios u ON c.usuario_id = u.id
+            WHERE c.ticket_id = %s
+        """
+        params = [ticket_id]
+        if cursor:
+            # O >= delimita a faixa do índice; o OR desempata pelo id
+            data_comentario, comentario_id = cursor
+            query += """
+              AND c.data_comentario >= %s
+              AND (c.data_comentario > %s OR c.id > %s)
+            """
+            params.extend((data_comentario, data_comentario, comentario_id))
+        query += " ORDER BY c.data_comentario ASC, c.id ASC LIMIT %s"
+        params.append(int(limit) + 1)
+        try:
+            with self.get_connection() as connection:
+                comments = self._fetch_all(connection, query, tuple(params))
+        except Error as e:
+            print(f"Erro ao buscar página de comentários: {e}")
+            self.cache.mark_failed()
+            return [], None
+        
+        next_cursor = None
+        if len(comments) > limit:
+            comments = comments[:limit]
+            last = comments[-1]
+            next_cursor = (last['data_comentario'], last['id'])
+        return comments, next_cursor
+    
+    def get_comments_first_pages(self, ticket_ids, limit=50):
+        """Primeira página de comentários de vários tickets em uma única consulta
+        
+        Retorna {ticket_id: (comentarios, next_cursor)}, no mesmo formato de
+        get_comments_page(ticket_id, limit). A numeração por ticket
+        (ROW_NUMBER) roda só sobre o índice (ticket_id, data_comentario, id);
+        as linhas completas são lidas apenas para os comentários da página,
+        então tickets com milhares de comentários não pesam na consulta.
+        
+        Funções de janela exigem MySQL 8.0+ ou MariaDB 10.2+ (SQLite 3.25+).
+        """
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        if not ticket_ids:
+            return {}
+        placeholders = ', '.join(['%s'] * len(ticket_ids))
+        query = f"""
+            SELECT c.*, u.nome as usuario_nome
+            FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY ticket_id ORDER BY data_comentario, id
+                ) AS posicao
+                FROM comentarios
+                WHERE ticket_id IN ({placeholders})
+            ) p
+            JOIN comentarios c ON c.id = p.id
+            JOIN usuarios u ON c.usuario_id = u.id
+            WHERE p.posicao <= %s
+            ORDER BY c.ticket_id, c.data_comentario ASC, c.id ASC
+        """
+        try:
+            with self.get_connection() as connection:
+                rows = self._fetch_all(connection, query, (*ticket_ids, int(limit) + 1))
+        except Error as e:
+            print(f"Erro ao buscar comentários dos tickets: {e}")
+            return {}
+        
+        by_ticket = {ticket_id: [] for ticket_id in ticket_ids}
+        for comment in rows:
+            by_ticket[comment['ticket_id']].append(comment)
+        pages = {}
+        for ticket_id, comments in by_ticket.items():
+            next_cursor = None
+            if len(comments) > limit:
+                comments = comments[:limit]
+                next_cursor = (comments[-1]['data_comentario'], comments[-1]['id'])
+            pages[ticket_id] = (comments, next_cursor)
+        return pages
+    
     def close(self):
-        """Fecha a conexão com o banco"""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+        """Fecha as conexões do pool"""
+        stats = self.cache.stats()
+        if stats['hits'] or stats['misses']:
+            print(f"Cache de consultas: {stats['hits']} acertos, {stats['misses']} faltas "
+                  f"({stats['hit_rate']:.0%}), {stats['invalidations']} invalidações")
+        if self.pool:
+            self.pool.close()
             print("Conexão com o banco fechada")
@@ -1,31 +1,80 @@
+-- Esquema de referência do Sistema de Gestão de Tickets (MySQL)
+--
+-- Equivale ao resultado das migrações de migrations.py. O aplicativo cria e
+-- atualiza o esquema sozinho na inicialização (ou via `python manage_db.py migrate`);
+-- use este arquivo apenas para criar o banco manualmente. Ao adicionar uma
+-- migração, atualize também este arquivo e a tabela schema_version abaixo.
+--
+-- Requer MySQL 8.0+ ou MariaDB 10.2+ (consultas com funções de janela).
+
+-- Controle de versão do esquema
+CREATE TABLE schema_version (
+    version INT PRIMARY KEY,
+    descricao VARCHAR(255) NOT NULL,
+    aplicada_em DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Tabela de Usuários
 CREATE TABLE usuarios (
-    id SERIAL PRIMARY KEY,
+    id INT AUTO_INCREMENT PRIMARY KEY,
     nome VARCHAR(100) NOT NULL,
-    email VARCHAR(100) UNIQUE NOT NULL,
+    email VARCHAR(100) NOT NULL UNIQUE,
     senha VARCHAR(255) NOT NULL, -- senha hash
     tipo ENUM('admin', 'cliente') NOT NULL
 );
 
 -- Tabela de Tickets
 CREATE TABLE tickets (
-    id SERIAL PRIMARY KEY,
+    id INT AUTO_INCREMENT PRIMARY KEY,
     titulo VARCHAR(255) NOT NULL,
     descricao TEXT,
     cliente_id INT NOT NULL, -- FK para usuarios(id)
     status ENUM('aberto', 'pausado', 'fechado') DEFAULT 'aberto',
-    data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    tempo_resposta INTERVAL, -- tempo total respondido (ex: 00:10:23)
-    FOREIGN KEY (cliente_id) REFERENCES usuarios(id)
+    data_criacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+    tempo_resposta TIME DEFAULT '00:00:00', -- tempo total respondido (ex: 00:10:23)
+    FOREIGN KEY (cliente_id) REFERENCES usuarios(id),
+    INDEX idx_tickets_data (data_criacao),
+    INDEX idx_tickets_status_data (status, data_criacao),
+    INDEX idx_tickets_cliente_data (cliente_id, data_criacao),
+    INDEX idx_tickets_cliente_status_data (cliente_id, status, data_criacao),
+    FULLTEXT INDEX ft_tickets_texto (titulo, descricao)
 );
 
 -- Tabela de Comentários
 CREATE TABLE comentarios (
-    id SERIAL PRIMARY KEY,
+    id INT AUTO_INCREMENT PRIMARY KEY,
     ticket_id INT NOT NULL,
     usuario_id INT NOT NULL,
     texto TEXT NOT NULL,
-    data_comentario TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    data_comentario DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (ticket_id) REFERENCES tickets(id),
-    FOREIGN KEY (usuario_id) REFERENCES usuarios(id)
+    FOREIGN KEY (usuario_id) REFERENCES usuarios(id),
+    INDEX idx_comentarios_ticket_data (ticket_id, data_comentario),
+    FULLTEXT INDEX ft_comentarios_texto (texto)
 );
+
+-- Diário de eventos de tickets, lido pelas telas para se atualizarem sozinhas
+CREATE TABLE ticket_events (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    ticket_id INT NOT NULL,
+    tipo ENUM('criado', 'status', 'comentario') NOT NULL,
+    data_evento DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_ticket_events_data (data_evento)
+);
+
+-- Contadores de tickets por status, mantidos pelas gravações do aplicativo.
+-- cliente_id 0 guarda o total geral. Confira/refaça com
+-- `python manage_db.py verify-counters` / `rebuild-counters`.
+CREATE TABLE ticket_counters (
+    cliente_id INT PRIMARY KEY,
+    aberto INT NOT NULL DEFAULT 0,
+    pausado INT NOT NULL DEFAULT 0,
+    fechado INT NOT NULL DEFAULT 0
+);
+
+INSERT INTO schema_version (version, descricao) VALUES
+    (1, 'Tabelas iniciais de usuários, tickets e comentários'),
+    (2, 'Índices compostos para listagem de tickets e comentários'),
+    (3, 'Índices de busca textual em tickets e comentários'),
+    (4, 'Diário de eventos de tickets (ticket_events)'),
+    (5, 'Contadores de tickets por status (ticket_counters)');
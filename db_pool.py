@@ -0,0 +1,151 @@
+import threading
+import time
+from collections import deque
+
+from mysql.connector.errors import PoolError
+
+
+class ConnectionPool:
+    """Pool de conexões thread-safe com tamanho mínimo/máximo e validação no empréstimo"""
+    
+    def __init__(self, factory, min_size=1, max_size=5, timeout=10.0,
+                 validate=None, ping_interval=0.0):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Tamanhos de pool inválidos: min_size=%s, max_size=%s"
+                             % (min_size, max_size))
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.validate = validate
+        self.ping_interval = ping_interval
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Condition()
+    
+    @property
+    def size(self):
+        """Número de conexões abertas (ociosas + emprestadas)"""
+        return self._size
+    
+    @property
+    def idle(self):
+        """Número de conexões ociosas"""
+        return len(self._idle)
+    
+    def fill(self):
+        """Abre conexões até atingir o tamanho mínimo"""
+        while True:
+            with self._lock:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                connection = self.factory()
+            except Exception:
+                self._discard()
+                raise
+            with self._lock:
+                self._idle.append((connection, time.monotonic()))
+                self._lock.notify()
+    
+    def acquire(self, timeout=None):
+        """Empresta uma conexão, aguardando até `timeout` segundos por uma livre"""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise PoolError("O pool de conexões foi fechado")
+                    if self._idle:
+                        connection, last_used = self._idle.pop()
+                        create = False
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        connection, last_used = None, None
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolError("Tempo esgotado aguardando uma conexão livre "
+                                        "(max_size=%d)" % self.max_size)
+                    self._lock.wait(remaining)
+            
+            if create:
+                try:
+                    return self.factory()
+                except Exception:
+                    self._discard()
+                    raise
+            
+            if self._check(connection, last_used):
+                return connection
+            self._close_quietly(connection)
+            self._discard()
+    
+    def release(self, connection):
+        """Devolve uma conexão ao pool"""
+        try:
+            if getattr(connection, 'in_transaction', False):
+                connection.rollback()
+        except Exception:
+            self._close_quietly(connection)
+            self._discard()
+            return
+        
+        with self._lock:
+            if self._closed:
+                self._size -= 1
+                close = True
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._lock.notify()
+                close = False
+        if close:
+            self._close_quietly(connection)
+    
+    def discard(self, connection):
+        """Fecha uma conexão emprestada que não pode voltar ao pool
+        
+        Usado quando a conexão ficou em um estado inválido, por exemplo com um
+        resultado não lido de um cursor sem buffer.
+        """
+        self._close_quietly(connection)
+        self._discard()
+    
+    def close(self):
+        """Fecha todas as conexões ociosas e impede novos empréstimos"""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._lock.notify_all()
+        for connection, _ in idle:
+            self._close_quietly(connection)
+    
+    def _check(self, connection, last_used):
+        """Valida a conexão antes de entregá-la, se estiver ociosa há tempo suficiente"""
+        if self.validate is None:
+            return True
+        if time.monotonic() - last_used < self.ping_interval:
+            return True
+        try:
+            return self.validate(connection)
+        except Exception:
+            return False
+    
+    def _discard(self):
+        with self._lock:
+            self._size -= 1
+            self._lock.notify()
+    
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
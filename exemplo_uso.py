@@ -64,12 +64,14 @@ def exemplo_criar_tickets():
         ("Relatório de Erro", "O sistema está apresentando erro 500 ao tentar gerar relatórios.")
     ]
     
-    for titulo, descricao in tickets_exemplo:
-        ticket_id = db.create_ticket(titulo, descricao, user['id'])
-        if ticket_id:
-            print(f"✅ Ticket '{titulo}' criado com ID: {ticket_id}")
-        else:
-            print(f"❌ Erro ao criar ticket '{titulo}'")
+    # Para vários tickets, a criação em lote usa um único INSERT por lote
+    result = db.bulk_create_tickets(
+        {'titulo': titulo, 'descricao': descricao, 'cliente_id': user['id']}
+        for titulo, descricao in tickets_exemplo
+    )
+    print(f"✅ {result['inserted']} tickets criados em {result['seconds']:.3f}s")
+    for number, motivo in result['rejected']:
+        print(f"❌ Erro ao criar ticket '{tickets_exemplo[number - 1][0]}': {motivo}")
     
     print()
 
@@ -90,9 +92,9 @@ def exemplo_listar_tickets():
     
     # Listar tickets por status
     print("=== Tickets por Status ===")
+    stats = db.get_ticket_stats()
     for status in ['aberto', 'pausado', 'fechado']:
-        tickets_status = db.get_tickets(status=status)
-        print(f"Status '{status}': {len(tickets_status)} tickets")
+        print(f"Status '{status}': {stats[status]} tickets")
     
     print()
 
@@ -190,9 +192,9 @@ def main():
     except Exception as e:
         print(f"❌ Erro durante a execução dos exemplos: {e}")
         print("\nVerifique se:")
-        print("1. O MySQL está rodando")
+        print("1. O MySQL está rodando (ou use 'backend': 'sqlite' em config.py)")
         print("2. O banco 'gestao_tickets' foi criado")
-        print("3. As credenciais estão corretas no arquivo database.py")
+        print("3. As credenciais estão corretas em DB_CONFIG no arquivo config.py")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,276 @@
+"""Exportação de tickets e comentários para CSV, JSONL e formato colunar
+
+Os exportadores recebem os blocos (colunas, linhas) gerados por
+DatabaseManager.stream_tickets/stream_comments e gravam cada bloco assim que
+ele chega, sem acumular a tabela na memória.
+
+O formato colunar (.tcol) é um binário compacto pensado para cargas de BI:
+as linhas são agrupadas em grupos de ROW_GROUP_SIZE e cada coluna do grupo é
+gravada com uma codificação de acordo com o tipo (inteiros e datas como
+int64, textos repetitivos como dicionário) e comprimida com zlib. Use
+read_columnar() para ler o arquivo de volta.
+
+Layout do arquivo (inteiros little-endian):
+    b'TCOL' + versão (1 byte)
+    uint32 tamanho + JSON {"columns": [...]}
+    grupos: uint32 linhas, e para cada coluna: código do tipo (1 byte),
+            uint32 tamanho + dados comprimidos (bitmap de nulos + valores)
+    fim: uint32 0
+"""
+import csv
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime, timedelta
+
+FORMATS = ('csv', 'jsonl', 'columnar')
+EXTENSIONS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.tcol': 'columnar'}
+
+COLUMNAR_MAGIC = b'TCOL'
+COLUMNAR_VERSION = 1
+ROW_GROUP_SIZE = 16384
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+def detect_format(path):
+    """Deduz o formato pela extensão do arquivo"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Formato de arquivo desconhecido: {path} (use {', '.join(EXTENSIONS)})")
+    return EXTENSIONS[extension]
+
+def format_value(value):
+    """Representação textual de um valor, igual à exibida pelo MySQL"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(' ')
+    if isinstance(value, timedelta):
+        seconds = int(value.total_seconds())
+        sign = '-' if seconds < 0 else ''
+        hours, rest = divmod(abs(seconds), 3600)
+        return f"{sign}{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+    return value
+
+
+class CsvExporter:
+    """Grava um CSV com cabeçalho; nulos viram campos vazios"""
+    
+    def __init__(self, file, columns):
+        self.writer = csv.writer(file)
+        self.writer.writerow(columns)
+    
+    def write_rows(self, rows):
+        self.writer.writerows(
+            ['' if value is None else format_value(value) for value in row] for row in rows
+        )
+    
+    def close(self):
+        pass
+
+
+class JsonlExporter:
+    """Grava um objeto JSON por linha"""
+    
+    def __init__(self, file, columns):
+        self.file = file
+        self.columns = columns
+    
+    def write_rows(self, rows):
+        columns = self.columns
+        self.file.writelines(
+            json.dumps(dict(zip(columns, map(format_value, row))), ensure_ascii=False) + '\n'
+            for row in rows
+        )
+    
+    def close(self):
+        pass
+
+
+def _pack_ints(values):
+    data = array('q', values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data.tobytes()
+
+def _unpack_ints(data, typecode='q'):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def _pack_strings(values):
+    encoded = [value.encode('utf-8') for value in values]
+    return _pack_ints([len(value) for value in encoded]) + b''.join(encoded)
+
+def _unpack_strings(data, count):
+    """Retorna (textos, posição logo após o último texto)"""
+    lengths = _unpack_ints(data[:count * 8])
+    offset = count * 8
+    strings = []
+    for length in lengths:
+        strings.append(data[offset:offset + length].decode('utf-8'))
+        offset += length
+    return strings, offset
+
+def _column_type(values):
+    """Código do tipo da coluna, pelo tipo dos valores não nulos do grupo"""
+    types = {type(value) for value in values if value is not None}
+    if not types:
+        return 'n'
+    if types <= {int, bool}:
+        return 'i'
+    if types <= {float, int}:
+        return 'f'
+    if types == {datetime}:
+        return 'd'
+    if types == {timedelta}:
+        return 't'
+    return 's'
+
+def _encode_column(values):
+    """Codifica uma coluna de um grupo; retorna (código do tipo, bytes)"""
+    code = _column_type(values)
+    nulls = bytearray((len(values) + 7) // 8)
+    for position, value in enumerate(values):
+        if value is None:
+            nulls[position // 8] |= 1 << (position % 8)
+    
+    if code == 'n':
+        body = b''
+    elif code == 'i':
+        body = _pack_ints(0 if value is None else int(value) for value in values)
+    elif code == 'f':
+        data = array('d', (0.0 if value is None else float(value) for value in values))
+        if sys.byteorder == 'big':
+            data.byteswap()
+        body = data.tobytes()
+    elif code == 'd':
+        body = _pack_ints(0 if value is None else (value - EPOCH) // MICROSECOND for value in values)
+    elif code == 't':
+        body = _pack_ints(0 if value is None else value // MICROSECOND for value in values)
+    else:
+        texts = ['' if value is None else str(format_value(value)) for value in values]
+        distinct = list(dict.fromkeys(texts))
+        if len(distinct) * 2 <= len(texts):
+            # Poucos valores distintos (status, nome do cliente...): dicionário + índices
+            code = 'D'
+            index = {text: position for position, text in enumerate(distinct)}
+            body = (struct.pack('<I', len(distinct)) + _pack_strings(distinct)
+                    + _pack_ints(index[text] for text in texts))
+        else:
+            body = _pack_strings(texts)
+    return code, bytes(nulls) + body
+
+def _decode_column(code, data, count):
+    nulls_size = (count + 7) // 8
+    nulls, body = data[:nulls_size], data[nulls_size:]
+    
+    if code == 'n':
+        values = [None] * count
+    elif code == 'i':
+        values = list(_unpack_ints(body))
+    elif code == 'f':
+        values = list(_unpack_ints(body, 'd'))
+    elif code == 'd':
+        values = [EPOCH + value * MICROSECOND for value in _unpack_ints(body)]
+    elif code == 't':
+        values = [value * MICROSECOND for value in _unpack_ints(body)]
+    elif code == 'D':
+        (distinct_count,) = struct.unpack('<I', body[:4])
+        body = body[4:]
+        distinct, offset = _unpack_strings(body, distinct_count)
+        values = [distinct[position] for position in _unpack_ints(body[offset:])]
+    else:
+        values, _ = _unpack_strings(body, count)
+    
+    for position in range(count):
+        if nulls[position // 8] & (1 << (position % 8)):
+            values[position] = None
+    return values
+
+
+class ColumnarExporter:
+    """Grava o formato colunar .tcol (ver a descrição do módulo)"""
+    
+    def __init__(self, file, columns, row_group_size=ROW_GROUP_SIZE):
+        self.file = file
+        self.columns = list(columns)
+        self.row_group_size = row_group_size
+        self.pending = []
+        header = json.dumps({'columns': self.columns}).encode('utf-8')
+        file.write(COLUMNAR_MAGIC + bytes([COLUMNAR_VERSION]))
+        file.write(struct.pack('<I', len(header)) + header)
+    
+    def write_rows(self, rows):
+        self.pending.extend(rows)
+        while len(self.pending) >= self.row_group_size:
+            self._write_group(self.pending[:self.row_group_size])
+            del self.pending[:self.row_group_size]
+    
+    def close(self):
+        if self.pending:
+            self._write_group(self.pending)
+            self.pending = []
+        self.file.write(struct.pack('<I', 0))
+    
+    def _write_group(self, rows):
+        self.file.write(struct.pack('<I', len(rows)))
+        for values in zip(*rows):
+            code, data = _encode_column(values)
+            data = zlib.compress(data, 6)
+            self.file.write(code.encode('ascii') + struct.pack('<I', len(data)) + data)
+
+
+def read_columnar(path):
+    """Lê um arquivo .tcol e gera as linhas como dicionários, um grupo por vez"""
+    with open(path, 'rb') as file:
+        if file.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"Arquivo não está no formato colunar: {path}")
+        version = file.read(1)[0]
+        if version != COLUMNAR_VERSION:
+            raise ValueError(f"Versão do formato colunar não suportada: {version}")
+        (header_size,) = struct.unpack('<I', file.read(4))
+        columns = json.loads(file.read(header_size))['columns']
+        
+        while True:
+            (count,) = struct.unpack('<I', file.read(4))
+            if count == 0:
+                return
+            group = []
+            for _ in columns:
+                code = file.read(1).decode('ascii')
+                (size,) = struct.unpack('<I', file.read(4))
+                group.append(_decode_column(code, zlib.decompress(file.read(size)), count))
+            for row in zip(*group):
+                yield dict(zip(columns, row))
+
+
+EXPORTERS = {
+    'csv': (CsvExporter, 'w'),
+    'jsonl': (JsonlExporter, 'w'),
+    'columnar': (ColumnarExporter, 'wb'),
+}
+
+def export(stream, path, file_format=None):
+    """Grava os blocos (colunas, linhas) de stream no arquivo e retorna o total de linhas"""
+    file_format = file_format or detect_format(path)
+    exporter_class, mode = EXPORTERS[file_format]
+    text_options = {'newline': '', 'encoding': 'utf-8'} if mode == 'w' else {}
+    
+    total = 0
+    exporter = None
+    with open(path, mode, **text_options) as file:
+        for columns, rows in stream:
+            if exporter is None:
+                exporter = exporter_class(file, columns)
+            exporter.write_rows(rows)
+            total += len(rows)
+        if exporter is not None:
+            exporter.close()
+    return total
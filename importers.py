@@ -0,0 +1,45 @@
+"""Leitura de arquivos de importação (CSV e JSONL)
+
+Os registros são lidos um por vez, como dicionários, para que arquivos
+grandes possam ser importados sem carregá-los inteiros na memória.
+"""
+import csv
+import json
+import os
+
+FORMATS = ('csv', 'jsonl')
+
+def detect_format(path):
+    """Deduz o formato pela extensão do arquivo"""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension in ('json', 'ndjson'):
+        return 'jsonl'
+    if extension not in FORMATS:
+        raise ValueError(f"Formato de arquivo desconhecido: {path} (use {', '.join(FORMATS)})")
+    return extension
+
+def read_csv(path):
+    """Lê um CSV com cabeçalho; campos vazios viram None"""
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        for row in csv.DictReader(file):
+            yield {key: (value if value != '' else None) for key, value in row.items()}
+
+def read_jsonl(path):
+    """Lê um objeto JSON por linha; linhas inválidas viram None (e são rejeitadas)"""
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
+
+def read_records(path, file_format=None):
+    """Lê os registros de um arquivo CSV ou JSONL"""
+    file_format = file_format or detect_format(path)
+    if file_format == 'csv':
+        return read_csv(path)
+    if file_format == 'jsonl':
+        return read_jsonl(path)
+    raise ValueError(f"Formato de arquivo desconhecido: {file_format}")
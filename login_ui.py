@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'login.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LoginWindow(object):
+    def setupUi(self, LoginWindow):
+        LoginWindow.setObjectName("LoginWindow")
+        LoginWindow.resize(400, 500)
+        LoginWindow.setStyleSheet("background-color: #f0f0f0;")
+        self.centralwidget = QtWidgets.QWidget(LoginWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(40, 40, 40, 40)
+        self.verticalLayout.setSpacing(20)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.title_label = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(18)
+        font.setBold(True)
+        font.setWeight(75)
+        self.title_label.setFont(font)
+        self.title_label.setStyleSheet("color: #2c3e50;")
+        self.title_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.title_label.setObjectName("title_label")
+        self.verticalLayout.addWidget(self.title_label)
+        self.logo_label = QtWidgets.QLabel(self.centralwidget)
+        self.logo_label.setMinimumSize(QtCore.QSize(120, 120))
+        self.logo_label.setMaximumSize(QtCore.QSize(120, 120))
+        self.logo_label.setStyleSheet("background-color: #3498db; border-radius: 60px;")
+        self.logo_label.setText("")
+        self.logo_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.logo_label.setObjectName("logo_label")
+        self.verticalLayout.addWidget(self.logo_label)
+        self.login_frame = QtWidgets.QFrame(self.centralwidget)
+        self.login_frame.setStyleSheet("background-color: white; border-radius: 10px; border: 1px solid #bdc3c7;")
+        self.login_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.login_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.login_frame.setObjectName("login_frame")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.login_frame)
+        self.verticalLayout_2.setContentsMargins(30, 30, 30, 30)
+        self.verticalLayout_2.setSpacing(15)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.login_title = QtWidgets.QLabel(self.login_frame)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(True)
+        font.setWeight(75)
+        self.login_title.setFont(font)
+        self.login_title.setStyleSheet("color: #2c3e50;")
+        self.login_title.setAlignment(QtCore.Qt.AlignCenter)
+        self.login_title.setObjectName("login_title")
+        self.verticalLayout_2.addWidget(self.login_title)
+        self.email_label = QtWidgets.QLabel(self.login_frame)
+        self.email_label.setStyleSheet("color: #34495e; font-weight: bold;")
+        self.email_label.setObjectName("email_label")
+        self.verticalLayout_2.addWidget(self.email_label)
+        self.email_input = QtWidgets.QLineEdit(self.login_frame)
+        self.email_input.setMinimumSize(QtCore.QSize(0, 40))
+        self.email_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.email_input.setObjectName("email_input")
+        self.verticalLayout_2.addWidget(self.email_input)
+        self.senha_label = QtWidgets.QLabel(self.login_frame)
+        self.senha_label.setStyleSheet("color: #34495e; font-weight: bold;")
+        self.senha_label.setObjectName("senha_label")
+        self.verticalLayout_2.addWidget(self.senha_label)
+        self.senha_input = QtWidgets.QLineEdit(self.login_frame)
+        self.senha_input.setMinimumSize(QtCore.QSize(0, 40))
+        self.senha_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.senha_input.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.senha_input.setObjectName("senha_input")
+        self.verticalLayout_2.addWidget(self.senha_input)
+        self.remember_check = QtWidgets.QCheckBox(self.login_frame)
+        self.remember_check.setStyleSheet("color: #34495e;")
+        self.remember_check.setObjectName("remember_check")
+        self.verticalLayout_2.addWidget(self.remember_check)
+        self.login_btn = QtWidgets.QPushButton(self.login_frame)
+        self.login_btn.setMinimumSize(QtCore.QSize(0, 45))
+        self.login_btn.setStyleSheet("QPushButton {\n"
+"    background-color: #3498db;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    border-radius: 5px;\n"
+"    font-size: 16px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #2980b9;\n"
+"}\n"
+"QPushButton:pressed {\n"
+"    background-color: #21618c;\n"
+"}")
+        self.login_btn.setObjectName("login_btn")
+        self.verticalLayout_2.addWidget(self.login_btn)
+        self.register_btn = QtWidgets.QPushButton(self.login_frame)
+        self.register_btn.setMinimumSize(QtCore.QSize(0, 40))
+        self.register_btn.setStyleSheet("QPushButton {\n"
+"    background-color: transparent;\n"
+"    color: #3498db;\n"
+"    border: 2px solid #3498db;\n"
+"    border-radius: 5px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #3498db;\n"
+"    color: white;\n"
+"}")
+        self.register_btn.setObjectName("register_btn")
+        self.verticalLayout_2.addWidget(self.register_btn)
+        self.verticalLayout.addWidget(self.login_frame)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        LoginWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(LoginWindow)
+        QtCore.QMetaObject.connectSlotsByName(LoginWindow)
+
+    def retranslateUi(self, LoginWindow):
+        _translate = QtCore.QCoreApplication.translate
+        LoginWindow.setWindowTitle(_translate("LoginWindow", "Sistema de Gestão de Tickets - Login"))
+        self.title_label.setText(_translate("LoginWindow", "Sistema de Gestão de Tickets"))
+        self.login_title.setText(_translate("LoginWindow", "Faça seu Login"))
+        self.email_label.setText(_translate("LoginWindow", "Email:"))
+        self.email_input.setPlaceholderText(_translate("LoginWindow", "Digite seu email"))
+        self.senha_label.setText(_translate("LoginWindow", "Senha:"))
+        self.senha_input.setPlaceholderText(_translate("LoginWindow", "Digite sua senha"))
+        self.remember_check.setText(_translate("LoginWindow", "Manter conectado"))
+        self.login_btn.setText(_translate("LoginWindow", "Entrar"))
+        self.register_btn.setText(_translate("LoginWindow", "Criar Nova Conta"))
@@ -1,8 +1,11 @@
+import html
 import sys
-from PyQt5.QtWidgets import QMainWindow, QApplication, QPushButton
+from PyQt5.QtWidgets import QMainWindow, QApplication, QPushButton, QTextBrowser
 from PyQt5.QtCore import pyqtSlot, QFile, QTextStream
 
+from database import DatabaseManager
 from sidebar_ui import Ui_MainWindow
+from workers import QueryRunner
 
 
 class MainWindow(QMainWindow):
@@ -16,12 +19,59 @@ class MainWindow(QMainWindow):
         self.ui.stackedWidget.setCurrentIndex(0)
         self.ui.home_btn_2.setChecked(True)
 
+        ## Search results go below label_9 on the search page
+        self.search_results = QTextBrowser(self.ui.page_6)
+        self.search_results.setOpenLinks(False)
+        self.ui.gridLayout_7.addWidget(self.search_results, 1, 0, 1, 1)
+        self.pending_search = None
+
+        ## The database is opened in the background, like in the login window
+        self.db = None
+        self.runner = QueryRunner(self)
+        self.runner.run('connect', DatabaseManager, on_result=self.on_db_ready)
+
+    def on_db_ready(self, db):
+        self.db = db
+        if self.pending_search:
+            self.run_search(self.pending_search)
+
     ## Function for searching
+    @pyqtSlot()
     def on_search_btn_clicked(self):
         self.ui.stackedWidget.setCurrentIndex(5)
         search_text = self.ui.search_input.text().strip()
         if search_text:
-            self.ui.label_9.setText(search_text)
+            self.run_search(search_text)
+
+    def on_search_input_returnPressed(self):
+        self.on_search_btn_clicked()
+
+    def run_search(self, search_text):
+        self.ui.label_9.setText(f'Buscando "{search_text}"...')
+        if self.db is None:
+            self.pending_search = search_text
+            return
+        self.pending_search = None
+        self.runner.run('search', self.db.search_tickets, search_text, limit=50,
+                        on_result=lambda tickets: self.show_search_results(search_text, tickets))
+
+    def show_search_results(self, search_text, tickets):
+        self.ui.label_9.setText(f'{len(tickets)} resultado(s) para "{search_text}"')
+        items = []
+        for ticket in tickets:
+            items.append(
+                f"<p><b>#{ticket['id']}</b> {ticket['title_snippet']} "
+                f"<span style='color: gray'>[{html.escape(ticket['status'].title())} · "
+                f"{html.escape(ticket['cliente_nome'])}]</span><br>"
+                f"<small>{ticket['snippet'] or ''}</small></p>"
+            )
+        self.search_results.setHtml(''.join(items))
+
+    def closeEvent(self, event):
+        self.runner.wait()
+        if self.db:
+            self.db.close()
+        super().closeEvent(event)
 
     ## Function for changing page to user page
     def on_user_btn_clicked(self):
@@ -35,7 +85,10 @@ class MainWindow(QMainWindow):
         for btn in btn_list:
             if index in [5, 6]:
                 btn.setAutoExclusive(False)
+                ## Unchecking must not fire the *_toggled slots, which would leave the page
+                btn.blockSignals(True)
                 btn.setChecked(False)
+                btn.blockSignals(False)
             else:
                 btn.setAutoExclusive(True)
             
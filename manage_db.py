@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Utilitário de linha de comando para administração do banco de dados
+
+Uso:
+    python manage_db.py migrate    # aplica as migrações pendentes
+    python manage_db.py status     # mostra a versão do esquema
+    python manage_db.py import-tickets tickets.csv --batch-size 1000
+    python manage_db.py import-comments comentarios.jsonl --commit-every 10
+    python manage_db.py export tickets tickets.tcol --status fechado
+    python manage_db.py prune-events --dias 30
+    python manage_db.py verify-counters   # confere ticket_counters com os tickets
+    python manage_db.py rebuild-counters  # recalcula ticket_counters
+    python manage_db.py calibrate-hash --alvo-ms 250
+"""
+
+import argparse
+import csv
+import sys
+import time
+from datetime import datetime, timedelta
+
+import exporters
+import importers
+import migrations
+import passwords
+from backends import Error
+from database import DatabaseManager
+
+def cmd_migrate(db, args):
+    """Aplica as migrações pendentes"""
+    with db.get_connection() as connection:
+        applied = migrations.migrate(connection, dialect=db.dialect)
+    if not applied:
+        print(f"Esquema já está na versão {migrations.LATEST_VERSION}")
+    return 0
+
+def cmd_status(db, args):
+    """Mostra as migrações aplicadas e pendentes"""
+    with db.get_connection() as connection:
+        cursor = connection.cursor()
+        applied = migrations.applied_migrations(cursor, db.dialect)
+        cursor.close()
+    
+    for version, descricao, aplicada_em in applied:
+        print(f"  [x] {version:3d}  {descricao}  ({aplicada_em})")
+    version = applied[-1][0] if applied else 0
+    for number, descricao, _ in migrations.pending_migrations(version):
+        print(f"  [ ] {number:3d}  {descricao}")
+    print(f"Versão atual: {version} / mais recente: {migrations.LATEST_VERSION}")
+    return 0
+
+def cmd_import_tickets(db, args):
+    """Importa tickets de um arquivo CSV ou JSONL em lotes"""
+    def progress(result):
+        print(f"  {result['inserted']} inseridos, {len(result['rejected'])} rejeitados "
+              f"({result['rate']:.0f} tickets/s)")
+    
+    records = importers.read_records(args.arquivo, args.format)
+    result = db.bulk_create_tickets(records, batch_size=args.batch_size, progress=progress)
+    
+    rejected = result['rejected']
+    print(f"{result['inserted']} tickets importados em {result['seconds']:.1f}s "
+          f"({result['rate']:.0f} tickets/s), {len(rejected)} rejeitados")
+    if rejected and args.rejeitados:
+        with open(args.rejeitados, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['registro', 'motivo'])
+            writer.writerows(rejected)
+        print(f"Registros rejeitados gravados em {args.rejeitados}")
+    else:
+        for number, motivo in rejected[:20]:
+            print(f"  registro {number}: {motivo}")
+        if len(rejected) > 20:
+            print(f"  ... e mais {len(rejected) - 20} (use --rejeitados ARQUIVO para ver todos)")
+    return 1 if rejected else 0
+
+def cmd_import_comments(db, args):
+    """Importa comentários de um arquivo CSV ou JSONL, mostrando o tempo de cada lote"""
+    records = importers.read_records(args.arquivo, args.format)
+    inserted = saved = rejected = 0
+    writer = None
+    rejects_file = open(args.rejeitados, 'w', newline='', encoding='utf-8') if args.rejeitados else None
+    try:
+        if rejects_file:
+            writer = csv.writer(rejects_file)
+            writer.writerow(['registro', 'motivo'])
+        for batch in db.import_comments(records, batch_size=args.batch_size, commit_every=args.commit_every):
+            inserted = batch['total']
+            if batch['committed']:
+                saved = inserted
+            rejected += len(batch['rejected'])
+            rate = batch['inserted'] / batch['seconds'] if batch['seconds'] else 0.0
+            print(f"  lote {batch['batch']}: {batch['inserted']} inseridos, {len(batch['rejected'])} rejeitados "
+                  f"em {batch['seconds'] * 1000:.0f} ms ({rate:.0f}/s){' [commit]' if batch['committed'] else ''}")
+            if writer:
+                writer.writerows(batch['rejected'])
+            else:
+                for number, motivo in batch['rejected']:
+                    print(f"    registro {number}: {motivo}")
+    except Error as e:
+        print(f"Erro na importação de comentários: {e}")
+        print(f"{saved} comentários gravados até o último commit; os lotes seguintes foram descartados")
+        return 1
+    finally:
+        if rejects_file:
+            rejects_file.close()
+    print(f"{inserted} comentários importados, {rejected} rejeitados")
+    return 1 if rejected else 0
+
+def cmd_export(db, args):
+    """Exporta tickets ou comentários em fluxo para CSV, JSONL ou formato colunar"""
+    filters = {
+        'user_id': args.cliente,
+        'statuses': args.status,
+        'date_from': args.desde,
+        'date_to': args.ate,
+        'text': args.texto,
+    }
+    if args.tabela == 'tickets':
+        stream = db.stream_tickets(fetch_size=args.fetch_size, **filters)
+    else:
+        stream = db.stream_comments(fetch_size=args.fetch_size, **filters)
+    
+    started = time.perf_counter()
+    total = exporters.export(stream, args.arquivo, args.format)
+    seconds = time.perf_counter() - started
+    print(f"{total} registros de {args.tabela} exportados para {args.arquivo} em {seconds:.1f}s")
+    return 0
+
+def cmd_prune_events(db, args):
+    """Remove eventos antigos do diário ticket_events"""
+    removed = db.prune_ticket_events(datetime.now() - timedelta(days=args.dias))
+    print(f"{removed} eventos com mais de {args.dias} dias removidos")
+    return 0
+
+def cmd_verify_counters(db, args):
+    """Confere os contadores materializados com a contagem real dos tickets"""
+    differences = db.verify_ticket_counters()
+    if differences is None:
+        return 1
+    for cliente_id, status, expected, recorded in differences:
+        owner = "total geral" if cliente_id == 0 else f"cliente {cliente_id}"
+        print(f"  {owner}, {status}: esperado {expected}, registrado {recorded}")
+    if differences:
+        print(f"{len(differences)} contadores divergentes (use rebuild-counters para corrigir)")
+        return 1
+    print("Contadores corretos")
+    return 0
+
+def cmd_rebuild_counters(db, args):
+    """Recalcula os contadores materializados a partir dos tickets"""
+    if not db.rebuild_ticket_counters():
+        return 1
+    print("Contadores recalculados")
+    return 0
+
+def cmd_calibrate_hash(db, args):
+    """Mede o custo do hash de senha que leva ao tempo de login desejado"""
+    print(f"Calibrando {args.algoritmo} para ~{args.alvo_ms} ms por verificação...")
+    params, elapsed = passwords.calibrate(args.algoritmo, args.alvo_ms)
+    print(f"Tempo medido: {elapsed:.0f} ms")
+    print("Use em PASSWORD_CONFIG (config.py):")
+    for key, value in params.items():
+        print(f"    {key!r}: {value!r},")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Administração do banco do Sistema de Gestão de Tickets")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    subparsers.add_parser('migrate', help="aplica as migrações pendentes").set_defaults(func=cmd_migrate)
+    subparsers.add_parser('status', help="mostra a versão do esquema").set_defaults(func=cmd_status)
+    
+    parser_import = subparsers.add_parser('import-tickets', help="importa tickets de um arquivo CSV ou JSONL")
+    parser_import.add_argument('arquivo', help="arquivo com os campos titulo, descricao, cliente_email "
+                                               "(ou cliente_id) e, opcionalmente, status e data_criacao")
+    parser_import.add_argument('--format', choices=importers.FORMATS,
+                               help="formato do arquivo (padrão: deduzido pela extensão)")
+    parser_import.add_argument('--batch-size', type=int, default=1000, help="linhas por lote (padrão: 1000)")
+    parser_import.add_argument('--rejeitados', metavar='ARQUIVO', help="grava os registros rejeitados em um CSV")
+    parser_import.set_defaults(func=cmd_import_tickets)
+    
+    parser_comments = subparsers.add_parser('import-comments', help="importa comentários de um arquivo CSV ou JSONL")
+    parser_comments.add_argument('arquivo', help="arquivo com os campos ticket_id, usuario_email (ou usuario_id), "
+                                                 "texto e, opcionalmente, data_comentario")
+    parser_comments.add_argument('--format', choices=importers.FORMATS,
+                                 help="formato do arquivo (padrão: deduzido pela extensão)")
+    parser_comments.add_argument('--batch-size', type=int, default=1000, help="linhas por lote (padrão: 1000)")
+    parser_comments.add_argument('--commit-every', type=int, default=10, metavar='LOTES',
+                                 help="lotes por commit (padrão: 10)")
+    parser_comments.add_argument('--rejeitados', metavar='ARQUIVO', help="grava os registros rejeitados em um CSV")
+    parser_comments.set_defaults(func=cmd_import_comments)
+    
+    parser_export = subparsers.add_parser('export', help="exporta tickets ou comentários para um arquivo")
+    parser_export.add_argument('tabela', choices=('tickets', 'comentarios'))
+    parser_export.add_argument('arquivo', help="arquivo de saída (.csv, .jsonl ou .tcol)")
+    parser_export.add_argument('--format', choices=exporters.FORMATS,
+                               help="formato do arquivo (padrão: deduzido pela extensão)")
+    parser_export.add_argument('--status', action='append', choices=('aberto', 'pausado', 'fechado'),
+                               help="filtra por status (pode ser repetido)")
+    parser_export.add_argument('--cliente', type=int, metavar='ID', help="apenas tickets do cliente")
+    parser_export.add_argument('--desde', metavar='DATA', help="criados a partir da data (AAAA-MM-DD)")
+    parser_export.add_argument('--ate', metavar='DATA', help="criados antes da data (AAAA-MM-DD)")
+    parser_export.add_argument('--texto', help="trecho do título ou da descrição")
+    parser_export.add_argument('--fetch-size', type=int, default=1000, help="linhas lidas por vez (padrão: 1000)")
+    parser_export.set_defaults(func=cmd_export)
+    
+    parser_prune = subparsers.add_parser('prune-events', help="remove eventos antigos do diário de tickets")
+    parser_prune.add_argument('--dias', type=int, default=30, help="mantém os eventos dos últimos N dias (padrão: 30)")
+    parser_prune.set_defaults(func=cmd_prune_events)
+    
+    subparsers.add_parser('verify-counters', help="confere os contadores de tickets por status"
+                          ).set_defaults(func=cmd_verify_counters)
+    subparsers.add_parser('rebuild-counters', help="recalcula os contadores de tickets por status"
+                          ).set_defaults(func=cmd_rebuild_counters)
+    
+    parser_hash = subparsers.add_parser('calibrate-hash', help="mede o custo do hash de senha neste computador")
+    parser_hash.add_argument('--algoritmo', choices=sorted(passwords.HASHERS), default='scrypt')
+    parser_hash.add_argument('--alvo-ms', type=int, default=250,
+                             help="tempo desejado por verificação de senha (padrão: 250)")
+    parser_hash.set_defaults(func=cmd_calibrate_hash)
+    
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    db = DatabaseManager()
+    try:
+        return args.func(db, args)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
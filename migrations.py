@@ -0,0 +1,332 @@
+"""Migrações versionadas do esquema do banco
+
+Cada migração tem um número de versão, uma descrição e uma lista de passos.
+Um passo é um comando SQL, um dicionário {dialeto: comando(s) SQL} para
+trechos que diferem entre MySQL e SQLite, ou uma função que recebe o cursor e
+o dialeto. As versões
+aplicadas ficam registradas na tabela schema_version; na inicialização só
+é feita uma consulta para descobrir a versão atual, e as migrações pendentes
+são aplicadas em ordem. Os passos devem ser idempotentes, pois o MySQL faz
+commit implícito a cada DDL e uma migração interrompida é refeita por inteiro.
+
+No SQLite, ENUMs viram TEXT com CHECK, AUTO_INCREMENT vira INTEGER PRIMARY KEY
+AUTOINCREMENT, o e-mail usa COLLATE NOCASE (comparação sem diferenciar
+maiúsculas, como no collation padrão do MySQL) e CURRENT_TIMESTAMP é trocado
+pela hora local, que é o que o MySQL grava.
+"""
+from mysql.connector import Error, errorcode
+
+MIGRATION_LOCK = 'gestao_tickets_schema_migration'
+
+
+def add_index(table, name, columns, kind=''):
+    """Passo que cria um índice apenas se ele ainda não existir
+    
+    kind='FULLTEXT' cria um índice de texto do MySQL; no SQLite esse papel é
+    das tabelas FTS5, e o passo não faz nada.
+    """
+    def step(cursor, dialect):
+        if dialect == 'sqlite':
+            if not kind:
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+            return
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+        """, (table, name))
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(f"CREATE {kind} INDEX {name} ON {table} ({columns})")
+    return step
+
+
+# Recalcula ticket_counters a partir de tickets; a linha de cliente_id 0 guarda
+# o total geral. Usado pela migração 5 e por DatabaseManager.rebuild_ticket_counters.
+_COUNTS = """
+    COALESCE(SUM(CASE WHEN status = 'aberto' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(CASE WHEN status = 'pausado' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(CASE WHEN status = 'fechado' THEN 1 ELSE 0 END), 0)
+"""
+
+REBUILD_COUNTERS = [
+    "DELETE FROM ticket_counters",
+    f"""
+    INSERT INTO ticket_counters (cliente_id, aberto, pausado, fechado)
+    SELECT cliente_id, {_COUNTS} FROM tickets GROUP BY cliente_id
+    """,
+    f"""
+    INSERT INTO ticket_counters (cliente_id, aberto, pausado, fechado)
+    SELECT 0, {_COUNTS} FROM tickets
+    """,
+]
+
+
+MIGRATIONS = [
+    (1, "Tabelas iniciais de usuários, tickets e comentários", [
+        {'mysql': """
+        CREATE TABLE IF NOT EXISTS usuarios (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            nome VARCHAR(100) NOT NULL,
+            email VARCHAR(100) NOT NULL UNIQUE,
+            senha VARCHAR(255) NOT NULL,
+            tipo ENUM('admin', 'cliente') NOT NULL
+        )
+        """, 'sqlite': """
+        CREATE TABLE IF NOT EXISTS usuarios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome VARCHAR(100) NOT NULL,
+            email VARCHAR(100) NOT NULL UNIQUE COLLATE NOCASE,
+            senha VARCHAR(255) NOT NULL,
+            tipo TEXT NOT NULL CHECK (tipo IN ('admin', 'cliente'))
+        )
+        """},
+        {'mysql': """
+        CREATE TABLE IF NOT EXISTS tickets (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            titulo VARCHAR(255) NOT NULL,
+            descricao TEXT,
+            cliente_id INT NOT NULL,
+            status ENUM('aberto', 'pausado', 'fechado') DEFAULT 'aberto',
+            data_criacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+            tempo_resposta TIME DEFAULT '00:00:00',
+            FOREIGN KEY (cliente_id) REFERENCES usuarios(id)
+        )
+        """, 'sqlite': """
+        CREATE TABLE IF NOT EXISTS tickets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            titulo VARCHAR(255) NOT NULL,
+            descricao TEXT,
+            cliente_id INT NOT NULL,
+            status TEXT DEFAULT 'aberto' CHECK (status IN ('aberto', 'pausado', 'fechado')),
+            data_criacao DATETIME DEFAULT (datetime('now', 'localtime')),
+            tempo_resposta TIME DEFAULT '00:00:00',
+            FOREIGN KEY (cliente_id) REFERENCES usuarios(id)
+        )
+        """},
+        {'mysql': """
+        CREATE TABLE IF NOT EXISTS comentarios (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            ticket_id INT NOT NULL,
+            usuario_id INT NOT NULL,
+            texto TEXT NOT NULL,
+            data_comentario DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (ticket_id) REFERENCES tickets(id),
+            FOREIGN KEY (usuario_id) REFERENCES usuarios(id)
+        )
+        """, 'sqlite': """
+        CREATE TABLE IF NOT EXISTS comentarios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticket_id INT NOT NULL,
+            usuario_id INT NOT NULL,
+            texto TEXT NOT NULL,
+            data_comentario DATETIME DEFAULT (datetime('now', 'localtime')),
+            FOREIGN KEY (ticket_id) REFERENCES tickets(id),
+            FOREIGN KEY (usuario_id) REFERENCES usuarios(id)
+        )
+        """},
+    ]),
+    (2, "Índices compostos para listagem de tickets e comentários", [
+        # Listagem geral e por status, ordenadas por (data_criacao, id)
+        add_index('tickets', 'idx_tickets_data', 'data_criacao'),
+        add_index('tickets', 'idx_tickets_status_data', 'status, data_criacao'),
+        # Listagem do cliente, com e sem filtro de status
+        add_index('tickets', 'idx_tickets_cliente_data', 'cliente_id, data_criacao'),
+        add_index('tickets', 'idx_tickets_cliente_status_data', 'cliente_id, status, data_criacao'),
+        # Comentários de um ticket em ordem cronológica
+        add_index('comentarios', 'idx_comentarios_ticket_data', 'ticket_id, data_comentario'),
+    ]),
+    (3, "Índices de busca textual em tickets e comentários", [
+        add_index('tickets', 'ft_tickets_texto', 'titulo, descricao', kind='FULLTEXT'),
+        add_index('comentarios', 'ft_comentarios_texto', 'texto', kind='FULLTEXT'),
+        # SQLite: tabelas FTS5 com conteúdo externo, mantidas por triggers
+        {'sqlite': [
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5(
+                titulo, descricao, content='tickets', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tickets_fts_insert AFTER INSERT ON tickets BEGIN
+                INSERT INTO tickets_fts (rowid, titulo, descricao) VALUES (new.id, new.titulo, new.descricao);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tickets_fts_delete AFTER DELETE ON tickets BEGIN
+                INSERT INTO tickets_fts (tickets_fts, rowid, titulo, descricao)
+                VALUES ('delete', old.id, old.titulo, old.descricao);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tickets_fts_update AFTER UPDATE OF titulo, descricao ON tickets BEGIN
+                INSERT INTO tickets_fts (tickets_fts, rowid, titulo, descricao)
+                VALUES ('delete', old.id, old.titulo, old.descricao);
+                INSERT INTO tickets_fts (rowid, titulo, descricao) VALUES (new.id, new.titulo, new.descricao);
+            END
+            """,
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS comentarios_fts USING fts5(
+                texto, content='comentarios', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS comentarios_fts_insert AFTER INSERT ON comentarios BEGIN
+                INSERT INTO comentarios_fts (rowid, texto) VALUES (new.id, new.texto);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS comentarios_fts_delete AFTER DELETE ON comentarios BEGIN
+                INSERT INTO comentarios_fts (comentarios_fts, rowid, texto) VALUES ('delete', old.id, old.texto);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS comentarios_fts_update AFTER UPDATE OF texto ON comentarios BEGIN
+                INSERT INTO comentarios_fts (comentarios_fts, rowid, texto) VALUES ('delete', old.id, old.texto);
+                INSERT INTO comentarios_fts (rowid, texto) VALUES (new.id, new.texto);
+            END
+            """,
+            # Indexa o que já existia antes da migração
+            "INSERT INTO tickets_fts (tickets_fts) VALUES ('rebuild')",
+            "INSERT INTO comentarios_fts (comentarios_fts) VALUES ('rebuild')",
+        ]},
+    ]),
+    (4, "Diário de eventos de tickets (ticket_events)", [
+        # Sem chave estrangeira: o diário só recebe inserções e é podado por data
+        {'mysql': """
+        CREATE TABLE IF NOT EXISTS ticket_events (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            ticket_id INT NOT NULL,
+            tipo ENUM('criado', 'status', 'comentario') NOT NULL,
+            data_evento DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """, 'sqlite': """
+        CREATE TABLE IF NOT EXISTS ticket_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticket_id INT NOT NULL,
+            tipo TEXT NOT NULL CHECK (tipo IN ('criado', 'status', 'comentario')),
+            data_evento DATETIME DEFAULT (datetime('now', 'localtime'))
+        )
+        """},
+        add_index('ticket_events', 'idx_ticket_events_data', 'data_evento'),
+    ]),
+    (5, "Contadores de tickets por status (ticket_counters)", [
+        {'mysql': """
+        CREATE TABLE IF NOT EXISTS ticket_counters (
+            cliente_id INT PRIMARY KEY,
+            aberto INT NOT NULL DEFAULT 0,
+            pausado INT NOT NULL DEFAULT 0,
+            fechado INT NOT NULL DEFAULT 0
+        )
+        """, 'sqlite': """
+        CREATE TABLE IF NOT EXISTS ticket_counters (
+            cliente_id INTEGER PRIMARY KEY,
+            aberto INT NOT NULL DEFAULT 0,
+            pausado INT NOT NULL DEFAULT 0,
+            fechado INT NOT NULL DEFAULT 0
+        )
+        """},
+        *REBUILD_COUNTERS,
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+SCHEMA_VERSION_TABLE = {
+    'mysql': """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            descricao VARCHAR(255) NOT NULL,
+            aplicada_em DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    'sqlite': """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            descricao VARCHAR(255) NOT NULL,
+            aplicada_em DATETIME DEFAULT (datetime('now', 'localtime'))
+        )
+    """,
+}
+
+
+def run_step(cursor, step, dialect='mysql'):
+    """Executa um passo de migração no dialeto informado
+    
+    Em passos por dialeto, o valor pode ser um comando ou uma lista de
+    comandos; dialetos ausentes do dicionário não executam nada.
+    """
+    if callable(step):
+        step(cursor, dialect)
+        return
+    if isinstance(step, dict):
+        step = step.get(dialect, ())
+    for sql in [step] if isinstance(step, str) else step:
+        cursor.execute(sql)
+
+
+def current_version(cursor, dialect='mysql'):
+    """Retorna a versão atual do esquema, ou None se schema_version não existe"""
+    if dialect == 'sqlite':
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'")
+        if cursor.fetchone()[0] == 0:
+            return None
+    try:
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+    except Error as e:
+        if e.errno == errorcode.ER_NO_SUCH_TABLE:
+            return None
+        raise
+    return cursor.fetchone()[0] or 0
+
+
+def applied_migrations(cursor, dialect='mysql'):
+    """Lista as migrações registradas em schema_version"""
+    if current_version(cursor, dialect) is None:
+        return []
+    cursor.execute("SELECT version, descricao, aplicada_em FROM schema_version ORDER BY version")
+    return cursor.fetchall()
+
+
+def pending_migrations(version):
+    """Migrações com versão maior que a informada"""
+    return [migration for migration in MIGRATIONS if migration[0] > (version or 0)]
+
+
+def migrate(connection, verbose=True, dialect='mysql'):
+    """Aplica as migrações pendentes e retorna a lista de versões aplicadas"""
+    cursor = connection.cursor()
+    try:
+        version = current_version(cursor, dialect)
+        if version == LATEST_VERSION:
+            return []
+        
+        # Evita que duas instâncias iniciando juntas apliquem a mesma migração
+        if dialect == 'mysql':
+            cursor.execute("SELECT GET_LOCK(%s, 30)", (MIGRATION_LOCK,))
+            cursor.fetchone()
+        try:
+            if version is None:
+                cursor.execute(SCHEMA_VERSION_TABLE[dialect])
+            version = current_version(cursor, dialect)
+            
+            applied = []
+            for number, descricao, steps in pending_migrations(version):
+                if dialect == 'sqlite':
+                    # O DDL do SQLite é transacional: a migração é aplicada por inteiro ou não é
+                    cursor.execute("BEGIN IMMEDIATE")
+                for step in steps:
+                    run_step(cursor, step, dialect)
+                cursor.execute("INSERT INTO schema_version (version, descricao) VALUES (%s, %s)",
+                               (number, descricao))
+                connection.commit()
+                applied.append(number)
+                if verbose:
+                    print(f"Migração {number} aplicada: {descricao}")
+            return applied
+        finally:
+            if dialect == 'mysql':
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK,))
+                cursor.fetchone()
+    finally:
+        cursor.close()
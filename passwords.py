@@ -0,0 +1,192 @@
+"""Hash e verificação de senhas
+
+As senhas são guardadas como um texto que descreve o próprio hash, com o
+algoritmo, os parâmetros de custo e o sal aleatório de cada usuário:
+    
+    scrypt$<n>$<r>$<p>$<sal base64>$<hash base64>
+    pbkdf2_sha256$<iterações>$<sal base64>$<hash base64>
+
+Assim o custo pode ser aumentado em PASSWORD_CONFIG sem invalidar as senhas
+existentes: needs_rehash() indica quando um hash foi gerado com outro
+algoritmo ou com parâmetros diferentes dos atuais, e o login grava o hash
+novo. Hashes antigos do sistema (SHA-256 sem sal, 64 dígitos hexadecimais)
+continuam aceitos e são sempre refeitos no próximo login.
+
+A comparação é feita em tempo constante (hmac.compare_digest). Use
+calibrate() (ou `python manage_db.py calibrate-hash`) para escolher o custo
+que leva ao tempo de login desejado no servidor.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import re
+import time
+
+from config import PASSWORD_CONFIG
+
+SALT_SIZE = 16
+HASH_SIZE = 32
+
+LEGACY_SHA256 = re.compile(r'[0-9a-f]{64}')
+
+
+def _b64encode(data):
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+def _b64decode(text):
+    return base64.b64decode(text + '=' * (-len(text) % 4))
+
+
+class ScryptHasher:
+    """scrypt (hashlib): custo de CPU e de memória (128 * n * r bytes)"""
+    
+    algorithm = 'scrypt'
+    
+    def __init__(self, config):
+        self.n = config['scrypt_n']
+        self.r = config['scrypt_r']
+        self.p = config['scrypt_p']
+    
+    def encode(self, password, salt=None):
+        salt = salt or os.urandom(SALT_SIZE)
+        digest = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{self.algorithm}${self.n}${self.r}${self.p}${_b64encode(salt)}${_b64encode(digest)}"
+    
+    def verify(self, password, encoded):
+        _, n, r, p, salt, digest = encoded.split('$')
+        expected = _b64decode(digest)
+        actual = self._derive(password, _b64decode(salt), int(n), int(r), int(p), len(expected))
+        return hmac.compare_digest(actual, expected)
+    
+    def needs_update(self, encoded):
+        _, n, r, p, _, _ = encoded.split('$')
+        return (int(n), int(r), int(p)) != (self.n, self.r, self.p)
+    
+    @staticmethod
+    def _derive(password, salt, n, r, p, size=HASH_SIZE):
+        # O limite padrão do OpenSSL (32 MiB) não comporta n >= 2**15 com r = 8
+        maxmem = 128 * n * r * (p + 1) + 1024 * 1024
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                              maxmem=maxmem, dklen=size)
+
+
+class Pbkdf2Hasher:
+    """PBKDF2-HMAC-SHA256 (hashlib): custo apenas de CPU, pelo número de iterações"""
+    
+    algorithm = 'pbkdf2_sha256'
+    
+    def __init__(self, config):
+        self.iterations = config['pbkdf2_iterations']
+    
+    def encode(self, password, salt=None):
+        salt = salt or os.urandom(SALT_SIZE)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, self.iterations)
+        return f"{self.algorithm}${self.iterations}${_b64encode(salt)}${_b64encode(digest)}"
+    
+    def verify(self, password, encoded):
+        _, iterations, salt, digest = encoded.split('$')
+        expected = _b64decode(digest)
+        actual = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), _b64decode(salt),
+                                     int(iterations), len(expected))
+        return hmac.compare_digest(actual, expected)
+    
+    def needs_update(self, encoded):
+        return int(encoded.split('$')[1]) != self.iterations
+
+
+HASHERS = {hasher.algorithm: hasher for hasher in (ScryptHasher, Pbkdf2Hasher)}
+
+def get_hasher(algorithm=None, config=None):
+    """Hasher do algoritmo informado (padrão: PASSWORD_CONFIG['algorithm'])"""
+    config = config or PASSWORD_CONFIG
+    algorithm = algorithm or config['algorithm']
+    if algorithm not in HASHERS:
+        raise ValueError(f"Algoritmo de senha desconhecido: {algorithm}")
+    if algorithm == 'scrypt' and not hasattr(hashlib, 'scrypt'):
+        # Python compilado sem scrypt no OpenSSL
+        algorithm = 'pbkdf2_sha256'
+    return HASHERS[algorithm](config)
+
+def hash_password(password, config=None):
+    """Gera o hash de uma senha com o algoritmo e o custo configurados"""
+    return get_hasher(config=config).encode(password)
+
+def verify_password(password, encoded):
+    """Confere a senha com o hash guardado, em tempo constante"""
+    if not encoded:
+        return False
+    if LEGACY_SHA256.fullmatch(encoded):
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, encoded)
+    algorithm = encoded.split('$', 1)[0]
+    if algorithm not in HASHERS:
+        return False
+    if algorithm == 'scrypt' and not hasattr(hashlib, 'scrypt'):
+        print("Erro ao verificar a senha: este Python não tem hashlib.scrypt")
+        return False
+    try:
+        return HASHERS[algorithm](PASSWORD_CONFIG).verify(password, encoded)
+    except (ValueError, TypeError):  # hash malformado
+        return False
+
+def needs_rehash(encoded, config=None):
+    """True se o hash não usa o algoritmo e o custo configurados atualmente"""
+    hasher = get_hasher(config=config)
+    if not encoded or not encoded.startswith(hasher.algorithm + '$'):
+        return True
+    return hasher.needs_update(encoded)
+
+# Hash de uma senha qualquer, verificado quando o e-mail não existe para que
+# a resposta leve o mesmo tempo e não revele quais e-mails estão cadastrados
+_dummy_hash = None
+
+def dummy_verify(password):
+    """Gasta o tempo de uma verificação real quando não há usuário; retorna False"""
+    global _dummy_hash
+    if _dummy_hash is None or needs_rehash(_dummy_hash):
+        _dummy_hash = hash_password(os.urandom(SALT_SIZE).hex())
+    verify_password(password, _dummy_hash)
+    return False
+
+def calibrate(algorithm='scrypt', target_ms=250, config=None):
+    """Escolhe o custo que faz uma verificação levar cerca de target_ms neste computador
+    
+    No scrypt, dobra n (mantendo r e p) até passar do alvo; no PBKDF2, mede
+    uma execução e ajusta as iterações proporcionalmente. Retorna
+    (parâmetros para PASSWORD_CONFIG, milissegundos medidos).
+    """
+    config = dict(config or PASSWORD_CONFIG)
+    config['algorithm'] = algorithm
+    
+    def measure(settings, runs=3):
+        # Menor de algumas execuções, para não contar o aquecimento da primeira
+        hasher = get_hasher(config=settings)
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            hasher.encode('calibragem')
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
+    
+    if algorithm == 'scrypt':
+        settings = dict(config, scrypt_n=2 ** 12)
+        elapsed = measure(settings)
+        while elapsed < target_ms and settings['scrypt_n'] < 2 ** 20:
+            candidate = dict(settings, scrypt_n=settings['scrypt_n'] * 2)
+            candidate_ms = measure(candidate)
+            # Fica com o n mais próximo do alvo
+            if candidate_ms - target_ms > target_ms - elapsed:
+                break
+            settings, elapsed = candidate, candidate_ms
+        params = {key: settings[key] for key in ('scrypt_n', 'scrypt_r', 'scrypt_p')}
+    else:
+        settings = dict(config, pbkdf2_iterations=100_000)
+        elapsed = measure(settings)
+        for _ in range(2):  # a segunda medida corrige o erro da extrapolação
+            iterations = settings['pbkdf2_iterations'] * target_ms / elapsed
+            settings['pbkdf2_iterations'] = int(max(10_000, round(iterations, -3)))
+            elapsed = measure(settings)
+        params = {'pbkdf2_iterations': settings['pbkdf2_iterations']}
+    
+    return dict({'algorithm': algorithm}, **params), elapsed
@@ -0,0 +1,122 @@
+"""Montagem de consultas de tickets com filtros combináveis
+
+Gera SQL parametrizado (placeholders %s) a partir de filtros, sem precisar de
+uma string de consulta para cada combinação. O texto SQL gerado depende apenas
+de quais filtros foram usados (o "formato" da consulta), nunca dos valores, o
+que permite reaproveitar statements preparados entre chamadas.
+"""
+
+ORDERINGS = {
+    'recentes': ('t.data_criacao DESC, t.id DESC', '<'),
+    'antigos': ('t.data_criacao ASC, t.id ASC', '>'),
+}
+
+class TicketQuery:
+    """Construtor de SELECT sobre tickets (com o nome do cliente)"""
+    
+    SELECT = """
+        SELECT t.*, u.nome as cliente_nome
+        FROM tickets t
+        JOIN usuarios u ON t.cliente_id = u.id
+    """
+    
+    def __init__(self):
+        self.conditions = []
+        self.params = []
+        self.ordering = 'recentes'
+        self.limit_value = None
+    
+    @classmethod
+    def from_filters(cls, user_id=None, status=None, statuses=None, date_from=None,
+                     date_to=None, text=None, ordering='recentes'):
+        """Cria a consulta a partir dos filtros usados pelo DatabaseManager"""
+        query = cls().client(user_id).order_by(ordering)
+        query.status(*([status] if status else []), *(statuses or []))
+        return query.created_between(date_from, date_to).text(text)
+    
+    def where(self, condition, *params):
+        """Adiciona uma condição arbitrária (com placeholders %s)"""
+        self.conditions.append(condition)
+        self.params.extend(params)
+        return self
+    
+    def status(self, *statuses):
+        """Filtra por um ou mais status"""
+        statuses = [status for status in statuses if status]
+        if len(statuses) == 1:
+            self.where("t.status = %s", statuses[0])
+        elif statuses:
+            placeholders = ", ".join(["%s"] * len(statuses))
+            self.where(f"t.status IN ({placeholders})", *statuses)
+        return self
+    
+    def client(self, cliente_id):
+        """Filtra pelos tickets de um cliente"""
+        if cliente_id:
+            self.where("t.cliente_id = %s", cliente_id)
+        return self
+    
+    def ids(self, ticket_ids):
+        """Filtra por uma lista de ids de tickets"""
+        ticket_ids = list(ticket_ids)
+        placeholders = ", ".join(["%s"] * len(ticket_ids)) or "NULL"
+        self.where(f"t.id IN ({placeholders})", *ticket_ids)
+        return self
+    
+    def created_between(self, date_from=None, date_to=None):
+        """Filtra por data de criação (intervalo [date_from, date_to))"""
+        if date_from is not None:
+            self.where("t.data_criacao >= %s", date_from)
+        if date_to is not None:
+            self.where("t.data_criacao < %s", date_to)
+        return self
+    
+    def text(self, term):
+        """Filtra por trecho de texto no título ou na descrição"""
+        if term:
+            pattern = f"%{term}%"
+            self.where("(t.titulo LIKE %s OR t.descricao LIKE %s)", pattern, pattern)
+        return self
+    
+    def order_by(self, ordering):
+        """Define a ordenação ('recentes' ou 'antigos')"""
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Ordenação desconhecida: {ordering}")
+        self.ordering = ordering
+        return self
+    
+    def after(self, cursor):
+        """Continua a partir de um cursor keyset (data_criacao, id)"""
+        if cursor:
+            data_criacao, ticket_id = cursor
+            op = ORDERINGS[self.ordering][1]
+            self.where(f"(t.data_criacao {op} %s OR (t.data_criacao = %s AND t.id {op} %s))",
+                       data_criacao, data_criacao, ticket_id)
+        return self
+    
+    def limit(self, limit):
+        """Limita a quantidade de linhas retornadas"""
+        self.limit_value = None if limit is None else int(limit)
+        return self
+    
+    def build_ids(self):
+        """Retorna (sql, params) de um SELECT só com os ids dos tickets filtrados
+        
+        Sem ordenação nem limite, para uso como subconsulta (ex.: IN (...)).
+        """
+        sql = "SELECT t.id FROM tickets t"
+        if self.conditions:
+            sql += " WHERE " + " AND ".join(self.conditions)
+        return sql, tuple(self.params)
+    
+    def build(self):
+        """Retorna (sql, params)"""
+        sql = self.SELECT
+        if self.conditions:
+            sql += " WHERE " + " AND ".join(self.conditions)
+        sql += " ORDER BY " + ORDERINGS[self.ordering][0]
+        params = list(self.params)
+        if self.limit_value is not None:
+            sql += " LIMIT %s"
+            params.append(self.limit_value)
+        return sql, tuple(params)
@@ -0,0 +1,162 @@
+"""Cache em memória das consultas de leitura do DatabaseManager
+
+As entradas são indexadas pelo nome do método e pelos argumentos da chamada
+(o "formato" da consulta), expiram após um TTL e são descartadas em ordem LRU
+quando o cache atinge o tamanho máximo. Cada entrada recebe etiquetas
+(ex.: 'tickets', 'comments:42'); os métodos de escrita invalidam apenas as
+etiquetas que afetam.
+"""
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+class QueryCache:
+    """Cache LRU com TTL, invalidação por etiqueta e contadores de uso"""
+    
+    def __init__(self, max_size=256, ttl=30.0, enabled=True):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries = OrderedDict()  # chave -> (expira_em, valor, etiquetas)
+        self._tags = {}                # etiqueta -> conjunto de chaves
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def get(self, key):
+        """Retorna (True, valor) se a chave está no cache e não expirou"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return False, None
+    
+    def set(self, key, value, tags=(), generation=None):
+        """Guarda um valor; ignora se houve invalidação desde `generation`"""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+    
+    def invalidate(self, *tags):
+        """Descarta as entradas marcadas com qualquer uma das etiquetas"""
+        with self._lock:
+            self.generation += 1
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+    
+    def clear(self):
+        """Descarta todas as entradas"""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._tags.clear()
+    
+    def stats(self):
+        """Contadores de uso do cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+    
+    def mark_failed(self):
+        """Indica que a consulta em andamento nesta thread falhou e não deve ser guardada"""
+        self._local.failed = True
+    
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+def _freeze(value):
+    """Converte argumentos em algo que possa ser usado como chave de dicionário"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _bind(signature, args, kwargs):
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop('self', None)
+    return arguments
+
+def cached(*tags):
+    """Decora um método de leitura para usar o cache em self.cache
+    
+    As etiquetas podem usar os argumentos da chamada, ex.: 'comments:{ticket_id}'.
+    Os valores retornados são compartilhados entre chamadas e não devem ser
+    modificados. Se o método chamar self.cache.mark_failed(), o resultado
+    (normalmente uma lista vazia de erro) não é guardado.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self.cache
+            if not cache.enabled:
+                return method(self, *args, **kwargs)
+            
+            arguments = _bind(signature, (self,) + args, kwargs)
+            key = (method.__name__, _freeze(arguments))
+            hit, value = cache.get(key)
+            if hit:
+                return value
+            
+            generation = cache.generation
+            cache._local.failed = False
+            value = method(self, *args, **kwargs)
+            if not cache._local.failed:
+                entry_tags = tuple(tag.format(**arguments) for tag in tags)
+                cache.set(key, value, entry_tags, generation)
+            return value
+        return wrapper
+    return decorator
+
+def invalidates(*tags):
+    """Decora um método de escrita para invalidar as etiquetas após a chamada"""
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                arguments = _bind(signature, (self,) + args, kwargs)
+                self.cache.invalidate(*(tag.format(**arguments) for tag in tags))
+        return wrapper
+    return decorator
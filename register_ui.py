@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'register.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_RegisterWindow(object):
+    def setupUi(self, RegisterWindow):
+        RegisterWindow.setObjectName("RegisterWindow")
+        RegisterWindow.resize(450, 600)
+        RegisterWindow.setStyleSheet("background-color: #f0f0f0;")
+        self.centralwidget = QtWidgets.QWidget(RegisterWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(40, 30, 40, 30)
+        self.verticalLayout.setSpacing(20)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.title_label = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(18)
+        font.setBold(True)
+        font.setWeight(75)
+        self.title_label.setFont(font)
+        self.title_label.setStyleSheet("color: #2c3e50;")
+        self.title_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.title_label.setObjectName("title_label")
+        self.verticalLayout.addWidget(self.title_label)
+        self.register_frame = QtWidgets.QFrame(self.centralwidget)
+        self.register_frame.setStyleSheet("background-color: white; border-radius: 10px; border: 1px solid #bdc3c7;")
+        self.register_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.register_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.register_frame.setObjectName("register_frame")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.register_frame)
+        self.verticalLayout_2.setContentsMargins(30, 30, 30, 30)
+        self.verticalLayout_2.setSpacing(15)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.nome_label = QtWidgets.QLabel(self.register_frame)
+        self.nome_label.setStyleSheet("color: #34495e; font-weight: bold;")
+        self.nome_label.setObjectName("nome_label")
+        self.verticalLayout_2.addWidget(self.nome_label)
+        self.nome_input = QtWidgets.QLineEdit(self.register_frame)
+        self.nome_input.setMinimumSize(QtCore.QSize(0, 40))
+        self.nome_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.nome_input.setObjectName("nome_input")
+        self.verticalLayout_2.addWidget(self.nome_input)
+        self.email_label = QtWidgets.QLabel(self.register_frame)
+        self.email_label.setStyleSheet("color: #34495e; font-weight: bold;")
+        self.email_label.setObjectName("email_label")
+        self.verticalLayout_2.addWidget(self.email_label)
+        self.email_input = QtWidgets.QLineEdit(self.register_frame)
+        self.email_input.setMinimumSize(QtCore.QSize(0, 40))
+        self.email_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.email_input.setObjectName("email_input")
+        self.verticalLayout_2.addWidget(self.email_input)
+        self.senha_label = QtWidgets.QLabel(self.register_frame)
+        self.senha_label.setStyleSheet("color: #34495e; font-weight: bold;")
+        self.senha_label.setObjectName("senha_label")
+        self.verticalLayout_2.addWidget(self.senha_label)
+        self.senha_input = QtWidgets.QLineEdit(self.register_frame)
+        self.senha_input.setMinimumSize(QtCore.QSize(0, 40))
+        self.senha_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.senha_input.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.senha_input.setObjectName("senha_input")
+        self.verticalLayout_2.addWidget(self.senha_input)
+        self.confirmar_senha_label = QtWidgets.QLabel(self.register_frame)
+        self.confirmar_senha_label.setStyleSheet("color: #34495e; font-weight: bold;")
+        self.confirmar_senha_label.setObjectName("confirmar_senha_label")
+        self.verticalLayout_2.addWidget(self.confirmar_senha_label)
+        self.confirmar_senha_input = QtWidgets.QLineEdit(self.register_frame)
+        self.confirmar_senha_input.setMinimumSize(QtCore.QSize(0, 40))
+        self.confirmar_senha_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.confirmar_senha_input.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.confirmar_senha_input.setObjectName("confirmar_senha_input")
+        self.verticalLayout_2.addWidget(self.confirmar_senha_input)
+        self.register_btn = QtWidgets.QPushButton(self.register_frame)
+        self.register_btn.setMinimumSize(QtCore.QSize(0, 45))
+        self.register_btn.setStyleSheet("QPushButton {\n"
+"    background-color: #27ae60;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    border-radius: 5px;\n"
+"    font-size: 16px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #229954;\n"
+"}\n"
+"QPushButton:pressed {\n"
+"    background-color: #1e8449;\n"
+"}")
+        self.register_btn.setObjectName("register_btn")
+        self.verticalLayout_2.addWidget(self.register_btn)
+        self.back_btn = QtWidgets.QPushButton(self.register_frame)
+        self.back_btn.setMinimumSize(QtCore.QSize(0, 40))
+        self.back_btn.setStyleSheet("QPushButton {\n"
+"    background-color: transparent;\n"
+"    color: #e74c3c;\n"
+"    border: 2px solid #e74c3c;\n"
+"    border-radius: 5px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #e74c3c;\n"
+"    color: white;\n"
+"}")
+        self.back_btn.setObjectName("back_btn")
+        self.verticalLayout_2.addWidget(self.back_btn)
+        self.verticalLayout.addWidget(self.register_frame)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        RegisterWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(RegisterWindow)
+        QtCore.QMetaObject.connectSlotsByName(RegisterWindow)
+
+    def retranslateUi(self, RegisterWindow):
+        _translate = QtCore.QCoreApplication.translate
+        RegisterWindow.setWindowTitle(_translate("RegisterWindow", "Criar Nova Conta"))
+        self.title_label.setText(_translate("RegisterWindow", "Criar Nova Conta"))
+        self.nome_label.setText(_translate("RegisterWindow", "Nome Completo:"))
+        self.nome_input.setPlaceholderText(_translate("RegisterWindow", "Digite seu nome completo"))
+        self.email_label.setText(_translate("RegisterWindow", "Email:"))
+        self.email_input.setPlaceholderText(_translate("RegisterWindow", "Digite seu email"))
+        self.senha_label.setText(_translate("RegisterWindow", "Senha:"))
+        self.senha_input.setPlaceholderText(_translate("RegisterWindow", "Digite sua senha"))
+        self.confirmar_senha_label.setText(_translate("RegisterWindow", "Confirmar Senha:"))
+        self.confirmar_senha_input.setPlaceholderText(_translate("RegisterWindow", "Confirme sua senha"))
+        self.register_btn.setText(_translate("RegisterWindow", "Criar Conta"))
+        self.back_btn.setText(_translate("RegisterWindow", "Voltar ao Login"))
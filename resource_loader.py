@@ -0,0 +1,90 @@
+"""Registro sob demanda dos recursos (ícones) da interface
+
+Substitui o import do resource_rc.py nos formulários gerados: em vez de
+interpretar e registrar o literal de bytes de ~660 KB a cada execução,
+registra o arquivo binário resource.rcc (gerado por build_resources.py),
+que o Qt mapeia em memória e só lê quando um ícone é usado. Se o .rcc não
+existir, recorre ao resource_rc.py e, sem ele, lê os arquivos de icon/.
+
+Os formulários gerados por build_ui.py obtêm os ícones com icon()/pixmap(),
+que guardam em cache as instâncias já carregadas (o mesmo ícone aparece na
+barra lateral expandida e na recolhida) e resolvem o nome do arquivo de
+acordo com o backend: ':/icon/icon/<nome>' nos recursos registrados ou
+icon/<nome> no backend 'files'.
+"""
+import os
+
+from PyQt5.QtCore import QResource
+from PyQt5.QtGui import QIcon, QPixmap
+
+from config import APP_CONFIG
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RCC_PATH = os.path.join(BASE_DIR, 'resource.rcc')
+ICON_DIR = os.path.join(BASE_DIR, 'icon')
+RESOURCE_PREFIX = ':/icon/icon/'
+
+backend = None
+_icons = {}
+_pixmaps = {}
+
+def register_resources(mode=None):
+    """Registra os recursos uma única vez e retorna o backend usado
+    
+    mode: 'auto' (rcc, senão resource_rc, senão icon/), 'rcc', 'rc' ou
+    'files' (nada é registrado; os ícones são lidos de icon/).
+    """
+    global backend
+    if backend is not None:
+        return backend
+    
+    mode = mode or APP_CONFIG.get('resources', 'auto')
+    if mode in ('auto', 'rcc') and QResource.registerResource(RCC_PATH):
+        backend = 'rcc'
+    elif mode == 'files':
+        backend = 'files'
+    else:
+        try:
+            import resource_rc  # registra os recursos embutidos ao ser importado
+            backend = 'rc'
+        except ImportError:
+            if mode != 'auto':
+                raise
+            backend = 'files'
+    return backend
+
+def resource_path(name):
+    """Caminho do arquivo de ícone `name` de acordo com o backend registrado"""
+    if register_resources() == 'files':
+        return os.path.join(ICON_DIR, name)
+    return RESOURCE_PREFIX + name
+
+def pixmap(name):
+    """Retorna o QPixmap do arquivo `name` (ex.: 'Logo.png'), com cache"""
+    cached = _pixmaps.get(name)
+    if cached is None:
+        cached = _pixmaps[name] = QPixmap(resource_path(name))
+    return cached
+
+def icon(name, checked=None):
+    """Retorna o QIcon do arquivo `name` (ex.: 'home-4-32.ico'), com cache
+    
+    checked: arquivo opcional do estado marcado (QIcon.On), como nos botões
+    da barra lateral.
+    """
+    key = (name, checked)
+    cached = _icons.get(key)
+    if cached is None:
+        cached = QIcon()
+        cached.addPixmap(pixmap(name), QIcon.Normal, QIcon.Off)
+        if checked is not None:
+            cached.addPixmap(pixmap(checked), QIcon.Normal, QIcon.On)
+        _icons[key] = cached
+    return cached
+
+def clear_cache():
+    """Descarta os ícones em cache"""
+    _icons.clear()
+    _pixmaps.clear()
+
+register_resources()
@@ -0,0 +1,161 @@
+"""Busca textual em tickets e comentários
+
+Traduz o texto digitado para a sintaxe de busca de cada backend (FULLTEXT em
+modo booleano no MySQL, FTS5 no SQLite), monta a consulta que combina a
+relevância do título/descrição com a dos comentários de cada ticket e gera os
+trechos (snippets) com os termos destacados.
+
+Os termos são buscados como prefixo ("instal" encontra "instalação") e todos
+precisam aparecer no ticket ou no comentário. Maiúsculas e acentos são
+ignorados, como no collation padrão do MySQL.
+"""
+import html
+import re
+import unicodedata
+
+# Peso do título/descrição em relação aos comentários no cálculo da relevância
+TICKET_WEIGHT = 2.0
+
+# O InnoDB não indexa palavras com menos de 3 caracteres (innodb_ft_min_token_size);
+# no SQLite, letras isoladas casariam com quase todos os textos
+MIN_TERM_LENGTH = {'mysql': 3, 'sqlite': 2}
+
+# Candidatos considerados por fonte (tickets e comentários). Termos muito comuns
+# casam com centenas de milhares de comentários; calcular a relevância de todos
+# eles passaria do tempo de resposta esperado para a busca. No MySQL ficam os
+# mais relevantes (o InnoDB otimiza ORDER BY MATCH ... LIMIT); no SQLite, os
+# mais recentes, pois o FTS5 só interrompe a varredura na ordem do rowid. Os
+# filtros (cliente, status, datas) são aplicados dentro de cada fonte, antes
+# do limite, para que não se percam candidatos que passariam neles.
+SEARCH_CANDIDATES = 5000
+
+# Fontes de candidatos: título/descrição dos tickets e texto dos comentários
+TICKET_SOURCE = {
+    'mysql': """
+                (SELECT t.id AS ticket_id,
+                        MATCH(t.titulo, t.descricao) AGAINST (%s IN BOOLEAN MODE) * {weight} AS score,
+                        NULL AS comentario_id
+                 FROM tickets t
+                 WHERE MATCH(t.titulo, t.descricao) AGAINST (%s IN BOOLEAN MODE){filters}
+                 ORDER BY score DESC LIMIT {candidates})""",
+    'sqlite': """
+                SELECT * FROM (
+                    SELECT tickets_fts.rowid AS ticket_id,
+                           -bm25(tickets_fts) * {weight} AS score,
+                           NULL AS comentario_id
+                    FROM tickets_fts{ticket_join}
+                    WHERE tickets_fts MATCH %s{filters}
+                    ORDER BY tickets_fts.rowid DESC LIMIT {candidates}
+                )""",
+}
+
+COMMENT_SOURCE = {
+    'mysql': """
+                (SELECT c.ticket_id, MATCH(c.texto) AGAINST (%s IN BOOLEAN MODE) AS score,
+                        c.id AS comentario_id
+                 FROM comentarios c{comment_join}
+                 WHERE MATCH(c.texto) AGAINST (%s IN BOOLEAN MODE){filters}
+                 ORDER BY score DESC LIMIT {candidates})""",
+    'sqlite': """
+                SELECT * FROM (
+                    SELECT c.ticket_id, -bm25(comentarios_fts) AS score, c.id AS comentario_id
+                    FROM comentarios_fts
+                    JOIN comentarios c ON c.id = comentarios_fts.rowid{comment_join}
+                    WHERE comentarios_fts MATCH %s{filters}
+                    ORDER BY comentarios_fts.rowid DESC LIMIT {candidates}
+                )""",
+}
+
+SEARCH_SQL = """
+        SELECT t.*, u.nome as cliente_nome, r.score, r.comentario_id
+        FROM (
+            SELECT ticket_id, SUM(score) AS score, MAX(comentario_id) AS comentario_id FROM ({sources}
+            ) matches
+            GROUP BY ticket_id
+        ) r
+        JOIN tickets t ON t.id = r.ticket_id
+        JOIN usuarios u ON t.cliente_id = u.id
+"""
+
+class _FoldTable(dict):
+    """Tabela de str.translate que calcula cada caractere na primeira vez que aparece"""
+    
+    def __missing__(self, code):
+        char = chr(code)
+        folded = unicodedata.normalize('NFD', char)[0].lower()[:1] or char
+        self[code] = folded
+        return folded
+
+_FOLD_TABLE = _FoldTable()
+
+def fold(text):
+    """Minúsculas e sem acentos, preservando o tamanho do texto"""
+    return text.translate(_FOLD_TABLE)
+
+def parse_terms(query, dialect='mysql'):
+    """Termos de busca do texto digitado (minúsculos, sem acentos, sem repetição)"""
+    minimum = MIN_TERM_LENGTH[dialect]
+    terms = re.findall(r'\w+', fold(query))
+    return list(dict.fromkeys(term for term in terms if len(term) >= minimum))
+
+def match_expression(terms, dialect='mysql'):
+    """Expressão de busca do backend exigindo todos os termos como prefixo"""
+    if dialect == 'sqlite':
+        return ' '.join(f'"{term}"*' for term in terms)
+    return ' '.join(f'+{term}*' for term in terms)
+
+def search_query(dialect, expression, conditions=(), condition_params=(), limit=20, comments=True):
+    """Retorna (sql, params) da busca, com filtros adicionais sobre t.*
+    
+    As condições entram em cada fonte de candidatos, juntando tickets (t) aos
+    comentários só quando há filtros. Com comments=False a busca considera
+    apenas o título e a descrição.
+    """
+    sources = [TICKET_SOURCE[dialect]] + ([COMMENT_SOURCE[dialect]] if comments else [])
+    values = {
+        'weight': TICKET_WEIGHT, 'candidates': SEARCH_CANDIDATES,
+        'filters': ''.join(f" AND {condition}" for condition in conditions),
+        'ticket_join': " JOIN tickets t ON t.id = tickets_fts.rowid" if conditions else '',
+        'comment_join': " JOIN tickets t ON t.id = c.ticket_id" if conditions else '',
+    }
+    sql = SEARCH_SQL.format(sources="\n                UNION ALL".join(
+        source.format(**values) for source in sources))
+    
+    # Cada fonte recebe a expressão de busca (duas vezes no MySQL) e os filtros
+    source_params = [expression] * (2 if dialect == 'mysql' else 1) + list(condition_params)
+    params = source_params * len(sources)
+    sql += " ORDER BY r.score DESC, t.id DESC LIMIT %s"
+    params.append(int(limit))
+    return sql, tuple(params)
+
+def snippet(text, terms, width=160, start_tag='<b>', end_tag='</b>'):
+    """Trecho em HTML ao redor da primeira ocorrência dos termos, com eles destacados
+    
+    O texto é escapado; apenas as marcações de destaque são HTML. Retorna None
+    se nenhum termo aparece no texto.
+    """
+    if not text or not terms:
+        return None
+    folded = fold(text)
+    pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, terms)) + r')\w*')
+    first = pattern.search(folded)
+    if first is None:
+        return None
+    
+    start = max(0, first.start() - width // 3)
+    if start:
+        # Começa no início de uma palavra
+        space = text.find(' ', start)
+        start = space + 1 if 0 <= space < first.start() else start
+    end = min(len(text), start + width)
+    
+    parts = ['…' if start else '']
+    position = start
+    for match in pattern.finditer(folded, start, end):
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(start_tag + html.escape(text[match.start():match.end()]) + end_tag)
+        position = match.end()
+    parts.append(html.escape(text[position:end]))
+    if end < len(text):
+        parts.append('…')
+    return ''.join(parts)
@@ -0,0 +1,173 @@
+"""Sessão local do usuário ("Manter conectado")
+
+Quando o usuário marca "Manter conectado" no login, a aplicação grava em
+SESSION_CONFIG['directory'] um token assinado com validade de
+SESSION_CONFIG['days'] dias. Nas próximas execuções o token é conferido com uma
+única consulta pela chave primária do usuário e a janela principal abre
+direto, sem a verificação (propositalmente lenta) da senha.
+
+A assinatura é um HMAC-SHA256, com uma chave aleatória guardada na mesma
+pasta, de "<id do usuário>:<validade>:<hash da senha>". Trocar a senha,
+apagar o usuário ou apagar a chave invalida todas as sessões gravadas. Os
+arquivos são criados com permissão 0600 (apenas o dono).
+
+A sessão também guarda os últimos tickets abertos pelo usuário, usados para
+preencher o cache de consultas antes da janela principal aparecer.
+"""
+import hashlib
+import hmac
+import json
+import os
+import time
+
+from config import APP_CONFIG, SESSION_CONFIG
+
+KEY_SIZE = 32
+SESSION_FILE = 'session.json'
+KEY_FILE = 'session.key'
+
+
+class SessionStore:
+    """Token de sessão e tickets recentes gravados localmente"""
+    
+    def __init__(self, config=None):
+        self.config = config or SESSION_CONFIG
+        self.directory = os.path.expanduser(self.config['directory'])
+        self.path = os.path.join(self.directory, SESSION_FILE)
+        self.key_path = os.path.join(self.directory, KEY_FILE)
+    
+    @property
+    def enabled(self):
+        return self.config['enabled']
+    
+    def exists(self):
+        """True se há uma sessão gravada (ainda não validada)"""
+        return self.enabled and os.path.exists(self.path)
+    
+    def save(self, user):
+        """Grava a sessão do usuário, mantendo os tickets recentes se for o mesmo"""
+        if not self.enabled:
+            return
+        previous = self._read() or {}
+        expires = int(time.time()) + self.config['days'] * 86400
+        data = {
+            'user_id': user['id'],
+            'expires': expires,
+            'signature': self._sign(user['id'], expires, user['senha'], create_key=True),
+            'recent_tickets': (previous.get('recent_tickets', [])
+                               if previous.get('user_id') == user['id'] else []),
+        }
+        self._write(self.path, json.dumps(data).encode('utf-8'))
+    
+    def resume(self, db):
+        """Valida a sessão gravada e retorna o usuário, ou None
+        
+        Sessões vencidas ou com assinatura inválida são apagadas.
+        """
+        data = self._read()
+        if data is None:
+            return None
+        try:
+            user_id, expires = int(data['user_id']), int(data['expires'])
+            signature = str(data['signature'])
+        except (KeyError, TypeError, ValueError):
+            self.clear()
+            return None
+        if expires < time.time():
+            self.clear()
+            return None
+        
+        user = db.get_user(user_id)
+        if user is None:
+            # Usuário apagado ou erro de conexão: volta ao login sem apagar a
+            # sessão, que é substituída no próximo login
+            return None
+        expected = self._sign(user_id, expires, user['senha'])
+        if expected is None or not hmac.compare_digest(expected, signature):
+            self.clear()
+            return None
+        return user
+    
+    def clear(self):
+        """Apaga a sessão gravada (logout)"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Erro ao apagar a sessão: {e}")
+    
+    def recent_tickets(self):
+        """Ids dos últimos tickets abertos, do mais recente para o mais antigo"""
+        data = self._read() or {}
+        return list(data.get('recent_tickets', []))
+    
+    def remember_ticket(self, ticket_id):
+        """Coloca o ticket no início da lista de recentes da sessão gravada"""
+        data = self._read()
+        if data is None:
+            return
+        recent = [ticket_id] + [other for other in data.get('recent_tickets', []) if other != ticket_id]
+        data['recent_tickets'] = recent[:self.config['recent_tickets']]
+        self._write(self.path, json.dumps(data).encode('utf-8'))
+    
+    def warm_cache(self, db):
+        """Preenche o cache de consultas com o que a janela principal pede ao abrir
+        
+        As chamadas usam os mesmos argumentos da janela, então as consultas
+        dela são respondidas pelo cache.
+        """
+        db.get_ticket_stats()
+        db.get_recent_tickets(limit=5)
+        for ticket_id in self.recent_tickets():
+            db.get_comments_page(ticket_id, limit=APP_CONFIG['comments_page_size'])
+    
+    def _sign(self, user_id, expires, password_hash, create_key=False):
+        key = self._key(create_key)
+        if key is None:
+            return None
+        message = f"{user_id}:{expires}:{password_hash}".encode('utf-8')
+        return hmac.new(key, message, hashlib.sha256).hexdigest()
+    
+    def _key(self, create=False):
+        """Chave das assinaturas; gerada na primeira sessão gravada"""
+        try:
+            with open(self.key_path, 'rb') as file:
+                key = file.read()
+            if len(key) == KEY_SIZE:
+                return key
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Erro ao ler a chave da sessão: {e}")
+            return None
+        if not create:
+            return None
+        key = os.urandom(KEY_SIZE)
+        self._write(self.key_path, key)
+        return key
+    
+    def _read(self):
+        if not self.enabled:
+            return None
+        try:
+            with open(self.path, 'rb') as file:
+                data = json.loads(file.read())
+            return data if isinstance(data, dict) else None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Erro ao ler a sessão: {e}")
+            return None
+    
+    def _write(self, path, content):
+        """Grava o arquivo só com permissão do dono, trocando o anterior de uma vez"""
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            temporary = path + '.tmp'
+            descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(content)
+            os.replace(temporary, path)
+        except OSError as e:
+            print(f"Erro ao gravar a sessão: {e}")
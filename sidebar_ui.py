@@ -2,7 +2,7 @@
 
 # Form implementation generated from reading ui file 'sidebar.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.11
+# Created by: PyQt5 UI code generator 5.15.9
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -35,7 +35,7 @@ class Ui_MainWindow(object):
         self.logo_label_1.setMaximumSize(QtCore.QSize(50, 50))
         self.logo_label_1.setStyleSheet("background-color: #5D6166")
         self.logo_label_1.setText("")
-        self.logo_label_1.setPixmap(QtGui.QPixmap(":/icon/icon/Logo.png"))
+        self.logo_label_1.setPixmap(resource_loader.pixmap("Logo.png"))
         self.logo_label_1.setScaledContents(True)
         self.logo_label_1.setObjectName("logo_label_1")
         self.horizontalLayout_3.addWidget(self.logo_label_1)
@@ -45,9 +45,7 @@ class Ui_MainWindow(object):
         self.verticalLayout.setObjectName("verticalLayout")
         self.home_btn_1 = QtWidgets.QPushButton(self.icon_only_widget)
         self.home_btn_1.setText("")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(":/icon/icon/home-4-32.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon.addPixmap(QtGui.QPixmap(":/icon/icon/home-4-48.ico"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon = resource_loader.icon("home-4-32.ico", "home-4-48.ico")
         self.home_btn_1.setIcon(icon)
         self.home_btn_1.setIconSize(QtCore.QSize(20, 20))
         self.home_btn_1.setCheckable(True)
@@ -56,9 +54,7 @@ class Ui_MainWindow(object):
         self.verticalLayout.addWidget(self.home_btn_1)
         self.dashborad_btn_1 = QtWidgets.QPushButton(self.icon_only_widget)
         self.dashborad_btn_1.setText("")
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap(":/icon/icon/dashboard-5-32.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap(":/icon/icon/dashboard-5-48.ico"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon1 = resource_loader.icon("dashboard-5-32.ico", "dashboard-5-48.ico")
         self.dashborad_btn_1.setIcon(icon1)
         self.dashborad_btn_1.setIconSize(QtCore.QSize(20, 20))
         self.dashborad_btn_1.setCheckable(True)
@@ -67,9 +63,7 @@ class Ui_MainWindow(object):
         self.verticalLayout.addWidget(self.dashborad_btn_1)
         self.orders_btn_1 = QtWidgets.QPushButton(self.icon_only_widget)
         self.orders_btn_1.setText("")
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap(":/icon/icon/activity-feed-32.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon2.addPixmap(QtGui.QPixmap(":/icon/icon/activity-feed-48.ico"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon2 = resource_loader.icon("activity-feed-32.ico", "activity-feed-48.ico")
         self.orders_btn_1.setIcon(icon2)
         self.orders_btn_1.setIconSize(QtCore.QSize(20, 20))
         self.orders_btn_1.setCheckable(True)
@@ -78,9 +72,7 @@ class Ui_MainWindow(object):
         self.verticalLayout.addWidget(self.orders_btn_1)
         self.customers_btn_1 = QtWidgets.QPushButton(self.icon_only_widget)
         self.customers_btn_1.setText("")
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap(":/icon/icon/group-32.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon3.addPixmap(QtGui.QPixmap(":/icon/icon/group-48.ico"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon3 = resource_loader.icon("group-32.ico", "group-48.ico")
         self.customers_btn_1.setIcon(icon3)
         self.customers_btn_1.setIconSize(QtCore.QSize(20, 20))
         self.customers_btn_1.setCheckable(True)
@@ -93,8 +85,7 @@ class Ui_MainWindow(object):
         self.exit_btn_1 = QtWidgets.QPushButton(self.icon_only_widget)
         self.exit_btn_1.setStyleSheet("background-color: #5D6166")
         self.exit_btn_1.setText("")
-        icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap(":/icon/icon/close-window-64.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon4 = resource_loader.icon("close-window-64.ico")
         self.exit_btn_1.setIcon(icon4)
         self.exit_btn_1.setIconSize(QtCore.QSize(20, 20))
         self.exit_btn_1.setObjectName("exit_btn_1")
@@ -116,8 +107,7 @@ class Ui_MainWindow(object):
         self.horizontalLayout_4.setObjectName("horizontalLayout_4")
         self.change_btn = QtWidgets.QPushButton(self.widget)
         self.change_btn.setText("")
-        icon5 = QtGui.QIcon()
-        icon5.addPixmap(QtGui.QPixmap(":/icon/icon/menu-4-32.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon5 = resource_loader.icon("menu-4-32.ico")
         self.change_btn.setIcon(icon5)
         self.change_btn.setIconSize(QtCore.QSize(14, 14))
         self.change_btn.setCheckable(True)
@@ -133,8 +123,7 @@ class Ui_MainWindow(object):
         self.horizontalLayout.addWidget(self.search_input)
         self.search_btn = QtWidgets.QPushButton(self.widget)
         self.search_btn.setText("")
-        icon6 = QtGui.QIcon()
-        icon6.addPixmap(QtGui.QPixmap(":/icon/icon/search-13-48.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon6 = resource_loader.icon("search-13-48.ico")
         self.search_btn.setIcon(icon6)
         self.search_btn.setObjectName("search_btn")
         self.horizontalLayout.addWidget(self.search_btn)
@@ -143,8 +132,7 @@ class Ui_MainWindow(object):
         self.horizontalLayout_4.addItem(spacerItem2)
         self.user_btn = QtWidgets.QPushButton(self.widget)
         self.user_btn.setText("")
-        icon7 = QtGui.QIcon()
-        icon7.addPixmap(QtGui.QPixmap(":/icon/icon/user-48.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon7 = resource_loader.icon("user-48.ico")
         self.user_btn.setIcon(icon7)
         self.user_btn.setObjectName("user_btn")
         self.horizontalLayout_4.addWidget(self.user_btn)
@@ -252,7 +240,7 @@ class Ui_MainWindow(object):
         self.logo_label_2.setMinimumSize(QtCore.QSize(40, 40))
         self.logo_label_2.setMaximumSize(QtCore.QSize(40, 40))
         self.logo_label_2.setText("")
-        self.logo_label_2.setPixmap(QtGui.QPixmap(":/icon/icon/Logo.png"))
+        self.logo_label_2.setPixmap(resource_loader.pixmap("Logo.png"))
         self.logo_label_2.setScaledContents(True)
         self.logo_label_2.setObjectName("logo_label_2")
         self.horizontalLayout_2.addWidget(self.logo_label_2)
@@ -338,4 +326,4 @@ class Ui_MainWindow(object):
         self.orders_btn_2.setText(_translate("MainWindow", "Ticket"))
         self.customers_btn_2.setText(_translate("MainWindow", "Usuários"))
         self.exit_btn_2.setText(_translate("MainWindow", "Exit"))
-import resource_rc
+import resource_loader
@@ -0,0 +1,26 @@
+"""Medição do tempo de inicialização
+
+Ative com a variável de ambiente TICKETS_STARTUP_TIMING=1 (ou o argumento
+--startup-timing em tickets_app.py) para ver no terminal quanto tempo cada
+etapa levou até a primeira janela aparecer.
+"""
+import os
+import time
+
+_START = time.perf_counter()
+_marks = []
+enabled = os.environ.get('TICKETS_STARTUP_TIMING') == '1'
+
+def mark(label):
+    """Registra o instante em que uma etapa terminou"""
+    _marks.append((label, time.perf_counter()))
+
+def report():
+    """Imprime o tempo de cada etapa desde o início do processo"""
+    if not enabled:
+        return
+    print("=== Tempo de inicialização ===")
+    previous = _START
+    for label, moment in _marks:
+        print(f"{label:<40} {(moment - previous) * 1000:8.1f} ms  (total {(moment - _START) * 1000:8.1f} ms)")
+        previous = moment
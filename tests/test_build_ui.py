@@ -0,0 +1,44 @@
+"""Formulários gerados carregam os ícones por resource_loader"""
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.uic import compileUi
+
+import build_ui
+from ui_loader import BASE_DIR
+
+
+class UseResourceLoaderTest(unittest.TestCase):
+    
+    def test_icon_with_checked_state(self):
+        code = (
+            '        icon = QtGui.QIcon()\n'
+            '        icon.addPixmap(QtGui.QPixmap(":/icon/icon/home-4-32.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)\n'
+            '        icon.addPixmap(QtGui.QPixmap(":/icon/icon/home-4-48.ico"), QtGui.QIcon.Normal, QtGui.QIcon.On)\n'
+            '        self.home_btn.setIcon(icon)\n'
+        )
+        self.assertEqual(build_ui.use_resource_loader(code), (
+            '        icon = resource_loader.icon("home-4-32.ico", "home-4-48.ico")\n'
+            '        self.home_btn.setIcon(icon)\n'
+        ))
+    
+    def test_pixmap_and_import(self):
+        code = '        label.setPixmap(QtGui.QPixmap(":/icon/icon/Logo.png"))\nimport resource_rc\n'
+        self.assertEqual(build_ui.use_resource_loader(code),
+                         '        label.setPixmap(resource_loader.pixmap("Logo.png"))\nimport resource_loader\n')
+    
+    def test_sidebar_has_no_resource_paths(self):
+        output = io.StringIO()
+        compileUi(os.path.join(BASE_DIR, 'sidebar.ui'), output, from_imports=False)
+        code = build_ui.use_resource_loader(output.getvalue())
+        self.assertNotIn(':/icon', code)
+        self.assertNotIn('resource_rc', code)
+        self.assertIn('import resource_loader', code)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Importação de comentários em lotes (import_comments) sobre o backend SQLite"""
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseManager
+
+
+class ImportCommentsTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(db_config={'backend': 'sqlite'},
+                                  sqlite_config={'path': os.path.join(self.directory.name, 'importacao.db')},
+                                  cache_config={'enabled': False})
+        self.db.create_user("Cliente", "cliente@exemplo.com", "senha", "cliente")
+        self.user = self.db.authenticate_user("cliente@exemplo.com", "senha")
+        self.ticket_id = self.db.create_ticket("Impressora parada", "Sem papel", self.user['id'])
+    
+    def tearDown(self):
+        self.db.close()
+        self.directory.cleanup()
+    
+    def comments(self, count):
+        return ((self.ticket_id, self.user['id'], f"comentário {n}") for n in range(count))
+    
+    def saved(self):
+        return len(self.db.get_comments(self.ticket_id))
+    
+    def test_last_full_batch_is_committed(self):
+        # 4 registros em lotes de 2: o último lote está cheio e não cai no commit_every
+        batches = list(self.db.import_comments(self.comments(4), batch_size=2, commit_every=3))
+        self.assertEqual([batch['committed'] for batch in batches], [False, True])
+        self.assertEqual(batches[-1]['total'], 4)
+        self.assertEqual(self.saved(), 4)
+    
+    def test_partial_last_batch_and_rejections(self):
+        records = list(self.comments(3)) + [(self.ticket_id, self.user['id'], "  ")]
+        batches = list(self.db.import_comments(records, batch_size=2, commit_every=5))
+        self.assertEqual([batch['inserted'] for batch in batches], [2, 1])
+        self.assertEqual(batches[-1]['rejected'], [(4, "comentário vazio")])
+        self.assertTrue(batches[-1]['committed'])
+        self.assertEqual(self.saved(), 3)
+    
+    def test_empty_input_yields_nothing(self):
+        self.assertEqual(list(self.db.import_comments([], batch_size=2)), [])
+    
+    def test_database_error_reaches_the_caller(self):
+        insert_batch = self.db._insert_batch
+        calls = []
+        
+        def failing(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 3:
+                raise sqlite3.OperationalError("disco cheio")
+            return insert_batch(*args, **kwargs)
+        
+        batches = []
+        with mock.patch.object(self.db, '_insert_batch', side_effect=failing):
+            with self.assertRaises(sqlite3.OperationalError):
+                for batch in self.db.import_comments(self.comments(6), batch_size=2, commit_every=1):
+                    batches.append(batch)
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(self.saved(), 4)
+    
+    def test_add_comments_reports_inserted_before_error(self):
+        insert_batch = self.db._insert_batch
+        calls = []
+        
+        def failing(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise sqlite3.OperationalError("disco cheio")
+            return insert_batch(*args, **kwargs)
+        
+        with mock.patch.object(self.db, '_insert_batch', side_effect=failing), \
+                mock.patch('builtins.print') as printed:
+            result = self.db.add_comments(self.comments(4), batch_size=2)
+        self.assertEqual(result['inserted'], 2)
+        printed.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Busca textual com filtros (cliente, status) sobre o backend SQLite"""
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search
+from database import DatabaseManager
+
+
+class FilteredSearchTest(unittest.TestCase):
+    """Filtros precisam valer antes do limite de candidatos de cada fonte"""
+    
+    CANDIDATES = 5
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(db_config={'backend': 'sqlite'},
+                                  sqlite_config={'path': os.path.join(self.directory.name, 'busca.db')},
+                                  cache_config={'enabled': False})
+        self.db.create_user("Outro", "outro@exemplo.com", "senha", "cliente")
+        self.db.create_user("Cliente", "cliente@exemplo.com", "senha", "cliente")
+        other = self.db.authenticate_user("outro@exemplo.com", "senha")
+        self.client = self.db.authenticate_user("cliente@exemplo.com", "senha")
+        
+        # Os tickets do cliente são os mais antigos: ficam fora dos candidatos
+        # mais recentes de um termo que aparece em muitos tickets
+        tickets = [{'titulo': f"Impressora {n}", 'descricao': "impressora parada",
+                    'cliente_id': self.client['id'], 'status': 'fechado'} for n in range(3)]
+        tickets += [{'titulo': f"Impressora {n}", 'descricao': "impressora parada",
+                     'cliente_id': other['id']} for n in range(self.CANDIDATES * 4)]
+        self.db.bulk_create_tickets(tickets)
+        
+        first = self.db.get_tickets(user_id=self.client['id'])[-1]
+        comments = [(first['id'], other['id'], "impressora voltou a falhar")]
+        comments += [(ticket['id'], other['id'], "impressora ok")
+                     for ticket in self.db.get_tickets(user_id=other['id'])]
+        self.db.add_comments(comments)
+        
+        patcher = mock.patch.object(search, 'SEARCH_CANDIDATES', self.CANDIDATES)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        self.db.close()
+        self.directory.cleanup()
+    
+    def test_client_filter_applies_before_candidate_limit(self):
+        results = self.db.search_tickets("impressora", filters={'user_id': self.client['id']})
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(ticket['cliente_id'] == self.client['id'] for ticket in results))
+    
+    def test_status_filter_applies_before_candidate_limit(self):
+        results = self.db.search_tickets("impressora", filters={'status': 'fechado'})
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(ticket['status'] == 'fechado' for ticket in results))
+    
+    def test_comment_matches_are_filtered_too(self):
+        results = self.db.search_tickets("falhar", filters={'user_id': self.client['id']})
+        self.assertEqual(len(results), 1)
+        self.assertIn("<b>falhar</b>", results[0]['snippet'])
+    
+    def test_unfiltered_search_keeps_candidate_limit(self):
+        results = self.db.search_tickets("impressora", limit=100)
+        self.assertLessEqual(len(results), self.CANDIDATES * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Filtro local (TicketIndex) com o mesmo resultado da busca do servidor"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseManager
+from ticket_index import TicketIndex
+
+
+class TicketIndexSearchTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tickets = [
+            {'titulo': "Impressora parada", 'descricao': "Sem papel", 'status': 'aberto', 'cliente_id': 1},
+            {'titulo': "Erro no login", 'descricao': "Senha não aceita", 'status': 'fechado', 'cliente_id': 2},
+            {'titulo': "Instalação do ERP", 'descricao': "Novo módulo", 'status': 'aberto', 'cliente_id': 2},
+        ]
+    
+    def index(self, dialect='sqlite'):
+        index = TicketIndex(dialect=dialect)
+        index.add(self.tickets, 0)
+        return index
+    
+    def test_prefix_terms_and_status(self):
+        index = self.index()
+        self.assertEqual(index.search(text="instal"), [2])
+        self.assertEqual(index.search(text="er", status='aberto'), [2])
+        self.assertEqual(index.search(status='aberto'), [0, 2])
+    
+    def test_no_criteria_returns_all_rows(self):
+        self.assertIsNone(self.index().search())
+        self.assertIsNone(self.index().search(text=''))
+    
+    def test_short_terms_match_nothing(self):
+        # search_tickets retorna [] quando o texto não tem termos válidos
+        index = self.index()
+        self.assertEqual(index.search(text="e"), [])
+        self.assertEqual(index.search(text="e", status='aberto'), [])
+    
+    def test_minimum_length_follows_dialect(self):
+        self.assertEqual(self.index('sqlite').search(text="er"), [1, 2])
+        self.assertEqual(self.index('mysql').search(text="er"), [])
+        self.assertEqual(self.index('mysql').search(text="er login"), [1])
+
+
+
+class LocalAndServerSearchTest(unittest.TestCase):
+    """O mesmo texto encontra os mesmos tickets no índice local e no servidor"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(db_config={'backend': 'sqlite'},
+                                  sqlite_config={'path': os.path.join(self.directory.name, 'filtro.db')},
+                                  cache_config={'enabled': False})
+        self.db.create_user("Cliente", "cliente@exemplo.com", "senha", "cliente")
+        client = self.db.authenticate_user("cliente@exemplo.com", "senha")
+        self.db.bulk_create_tickets([
+            {'titulo': "Impressora parada", 'descricao': "Sem papel na bandeja",
+             'cliente_id': client['id']},
+            {'titulo': "Instalação do ERP", 'descricao': "Módulo fiscal não abre",
+             'cliente_id': client['id'], 'status': 'fechado'},
+            {'titulo': "Erro no login", 'descricao': "Senha não aceita após a instalação",
+             'cliente_id': client['id']},
+            {'titulo': "Monitor piscando", 'descricao': "Cabo trocado",
+             'cliente_id': client['id']},
+        ])
+        self.tickets = self.db.get_tickets()
+        # Termos que só aparecem nos comentários não entram no filtro da lista
+        self.db.add_comments([(ticket['id'], client['id'], "impressora e instalação revisadas")
+                              for ticket in self.tickets])
+        
+        self.index = TicketIndex(dialect=self.db.dialect)
+        self.index.add(self.tickets, 0)
+    
+    def tearDown(self):
+        self.db.close()
+        self.directory.cleanup()
+    
+    def local_ids(self, text, status=None):
+        rows = self.index.search(text=text, status=status)
+        return sorted(self.tickets[row]['id'] for row in rows)
+    
+    def server_ids(self, text, status=None):
+        results = self.db.search_tickets(text, filters={'status': status}, limit=100, comments=False)
+        return sorted(ticket['id'] for ticket in results)
+    
+    def test_same_tickets_in_both_paths(self):
+        for text, status in [("impressora", None), ("instal", None), ("INSTALACAO", None),
+                             ("instal", 'fechado'), ("erro senha", None), ("cabo", 'fechado'),
+                             ("revisadas", None), ("e", None)]:
+            with self.subTest(text=text, status=status):
+                self.assertEqual(self.local_ids(text, status), self.server_ids(text, status))
+    
+    def test_comments_still_searched_by_default(self):
+        self.assertEqual(len(self.db.search_tickets("revisadas", limit=100)), len(self.tickets))
+
+
+if __name__ == '__main__':
+    unittest.main()
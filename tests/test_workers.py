@@ -0,0 +1,75 @@
+"""QueryRunner: canais, cancelamento e entrega dos resultados"""
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication
+
+from workers import QueryRunner
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+class QueryRunnerTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.runner = QueryRunner(max_threads=2)
+        self.results = []
+    
+    def tearDown(self):
+        self.runner.wait()
+        app.processEvents()
+    
+    def deliver(self):
+        """Aguarda as tarefas e entrega os sinais enfileirados"""
+        self.runner.wait()
+        app.processEvents()
+    
+    def test_same_channel_after_task_ran(self):
+        # A primeira tarefa já rodou, mas o sinal finished ainda está na fila:
+        # cancelar não pode tocar no QRunnable já executado
+        self.runner.run('canal', lambda: 1, on_result=self.results.append)
+        self.runner.wait()
+        self.runner.run('canal', lambda: 2, on_result=self.results.append)
+        self.deliver()
+        self.assertEqual(self.results, [2])
+        self.assertFalse(self.runner.busy)
+    
+    def test_cancel_after_task_ran(self):
+        self.runner.run('canal', lambda: 1, on_result=self.results.append)
+        self.runner.wait()
+        self.runner.cancel('canal')
+        self.deliver()
+        self.assertEqual(self.results, [])
+        self.assertFalse(self.runner.busy)
+    
+    def test_queued_task_is_not_run(self):
+        # Com as duas threads ocupadas, a primeira tarefa do canal fica na fila
+        # e é retirada dela pela segunda
+        self.runner.run('lento 1', time.sleep, 0.1)
+        self.runner.run('lento 2', time.sleep, 0.1)
+        self.runner.run('canal', self.results.append, 1)
+        self.runner.run('canal', lambda: 2, on_result=self.results.append)
+        self.deliver()
+        self.assertEqual(self.results, [2])
+        self.assertFalse(self.runner.busy)
+    
+    def test_channels_are_independent(self):
+        self.runner.run('a', lambda: 'a', on_result=self.results.append)
+        self.runner.run('b', lambda: 'b', on_result=self.results.append)
+        self.deliver()
+        self.assertEqual(sorted(self.results), ['a', 'b'])
+    
+    def test_error_goes_to_on_error(self):
+        errors = []
+        self.runner.run('canal', lambda: 1 / 0, on_result=self.results.append, on_error=errors.append)
+        self.deliver()
+        self.assertEqual(self.results, [])
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ticket_details.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_TicketDetailsDialog(object):
+    def setupUi(self, TicketDetailsDialog):
+        TicketDetailsDialog.setObjectName("TicketDetailsDialog")
+        TicketDetailsDialog.resize(600, 650)
+        TicketDetailsDialog.setStyleSheet("background-color: #f0f0f0;")
+        self.verticalLayout = QtWidgets.QVBoxLayout(TicketDetailsDialog)
+        self.verticalLayout.setContentsMargins(20, 20, 20, 20)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.titulo_label = QtWidgets.QLabel(TicketDetailsDialog)
+        self.titulo_label.setStyleSheet("color: #2c3e50; font-size: 18px; font-weight: bold;")
+        self.titulo_label.setWordWrap(True)
+        self.titulo_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        self.titulo_label.setObjectName("titulo_label")
+        self.verticalLayout.addWidget(self.titulo_label)
+        self.info_label = QtWidgets.QLabel(TicketDetailsDialog)
+        self.info_label.setStyleSheet("color: #7f8c8d;")
+        self.info_label.setObjectName("info_label")
+        self.verticalLayout.addWidget(self.info_label)
+        self.descricao_text = QtWidgets.QPlainTextEdit(TicketDetailsDialog)
+        self.descricao_text.setMaximumSize(QtCore.QSize(16777215, 150))
+        self.descricao_text.setStyleSheet("QPlainTextEdit {\n"
+"    background-color: white;\n"
+"    border: 1px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 6px;\n"
+"}")
+        self.descricao_text.setReadOnly(True)
+        self.descricao_text.setObjectName("descricao_text")
+        self.verticalLayout.addWidget(self.descricao_text)
+        self.comments_label = QtWidgets.QLabel(TicketDetailsDialog)
+        self.comments_label.setStyleSheet("color: #34495e; font-weight: bold;")
+        self.comments_label.setObjectName("comments_label")
+        self.verticalLayout.addWidget(self.comments_label)
+        self.comments_list = QtWidgets.QListView(TicketDetailsDialog)
+        self.comments_list.setStyleSheet("QListView {\n"
+"    background-color: white;\n"
+"    border: 1px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"}\n"
+"QListView::item {\n"
+"    padding: 6px;\n"
+"    border-bottom: 1px solid #ecf0f1;\n"
+"}")
+        self.comments_list.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.comments_list.setWordWrap(True)
+        self.comments_list.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.comments_list.setObjectName("comments_list")
+        self.verticalLayout.addWidget(self.comments_list)
+        self.footerLayout = QtWidgets.QHBoxLayout()
+        self.footerLayout.setObjectName("footerLayout")
+        self.comments_status_label = QtWidgets.QLabel(TicketDetailsDialog)
+        self.comments_status_label.setStyleSheet("color: #7f8c8d;")
+        self.comments_status_label.setObjectName("comments_status_label")
+        self.footerLayout.addWidget(self.comments_status_label)
+        self.close_btn = QtWidgets.QPushButton(TicketDetailsDialog)
+        self.close_btn.setMinimumSize(QtCore.QSize(100, 35))
+        self.close_btn.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.close_btn.setStyleSheet("QPushButton {\n"
+"    background-color: #3498db;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    border-radius: 5px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #2980b9;\n"
+"}")
+        self.close_btn.setObjectName("close_btn")
+        self.footerLayout.addWidget(self.close_btn)
+        self.verticalLayout.addLayout(self.footerLayout)
+
+        self.retranslateUi(TicketDetailsDialog)
+        QtCore.QMetaObject.connectSlotsByName(TicketDetailsDialog)
+
+    def retranslateUi(self, TicketDetailsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        TicketDetailsDialog.setWindowTitle(_translate("TicketDetailsDialog", "Detalhes do Ticket"))
+        self.comments_label.setText(_translate("TicketDetailsDialog", "Comentários"))
+        self.close_btn.setText(_translate("TicketDetailsDialog", "Fechar"))
@@ -0,0 +1,126 @@
+"""Índice invertido em memória dos tickets carregados na interface
+
+Permite filtrar localmente, sem consultar o banco, os tickets já carregados em
+um TicketsTableModel: cada palavra do título e da descrição, cada status e
+cada cliente aponta para a lista ordenada (array de inteiros de 4 bytes) das
+linhas do modelo em que aparece. O índice é atualizado à medida que as
+páginas chegam, então uma busca só cruza listas já prontas.
+
+As palavras são comparadas como em search.py: sem maiúsculas nem acentos e
+como prefixo ("instal" encontra "instalação"). Quando o tamanho estimado do
+índice passa de max_bytes ele é descartado e marcado como estourado; a
+interface volta a usar a busca do servidor até a próxima recarga da lista.
+"""
+import re
+import sys
+from array import array
+from bisect import bisect_left
+
+import search
+
+# Custo aproximado, em bytes, de uma nova entrada nos dicionários de listas
+# (chave no dicionário + cabeçalho do array), além do texto da palavra
+ENTRY_OVERHEAD = 160
+POSTING_SIZE = array('I').itemsize
+
+class TicketIndex:
+    """Listas invertidas de palavras, status e clientes por linha do modelo"""
+    
+    def __init__(self, max_bytes=64 * 1024 * 1024, dialect='sqlite'):
+        self.max_bytes = max_bytes
+        self.dialect = dialect  # tamanho mínimo dos termos, como no servidor
+        self.clear()
+    
+    def clear(self):
+        """Esvazia o índice e volta a aceitar tickets"""
+        self._terms = {}      # palavra -> array('I') de linhas
+        self._statuses = {}   # status -> array('I') de linhas
+        self._clients = {}    # cliente_id -> array('I') de linhas
+        self._vocabulary = None
+        self.size = 0
+        self.bytes = 0
+        self.overflowed = False
+    
+    def add(self, tickets, first):
+        """Indexa tickets (dicionários) que ocupam as linhas first, first + 1, ...
+        
+        As linhas devem ser sempre maiores que as já indexadas, para as listas
+        continuarem ordenadas sem precisar reordenar.
+        """
+        if self.overflowed:
+            return
+        added = 0
+        for row, ticket in enumerate(tickets, first):
+            text = f"{ticket.get('titulo') or ''} {ticket.get('descricao') or ''}"
+            for term in set(re.findall(r'\w+', search.fold(text))):
+                added += self._append(self._terms, term, row)
+            added += self._append(self._statuses, ticket.get('status'), row)
+            added += self._append(self._clients, ticket.get('cliente_id'), row)
+            self.size = row + 1
+        
+        if added:
+            self._vocabulary = None
+        if self.bytes > self.max_bytes:
+            self.clear()
+            self.overflowed = True
+    
+    def _append(self, postings, key, row):
+        """Adiciona a linha à lista da chave; retorna 1 se a chave é nova"""
+        rows = postings.get(key)
+        self.bytes += POSTING_SIZE
+        if rows is not None:
+            rows.append(row)
+            return 0
+        postings[key] = array('I', (row,))
+        self.bytes += ENTRY_OVERHEAD + (sys.getsizeof(key) if isinstance(key, str) else 0)
+        return 1
+    
+    def search(self, text=None, status=None, cliente_id=None):
+        """Linhas (em ordem) que atendem a todos os critérios informados
+        
+        Todos os termos do texto precisam aparecer no título ou na descrição.
+        Retorna None se nenhum critério foi informado (todas as linhas) e,
+        como search_tickets no servidor, nenhuma linha se o texto não tem
+        termos com o tamanho mínimo.
+        """
+        if self.overflowed:
+            raise RuntimeError("Índice de tickets estourou o limite de memória")
+        
+        terms = search.parse_terms(text or '', self.dialect)
+        if text and not terms:
+            return []
+        sets = []
+        if status is not None:
+            sets.append(self._statuses.get(status, ()))
+        if cliente_id is not None:
+            sets.append(self._clients.get(cliente_id, ()))
+        for term in terms:
+            sets.append(self._prefix_rows(term))
+        if not sets:
+            return None
+        
+        # Cruza a partir da menor lista
+        sets.sort(key=len)
+        result = set(sets[0])
+        for rows in sets[1:]:
+            if not result:
+                break
+            result.intersection_update(rows)
+        return sorted(result)
+    
+    def _prefix_rows(self, term):
+        """Linhas com alguma palavra que começa com term"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._terms)
+        vocabulary = self._vocabulary
+        position = bisect_left(vocabulary, term)
+        matches = []
+        while position < len(vocabulary) and vocabulary[position].startswith(term):
+            matches.append(self._terms[vocabulary[position]])
+            position += 1
+        if len(matches) == 1:
+            return matches[0]
+        rows = set()
+        for postings in matches:
+            rows.update(postings)
+        return rows
@@ -1,23 +1,68 @@
 import sys
 import os
+from collections import OrderedDict
+import startup_timing
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QMessageBox, 
                              QTableWidget, QTableWidgetItem, QHeaderView,
                              QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QTextEdit, QPushButton, QComboBox,
-                             QFrame, QStackedWidget, QWidget)
+                             QFrame, QStackedWidget, QWidget, QMenu)
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QIcon
-from PyQt5 import uic
 from database import DatabaseManager
+from config import APP_CONFIG
+from tickets_model import TicketsTableModel, CommentsListModel, ActionButtonDelegate
+from ticket_index import TicketIndex
+from sessions import SessionStore
+from workers import QueryRunner, ChangeFeed, CommentPrefetcher
+from ui_loader import load_ui
 
 class LoginWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         # Carrega a interface de login
-        uic.loadUi('login.ui', self)
-        self.db = DatabaseManager()
+        load_ui('login', self)
+        self.runner = QueryRunner(self)
+        self.sessions = SessionStore()
         self.setup_connections()
         
+        # A conexão com o banco é aberta em segundo plano para a tela de
+        # login aparecer imediatamente; os botões ficam bloqueados até lá
+        self.db = None
+        self.login_btn.setEnabled(False)
+        self.register_btn.setEnabled(False)
+        self.runner.run('connect', DatabaseManager, on_result=self.on_db_ready)
+        
+    def on_db_ready(self, db):
+        """Recebe o DatabaseManager criado em segundo plano"""
+        self.db = db
+        startup_timing.mark('banco de dados conectado')
+        
+        # Com uma sessão gravada, tenta ir direto para a janela principal
+        if self.sessions.exists():
+            self.set_loading(True)
+            self.runner.run('session', self.resume_session,
+                            on_result=self.on_session_checked,
+                            on_error=lambda message: self.on_session_checked(None))
+        else:
+            self.on_session_checked(None)
+            
+    def resume_session(self):
+        """Valida a sessão gravada e pré-carrega o cache (em segundo plano)"""
+        user = self.sessions.resume(self.db)
+        if user:
+            self.sessions.warm_cache(self.db)
+        return user
+        
+    def on_session_checked(self, user):
+        """Abre a janela principal com a sessão válida ou libera o login"""
+        self.set_loading(False)
+        if user:
+            startup_timing.mark('sessão retomada')
+            self.open_main_window(user)
+        else:
+            self.register_btn.setEnabled(True)
+            
     def setup_connections(self):
         """Configura as conexões dos botões"""
         self.login_btn.clicked.connect(self.login)
@@ -32,14 +77,39 @@ class LoginWindow(QMainWindow):
             QMessageBox.warning(self, "Erro", "Preencha todos os campos!")
             return
             
-        user = self.db.authenticate_user(email, senha)
+        # A autenticação roda em segundo plano para não travar a interface
+        self.set_loading(True)
+        self.runner.run('login', self.db.authenticate_user, email, senha,
+                        on_result=self.on_login_finished,
+                        on_error=lambda message: self.on_login_finished(None))
+        
+    def on_login_finished(self, user):
+        """Recebe o resultado da autenticação"""
+        self.set_loading(False)
         if user:
-            self.hide()
-            self.main_window = MainTicketsWindow(user, self.db)
-            self.main_window.show()
+            if self.remember_check.isChecked():
+                self.sessions.save(user)
+            else:
+                self.sessions.clear()
+            self.open_main_window(user)
         else:
             QMessageBox.critical(self, "Erro", "Email ou senha incorretos!")
             
+    def open_main_window(self, user):
+        """Troca a tela de login pela janela principal"""
+        self.hide()
+        self.main_window = MainTicketsWindow(user, self.db, self.sessions)
+        self.main_window.show()
+        
+    def set_loading(self, loading):
+        """Mostra o estado de carregamento no botão de login"""
+        self.login_btn.setEnabled(not loading)
+        self.login_btn.setText("Entrando..." if loading else "Entrar")
+        if loading:
+            self.setCursor(Qt.BusyCursor)
+        else:
+            self.unsetCursor()
+            
     def show_register(self):
         """Mostra a janela de registro"""
         self.hide()
@@ -51,7 +121,8 @@ class RegisterWindow(QMainWindow):
         super().__init__()
         self.db = db
         self.login_window = login_window
-        uic.loadUi('register.ui', self)
+        load_ui('register', self)
+        self.runner = QueryRunner(self)
         self.setup_connections()
         
     def setup_connections(self):
@@ -78,7 +149,15 @@ class RegisterWindow(QMainWindow):
             QMessageBox.warning(self, "Erro", "A senha deve ter pelo menos 6 caracteres!")
             return
             
-        if self.db.create_user(nome, email, senha):
+        self.register_btn.setEnabled(False)
+        self.runner.run('register', self.db.create_user, nome, email, senha,
+                        on_result=self.on_register_finished,
+                        on_error=lambda message: self.on_register_finished(False))
+        
+    def on_register_finished(self, created):
+        """Recebe o resultado do cadastro"""
+        self.register_btn.setEnabled(True)
+        if created:
             QMessageBox.information(self, "Sucesso", "Usuário criado com sucesso!")
             self.back_to_login()
         else:
@@ -89,16 +168,81 @@ class RegisterWindow(QMainWindow):
         self.hide()
         self.login_window.show()
 
+class TicketDetailsDialog(QDialog):
+    """Cabeçalho do ticket e comentários carregados em páginas ao rolar"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        load_ui('ticket_details', self)
+        self.comments_model = None
+        self.close_btn.clicked.connect(self.close)
+        
+    def show_ticket(self, ticket, comments_model):
+        """Exibe o ticket com a conversa (CommentsListModel) dele"""
+        if self.comments_model is not None:
+            self.comments_model.page_loaded.disconnect(self.update_comments_status)
+        self.comments_model = comments_model
+        
+        # O cabeçalho vem da linha da tabela, sem consulta ao banco
+        self.setWindowTitle(f"Ticket #{ticket['id']}")
+        self.titulo_label.setText(ticket['titulo'] or '')
+        status = (ticket['status'] or '').title()
+        info = f"#{ticket['id']} · {status} · Criado em {ticket['data_criacao']}"
+        if ticket.get('cliente_nome'):
+            info += f" · {ticket['cliente_nome']}"
+        self.info_label.setText(info)
+        self.descricao_text.setPlainText(ticket['descricao'] or '')
+        
+        # A view pede as próximas páginas (fetchMore) ao chegar no fim da lista
+        self.comments_list.setModel(comments_model)
+        self.comments_list.scrollToTop()
+        comments_model.page_loaded.connect(self.update_comments_status)
+        if comments_model.rowCount() == 0:
+            comments_model.fetchMore()
+        self.update_comments_status()
+        self.show()
+        self.raise_()
+        
+    def update_comments_status(self):
+        """Mostra quantos comentários foram carregados"""
+        model = self.comments_model
+        count = model.rowCount()
+        if model.loading and count == 0:
+            text = "Carregando comentários..."
+        elif count == 0 and model.exhausted:
+            text = "Nenhum comentário"
+        elif model.exhausted:
+            text = f"{count} comentário(s)"
+        else:
+            text = f"{count} comentário(s) carregados, role para ver mais"
+        self.comments_status_label.setText(text)
+
 class MainTicketsWindow(QMainWindow):
-    def __init__(self, user, db):
+    def __init__(self, user, db, sessions=None):
         super().__init__()
         self.user = user
         self.db = db
-        uic.loadUi('tickets_main.ui', self)
+        self.sessions = sessions or SessionStore()
+        # Conversas já exibidas, por ticket (LRU), para reabrir sem nova consulta
+        self.comment_threads = OrderedDict()
+        self.details_dialog = None
+        # Comentários dos tickets em vista, buscados antes de o usuário abri-los
+        self.comment_prefetcher = CommentPrefetcher(db, APP_CONFIG['comments_page_size'],
+                                                    max_size=APP_CONFIG['prefetch_cache_size'],
+                                                    parent=self)
+        load_ui('tickets_main', self)
+        self.runner = QueryRunner(self)
+        self.runner.busy_changed.connect(self.on_busy_changed)
         self.setup_ui()
         self.setup_connections()
         self.load_data()
         
+        # As telas se atualizam pelo diário de eventos, sem recarregar tudo
+        user_id = user['id'] if user['tipo'] == 'cliente' else None
+        self.change_feed = ChangeFeed(db, APP_CONFIG['poll_interval_ms'], user_id=user_id, parent=self)
+        self.change_feed.changed.connect(self.on_tickets_changed)
+        self.change_feed.start()
+        
     def setup_ui(self):
         """Configura a interface inicial"""
         # Configura o filtro de status
@@ -115,16 +259,70 @@ class MainTicketsWindow(QMainWindow):
         
     def setup_tickets_table(self):
         """Configura a tabela de tickets"""
-        headers = ['ID', 'Título', 'Status', 'Data Criação', 'Ações']
-        self.tickets_table.setColumnCount(len(headers))
-        self.tickets_table.setHorizontalHeaderLabels(headers)
+        # Os tickets carregados são indexados em memória para filtrar sem ir ao banco
+        index = TicketIndex(max_bytes=APP_CONFIG['local_index_max_mb'] * 1024 * 1024,
+                            dialect=self.db.dialect)
+        self.tickets_model = TicketsTableModel(with_actions=True, ticket_index=index, parent=self)
+        self.listing_status = None
+        self.showing_search = False
+        self.tickets_loaded = False
+        self.tickets_table.setModel(self.tickets_model)
         self.tickets_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tickets_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        
+        # Botão "Ver Detalhes" desenhado pelo delegate (sem widget por linha)
+        self.details_delegate = ActionButtonDelegate("Ver Detalhes", self.tickets_table)
+        self.details_delegate.clicked.connect(
+            lambda index: self.show_ticket_details(self.tickets_model.ticket(index.row())))
+        self.tickets_table.setItemDelegateForColumn(TicketsTableModel.ACTIONS_COLUMN, self.details_delegate)
+        self.tickets_table.setMouseTracking(True)
+        
+        # Rolagem, passagem do mouse, seleção e novas linhas antecipam os comentários
+        self.tickets_table.verticalScrollBar().valueChanged.connect(
+            lambda value: self.prefetch_comments())
+        self.tickets_table.entered.connect(lambda index: self.prefetch_comments(index.row()))
+        self.tickets_table.selectionModel().currentRowChanged.connect(
+            lambda current, previous: self.prefetch_comments(current.row()))
+        self.tickets_model.rowsInserted.connect(lambda parent, first, last: self.prefetch_comments())
+        self.tickets_model.layoutChanged.connect(lambda: self.prefetch_comments())
+        self.tickets_model.modelReset.connect(lambda: self.prefetch_comments())
+        
+        # Administradores mudam o status de vários tickets selecionados de uma vez
+        if self.user['tipo'] == 'admin':
+            self.tickets_table.customContextMenuRequested.connect(self.show_tickets_menu)
+            
+    def prefetch_comments(self, priority_row=None):
+        """Pede a busca antecipada dos comentários das linhas em vista da tabela
+        
+        A linha sob o mouse (ou selecionada) vem primeiro, depois as visíveis
+        de cima para baixo e as logo abaixo delas, até APP_CONFIG['prefetch_tickets'].
+        """
+        table = self.tickets_table
+        model = self.tickets_model
+        count = model.rowCount()
+        if count == 0 or not table.isVisible():
+            return
+        first = max(table.rowAt(0), 0)
+        last = table.rowAt(table.viewport().height() - 1)
+        if last < 0:
+            last = count - 1
+        limit = APP_CONFIG['prefetch_tickets']
+        
+        rows = [priority_row, table.currentIndex().row()]
+        rows.extend(range(first, min(count, max(last + 1, first + limit))))
+        ticket_ids = []
+        for row in rows:
+            if row is None or not 0 <= row < count:
+                continue
+            ticket_id = model.data(model.index(row, 0), Qt.UserRole)
+            if ticket_id not in self.comment_threads and ticket_id not in ticket_ids:
+                ticket_ids.append(ticket_id)
+        self.comment_prefetcher.request(ticket_ids[:limit])
         
     def setup_recent_tickets_table(self):
         """Configura a tabela de tickets recentes"""
-        headers = ['ID', 'Título', 'Status', 'Data Criação']
-        self.recent_tickets_table.setColumnCount(len(headers))
-        self.recent_tickets_table.setHorizontalHeaderLabels(headers)
+        self.recent_tickets_model = TicketsTableModel(parent=self)
+        self.recent_tickets_table.setModel(self.recent_tickets_model)
         self.recent_tickets_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
     def setup_users_table(self):
@@ -150,6 +348,7 @@ class MainTicketsWindow(QMainWindow):
         
         # Filtros
         self.status_filter.currentTextChanged.connect(self.filter_tickets)
+        self.tickets_search_input.textChanged.connect(self.filter_tickets)
         
     def change_page(self, index):
         """Muda a página do stacked widget"""
@@ -169,10 +368,9 @@ class MainTicketsWindow(QMainWindow):
             
         self.stackedWidget.setCurrentIndex(index)
         
-        # Recarrega os dados da página
-        if index == 0:
-            self.load_dashboard()
-        elif index == 1:
+        # Dashboard e lista de tickets são mantidos atualizados pelo ChangeFeed;
+        # a lista só é carregada na primeira visita
+        if index == 1 and not self.tickets_loaded:
             self.load_tickets()
         elif index == 3:
             self.load_users()
@@ -183,81 +381,113 @@ class MainTicketsWindow(QMainWindow):
         
     def load_dashboard(self):
         """Carrega os dados do dashboard"""
-        # Busca estatísticas
-        tickets_abertos = len(self.db.get_tickets(status='aberto'))
-        tickets_pausados = len(self.db.get_tickets(status='pausado'))
-        tickets_fechados = len(self.db.get_tickets(status='fechado'))
-        
-        # Atualiza labels
-        self.tickets_abertos_label.setText(str(tickets_abertos))
-        self.tickets_pausados_label.setText(str(tickets_pausados))
-        self.tickets_fechados_label.setText(str(tickets_fechados))
+        # Estatísticas e tickets recentes são buscados em paralelo, em segundo plano
+        self.runner.run('dashboard_stats', self.db.get_ticket_stats,
+                        on_result=self.show_dashboard_stats)
+        self.runner.run('dashboard_recent', self.db.get_recent_tickets, limit=5,  # Últimos 5 tickets
+                        on_result=self.load_recent_tickets_table)
         
-        # Carrega tickets recentes
-        recent_tickets = self.db.get_tickets()[:5]  # Últimos 5 tickets
-        self.load_recent_tickets_table(recent_tickets)
+    def show_dashboard_stats(self, stats):
+        """Atualiza os contadores do dashboard"""
+        self.tickets_abertos_label.setText(str(stats['aberto']))
+        self.tickets_pausados_label.setText(str(stats['pausado']))
+        self.tickets_fechados_label.setText(str(stats['fechado']))
         
     def load_recent_tickets_table(self, tickets):
         """Carrega a tabela de tickets recentes"""
-        self.recent_tickets_table.setRowCount(len(tickets))
+        self.recent_tickets_model.set_tickets(tickets)
         
-        for row, ticket in enumerate(tickets):
-            self.recent_tickets_table.setItem(row, 0, QTableWidgetItem(str(ticket['id'])))
-            self.recent_tickets_table.setItem(row, 1, QTableWidgetItem(ticket['titulo']))
-            self.recent_tickets_table.setItem(row, 2, QTableWidgetItem(ticket['status'].title()))
-            self.recent_tickets_table.setItem(row, 3, QTableWidgetItem(str(ticket['data_criacao'])))
-            
     def load_tickets(self):
         """Carrega a lista de tickets"""
-        if self.user['tipo'] == 'cliente':
-            tickets = self.db.get_tickets(user_id=self.user['id'])
-        else:
-            tickets = self.db.get_tickets()
-            
-        self.tickets_table.setRowCount(len(tickets))
+        self.tickets_loaded = True
+        self.tickets_search_input.blockSignals(True)
+        self.tickets_search_input.clear()
+        self.tickets_search_input.blockSignals(False)
+        self.start_tickets_listing(status=None)
         
-        for row, ticket in enumerate(tickets):
-            self.tickets_table.setItem(row, 0, QTableWidgetItem(str(ticket['id'])))
-            self.tickets_table.setItem(row, 1, QTableWidgetItem(ticket['titulo']))
-            self.tickets_table.setItem(row, 2, QTableWidgetItem(ticket['status'].title()))
-            self.tickets_table.setItem(row, 3, QTableWidgetItem(str(ticket['data_criacao'])))
-            
-            # Botão de ação
-            action_btn = QPushButton("Ver Detalhes")
-            action_btn.clicked.connect(lambda checked, t=ticket: self.show_ticket_details(t))
-            self.tickets_table.setCellWidget(row, 4, action_btn)
-            
     def filter_tickets(self):
-        """Filtra tickets por status"""
+        """Filtra tickets por status e pelo texto da busca"""
         status_filter = self.status_filter.currentText()
+        text = self.tickets_search_input.text().strip()
         
         if status_filter == 'Todos':
-            if self.user['tipo'] == 'cliente':
-                tickets = self.db.get_tickets(user_id=self.user['id'])
-            else:
-                tickets = self.db.get_tickets()
+            status = None
         else:
             status_map = {'Aberto': 'aberto', 'Pausado': 'pausado', 'Fechado': 'fechado'}
             status = status_map.get(status_filter, 'aberto')
             
-            if self.user['tipo'] == 'cliente':
-                tickets = self.db.get_tickets(user_id=self.user['id'], status=status)
-            else:
-                tickets = self.db.get_tickets(status=status)
-                
-        self.tickets_table.setRowCount(len(tickets))
+        # Com a listagem inteira carregada, o índice local responde sem ir ao banco
+        if (not self.showing_search and self.tickets_model.exhausted
+                and self.listing_status in (None, status)
+                and self.tickets_model.set_filter(text=text, status=status)):
+            return
+            
+        # No servidor, a consulta espera a digitação ou a navegação pelo combo
+        # parar; cada troca cancela a anterior no canal 'tickets'
+        delay = APP_CONFIG['filter_delay_ms']
+        if text:
+            self.search_tickets(text, status, delay=delay)
+        else:
+            self.start_tickets_listing(status=status, delay=delay)
+            
+    def search_tickets(self, text, status, delay=0):
+        """Busca no servidor quando o índice local não cobre a lista
         
-        for row, ticket in enumerate(tickets):
-            self.tickets_table.setItem(row, 0, QTableWidgetItem(str(ticket['id'])))
-            self.tickets_table.setItem(row, 1, QTableWidgetItem(ticket['titulo']))
-            self.tickets_table.setItem(row, 2, QTableWidgetItem(ticket['status'].title()))
-            self.tickets_table.setItem(row, 3, QTableWidgetItem(str(ticket['data_criacao'])))
+        Como o índice local, considera só o título e a descrição: o mesmo
+        texto mostra os mesmos tickets nos dois caminhos.
+        """
+        filters = {'status': status}
+        if self.user['tipo'] == 'cliente':
+            filters['user_id'] = self.user['id']
+        self.showing_search = True
+        self.runner.run('tickets', self.db.search_tickets, text, filters=filters,
+                        limit=APP_CONFIG['page_size'],
+                        comments=False,
+                        delay=delay,
+                        on_result=self.tickets_model.set_tickets)
+        
+    def start_tickets_listing(self, status, delay=0):
+        """Reinicia a paginação da lista de tickets e carrega a primeira página"""
+        user_id = self.user['id'] if self.user['tipo'] == 'cliente' else None
+        self.listing_status = status
+        self.showing_search = False
+        
+        def fetch_page(cursor, done):
+            self.runner.run('tickets', self.db.get_tickets_page,
+                            user_id=user_id,
+                            status=status,
+                            limit=APP_CONFIG['page_size'],
+                            cursor=cursor,
+                            delay=delay if cursor is None else 0,
+                            on_result=lambda result: done(*result),
+                            on_error=lambda message: done([], None))
             
-            # Botão de ação
-            action_btn = QPushButton("Ver Detalhes")
-            action_btn.clicked.connect(lambda checked, t=ticket: self.show_ticket_details(t))
-            self.tickets_table.setCellWidget(row, 4, action_btn)
+        # As páginas seguintes são pedidas pela view via fetchMore ao rolar;
+        # um novo filtro cancela a consulta anterior do canal 'tickets'
+        self.tickets_model.set_fetcher(fetch_page)
+        
+    def on_tickets_changed(self, changes):
+        """Aplica às telas os tickets criados ou alterados desde a última consulta"""
+        tickets = changes['tickets']
+        if tickets and self.tickets_loaded:
+            if self.showing_search:
+                self.tickets_model.apply_changes(tickets, insert=False)
+            else:
+                status = self.listing_status
+                self.tickets_model.apply_changes(
+                    tickets, accept=lambda ticket: status is None or ticket['status'] == status)
+        if tickets:
+            self.load_dashboard()
             
+        # Conversas em cache buscam só os comentários novos
+        commented = {event['ticket_id'] for event in changes['events'] if event['tipo'] == 'comentario'}
+        self.comment_prefetcher.discard(commented)
+        for ticket_id in commented:
+            thread = self.comment_threads.get(ticket_id)
+            if thread is not None:
+                thread.refresh()
+                
+                
     def create_ticket(self):
         """Cria um novo ticket"""
         titulo = self.titulo_input.text().strip()
@@ -267,11 +497,18 @@ class MainTicketsWindow(QMainWindow):
             QMessageBox.warning(self, "Erro", "Preencha todos os campos!")
             return
             
-        ticket_id = self.db.create_ticket(titulo, descricao, self.user['id'])
+        self.criar_ticket_btn.setEnabled(False)
+        self.runner.run('create_ticket', self.db.create_ticket, titulo, descricao, self.user['id'],
+                        on_result=self.on_ticket_created,
+                        on_error=lambda message: self.on_ticket_created(None))
+        
+    def on_ticket_created(self, ticket_id):
+        """Recebe o resultado da criação do ticket"""
+        self.criar_ticket_btn.setEnabled(True)
         if ticket_id:
             QMessageBox.information(self, "Sucesso", "Ticket criado com sucesso!")
             self.clear_ticket_form()
-            self.load_dashboard()  # Recarrega dashboard
+            self.change_feed.poll()  # Mostra o novo ticket sem esperar a próxima consulta
         else:
             QMessageBox.critical(self, "Erro", "Erro ao criar ticket!")
             
@@ -306,13 +543,91 @@ class MainTicketsWindow(QMainWindow):
         
     def show_ticket_details(self, ticket):
         """Mostra detalhes de um ticket"""
-        # Implementar visualização detalhada do ticket
-        QMessageBox.information(self, "Detalhes do Ticket", 
-                              f"Título: {ticket['titulo']}\n"
-                              f"Status: {ticket['status']}\n"
-                              f"Data: {ticket['data_criacao']}\n"
-                              f"Descrição: {ticket['descricao']}")
+        self.sessions.remember_ticket(ticket['id'])
+        if self.details_dialog is None:
+            self.details_dialog = TicketDetailsDialog(self)
+        self.details_dialog.show_ticket(ticket, self.comment_thread(ticket['id']))
+        
+    def selected_ticket_ids(self):
+        """Ids dos tickets das linhas selecionadas na tabela"""
+        model = self.tickets_model
+        return [model.data(index, Qt.UserRole)
+                for index in self.tickets_table.selectionModel().selectedRows()]
+        
+    def show_tickets_menu(self, position):
+        """Menu de contexto da tabela com a mudança de status em lote"""
+        ticket_ids = self.selected_ticket_ids()
+        if not ticket_ids:
+            return
+        menu = QMenu(self)
+        for label, status in (('Aberto', 'aberto'), ('Pausado', 'pausado'), ('Fechado', 'fechado')):
+            action = menu.addAction(f"Marcar {len(ticket_ids)} ticket(s) como {label}")
+            action.triggered.connect(
+                lambda checked, status=status: self.update_selected_status(ticket_ids, status))
+        menu.exec_(self.tickets_table.viewport().mapToGlobal(position))
+        
+    def update_selected_status(self, ticket_ids, status):
+        """Muda o status dos tickets selecionados em uma única transação"""
+        if len(ticket_ids) > 1:
+            reply = QMessageBox.question(self, 'Confirmar',
+                                         f'Mudar o status de {len(ticket_ids)} tickets para "{status}"?',
+                                         QMessageBox.Yes | QMessageBox.No,
+                                         QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        self.runner.run('bulk_status', self.db.bulk_update_status, ticket_ids, status,
+                        on_result=self.on_bulk_status_finished,
+                        on_error=lambda message: self.on_bulk_status_finished(None))
+        
+    def on_bulk_status_finished(self, result):
+        """Recebe o resultado da mudança de status em lote"""
+        if result is None:
+            QMessageBox.critical(self, "Erro", "Erro ao atualizar o status dos tickets!")
+            return
+        message = f"{result['updated']} ticket(s) atualizado(s)"
+        if result['unchanged']:
+            message += f", {result['unchanged']} já estava(m) com esse status"
+        if result['missing']:
+            message += f", {result['missing']} não encontrado(s)"
+        self.statusBar().showMessage(message, 5000)
+        # A tabela e o dashboard são atualizados pelo diário de eventos
+        self.change_feed.poll()
+        
+    def comment_thread(self, ticket_id):
+        """Modelo com os comentários do ticket, reaproveitado entre aberturas"""
+        thread = self.comment_threads.get(ticket_id)
+        if thread is not None:
+            self.comment_threads.move_to_end(ticket_id)
+            return thread
+            
+        channel = f'comments:{ticket_id}'
+        
+        def fetch_page(cursor, done):
+            self.runner.run(channel, self.db.get_comments_page, ticket_id,
+                            limit=APP_CONFIG['comments_page_size'],
+                            cursor=cursor,
+                            on_result=lambda result: done(*result),
+                            on_error=lambda message: done([], None))
+            
+        thread = self.comment_threads[ticket_id] = CommentsListModel(fetch_page, self)
+        page = self.comment_prefetcher.take(ticket_id)
+        if page is not None:
+            thread.add_page(*page)
+        while len(self.comment_threads) > APP_CONFIG['comment_threads_cached']:
+            old_id, old_thread = self.comment_threads.popitem(last=False)
+            self.runner.cancel(f'comments:{old_id}')
+            old_thread.deleteLater()
+        return thread
         
+    def on_busy_changed(self, busy):
+        """Mostra o estado de carregamento enquanto há consultas em andamento"""
+        if busy:
+            self.statusBar().showMessage("Carregando...")
+            self.setCursor(Qt.BusyCursor)
+        else:
+            self.statusBar().clearMessage()
+            self.unsetCursor()
+            
     def logout(self):
         """Faz logout do usuário"""
         reply = QMessageBox.question(self, 'Confirmar Logout', 
@@ -321,19 +636,35 @@ class MainTicketsWindow(QMainWindow):
                                    QMessageBox.No)
         
         if reply == QMessageBox.Yes:
+            self.change_feed.stop()
+            self.change_feed.runner.wait()
+            self.comment_prefetcher.stop()
+            self.comment_prefetcher.runner.wait()
+            self.runner.wait()
+            self.sessions.clear()
             self.db.close()
             self.close()
             # Aqui você pode implementar o retorno à tela de login
 
 def main():
+    if '--startup-timing' in sys.argv:
+        startup_timing.enabled = True
+    startup_timing.mark('imports')
+    
     app = QApplication(sys.argv)
     
     # Configura o estilo da aplicação
     app.setStyle('Fusion')
+    startup_timing.mark('QApplication')
     
     # Cria e mostra a janela de login
     login_window = LoginWindow()
     login_window.show()
+    startup_timing.mark('LoginWindow criada')
+    
+    # Relatório depois que o primeiro ciclo do event loop desenhar a janela
+    QTimer.singleShot(0, lambda: (startup_timing.mark('primeira janela exibida'),
+                                  startup_timing.report()))
     
     sys.exit(app.exec_())
 
@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'tickets_main.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainTicketsWindow(object):
+    def setupUi(self, MainTicketsWindow):
+        MainTicketsWindow.setObjectName("MainTicketsWindow")
+        MainTicketsWindow.resize(1200, 800)
+        MainTicketsWindow.setStyleSheet("background-color: #f8f9fa;")
+        self.centralwidget = QtWidgets.QWidget(MainTicketsWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.centralwidget)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.sidebar_widget = QtWidgets.QWidget(self.centralwidget)
+        self.sidebar_widget.setMinimumSize(QtCore.QSize(250, 0))
+        self.sidebar_widget.setMaximumSize(QtCore.QSize(250, 16777215))
+        self.sidebar_widget.setStyleSheet("background-color: #2c3e50;")
+        self.sidebar_widget.setObjectName("sidebar_widget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.sidebar_widget)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.logo_label = QtWidgets.QLabel(self.sidebar_widget)
+        self.logo_label.setMinimumSize(QtCore.QSize(0, 80))
+        self.logo_label.setStyleSheet("background-color: #34495e; color: white; font-size: 18px; font-weight: bold;")
+        self.logo_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.logo_label.setObjectName("logo_label")
+        self.verticalLayout.addWidget(self.logo_label)
+        self.dashboard_btn = QtWidgets.QPushButton(self.sidebar_widget)
+        self.dashboard_btn.setMinimumSize(QtCore.QSize(0, 50))
+        self.dashboard_btn.setStyleSheet("QPushButton {\n"
+"    background-color: transparent;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    text-align: left;\n"
+"    padding: 15px 20px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #34495e;\n"
+"}\n"
+"QPushButton:checked {\n"
+"    background-color: #3498db;\n"
+"}")
+        self.dashboard_btn.setCheckable(True)
+        self.dashboard_btn.setObjectName("dashboard_btn")
+        self.verticalLayout.addWidget(self.dashboard_btn)
+        self.tickets_btn = QtWidgets.QPushButton(self.sidebar_widget)
+        self.tickets_btn.setMinimumSize(QtCore.QSize(0, 50))
+        self.tickets_btn.setStyleSheet("QPushButton {\n"
+"    background-color: transparent;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    text-align: left;\n"
+"    padding: 15px 20px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #34495e;\n"
+"}\n"
+"QPushButton:checked {\n"
+"    background-color: #3498db;\n"
+"}")
+        self.tickets_btn.setCheckable(True)
+        self.tickets_btn.setObjectName("tickets_btn")
+        self.verticalLayout.addWidget(self.tickets_btn)
+        self.new_ticket_btn = QtWidgets.QPushButton(self.sidebar_widget)
+        self.new_ticket_btn.setMinimumSize(QtCore.QSize(0, 50))
+        self.new_ticket_btn.setStyleSheet("QPushButton {\n"
+"    background-color: transparent;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    text-align: left;\n"
+"    padding: 15px 20px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #34495e;\n"
+"}\n"
+"QPushButton:checked {\n"
+"    background-color: #3498db;\n"
+"}")
+        self.new_ticket_btn.setCheckable(True)
+        self.new_ticket_btn.setObjectName("new_ticket_btn")
+        self.verticalLayout.addWidget(self.new_ticket_btn)
+        self.users_btn = QtWidgets.QPushButton(self.sidebar_widget)
+        self.users_btn.setMinimumSize(QtCore.QSize(0, 50))
+        self.users_btn.setStyleSheet("QPushButton {\n"
+"    background-color: transparent;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    text-align: left;\n"
+"    padding: 15px 20px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #34495e;\n"
+"}\n"
+"QPushButton:checked {\n"
+"    background-color: #3498db;\n"
+"}")
+        self.users_btn.setCheckable(True)
+        self.users_btn.setObjectName("users_btn")
+        self.verticalLayout.addWidget(self.users_btn)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.logout_btn = QtWidgets.QPushButton(self.sidebar_widget)
+        self.logout_btn.setMinimumSize(QtCore.QSize(0, 50))
+        self.logout_btn.setStyleSheet("QPushButton {\n"
+"    background-color: #e74c3c;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    text-align: center;\n"
+"    padding: 15px 20px;\n"
+"    font-size: 14px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #c0392b;\n"
+"}")
+        self.logout_btn.setObjectName("logout_btn")
+        self.verticalLayout.addWidget(self.logout_btn)
+        self.horizontalLayout.addWidget(self.sidebar_widget)
+        self.stackedWidget = QtWidgets.QStackedWidget(self.centralwidget)
+        self.stackedWidget.setStyleSheet("background-color: white;")
+        self.stackedWidget.setObjectName("stackedWidget")
+        self.dashboard_page = QtWidgets.QWidget()
+        self.dashboard_page.setObjectName("dashboard_page")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.dashboard_page)
+        self.verticalLayout_2.setContentsMargins(30, 30, 30, 30)
+        self.verticalLayout_2.setSpacing(20)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.dashboard_title = QtWidgets.QLabel(self.dashboard_page)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        font.setBold(True)
+        font.setWeight(75)
+        self.dashboard_title.setFont(font)
+        self.dashboard_title.setStyleSheet("color: #2c3e50;")
+        self.dashboard_title.setObjectName("dashboard_title")
+        self.verticalLayout_2.addWidget(self.dashboard_title)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.stats_frame_1 = QtWidgets.QFrame(self.dashboard_page)
+        self.stats_frame_1.setMinimumSize(QtCore.QSize(200, 120))
+        self.stats_frame_1.setStyleSheet("background-color: #3498db; border-radius: 10px; color: white;")
+        self.stats_frame_1.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.stats_frame_1.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.stats_frame_1.setObjectName("stats_frame_1")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.stats_frame_1)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.tickets_abertos_label = QtWidgets.QLabel(self.stats_frame_1)
+        font = QtGui.QFont()
+        font.setPointSize(32)
+        font.setBold(True)
+        font.setWeight(75)
+        self.tickets_abertos_label.setFont(font)
+        self.tickets_abertos_label.setStyleSheet("color: white;")
+        self.tickets_abertos_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.tickets_abertos_label.setObjectName("tickets_abertos_label")
+        self.verticalLayout_3.addWidget(self.tickets_abertos_label)
+        self.tickets_abertos_text = QtWidgets.QLabel(self.stats_frame_1)
+        self.tickets_abertos_text.setStyleSheet("color: white; font-size: 14px;")
+        self.tickets_abertos_text.setAlignment(QtCore.Qt.AlignCenter)
+        self.tickets_abertos_text.setObjectName("tickets_abertos_text")
+        self.verticalLayout_3.addWidget(self.tickets_abertos_text)
+        self.horizontalLayout_2.addWidget(self.stats_frame_1)
+        self.stats_frame_2 = QtWidgets.QFrame(self.dashboard_page)
+        self.stats_frame_2.setMinimumSize(QtCore.QSize(200, 120))
+        self.stats_frame_2.setStyleSheet("background-color: #e67e22; border-radius: 10px; color: white;")
+        self.stats_frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.stats_frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.stats_frame_2.setObjectName("stats_frame_2")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.stats_frame_2)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.tickets_pausados_label = QtWidgets.QLabel(self.stats_frame_2)
+        font = QtGui.QFont()
+        font.setPointSize(32)
+        font.setBold(True)
+        font.setWeight(75)
+        self.tickets_pausados_label.setFont(font)
+        self.tickets_pausados_label.setStyleSheet("color: white;")
+        self.tickets_pausados_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.tickets_pausados_label.setObjectName("tickets_pausados_label")
+        self.verticalLayout_4.addWidget(self.tickets_pausados_label)
+        self.tickets_pausados_text = QtWidgets.QLabel(self.stats_frame_2)
+        self.tickets_pausados_text.setStyleSheet("color: white; font-size: 14px;")
+        self.tickets_pausados_text.setAlignment(QtCore.Qt.AlignCenter)
+        self.tickets_pausados_text.setObjectName("tickets_pausados_text")
+        self.verticalLayout_4.addWidget(self.tickets_pausados_text)
+        self.horizontalLayout_2.addWidget(self.stats_frame_2)
+        self.stats_frame_3 = QtWidgets.QFrame(self.dashboard_page)
+        self.stats_frame_3.setMinimumSize(QtCore.QSize(200, 120))
+        self.stats_frame_3.setStyleSheet("background-color: #27ae60; border-radius: 10px; color: white;")
+        self.stats_frame_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.stats_frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.stats_frame_3.setObjectName("stats_frame_3")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.stats_frame_3)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.tickets_fechados_label = QtWidgets.QLabel(self.stats_frame_3)
+        font = QtGui.QFont()
+        font.setPointSize(32)
+        font.setBold(True)
+        font.setWeight(75)
+        self.tickets_fechados_label.setFont(font)
+        self.tickets_fechados_label.setStyleSheet("color: white;")
+        self.tickets_fechados_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.tickets_fechados_label.setObjectName("tickets_fechados_label")
+        self.verticalLayout_5.addWidget(self.tickets_fechados_label)
+        self.tickets_fechados_text = QtWidgets.QLabel(self.stats_frame_3)
+        self.tickets_fechados_text.setStyleSheet("color: white; font-size: 14px;")
+        self.tickets_fechados_text.setAlignment(QtCore.Qt.AlignCenter)
+        self.tickets_fechados_text.setObjectName("tickets_fechados_text")
+        self.verticalLayout_5.addWidget(self.tickets_fechados_text)
+        self.horizontalLayout_2.addWidget(self.stats_frame_3)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.recent_tickets_label = QtWidgets.QLabel(self.dashboard_page)
+        font = QtGui.QFont()
+        font.setPointSize(18)
+        font.setBold(True)
+        font.setWeight(75)
+        self.recent_tickets_label.setFont(font)
+        self.recent_tickets_label.setStyleSheet("color: #2c3e50;")
+        self.recent_tickets_label.setObjectName("recent_tickets_label")
+        self.verticalLayout_2.addWidget(self.recent_tickets_label)
+        self.recent_tickets_table = QtWidgets.QTableView(self.dashboard_page)
+        self.recent_tickets_table.setStyleSheet("QTableView {\n"
+"    border: 1px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    background-color: white;\n"
+"}\n"
+"QTableView::item {\n"
+"    padding: 8px;\n"
+"}\n"
+"QHeaderView::section {\n"
+"    background-color: #ecf0f1;\n"
+"    padding: 8px;\n"
+"    border: none;\n"
+"    border-right: 1px solid #bdc3c7;\n"
+"    border-bottom: 1px solid #bdc3c7;\n"
+"}")
+        self.recent_tickets_table.setObjectName("recent_tickets_table")
+        self.verticalLayout_2.addWidget(self.recent_tickets_table)
+        self.stackedWidget.addWidget(self.dashboard_page)
+        self.tickets_page = QtWidgets.QWidget()
+        self.tickets_page.setObjectName("tickets_page")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.tickets_page)
+        self.verticalLayout_6.setContentsMargins(30, 30, 30, 30)
+        self.verticalLayout_6.setSpacing(20)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.tickets_title = QtWidgets.QLabel(self.tickets_page)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        font.setBold(True)
+        font.setWeight(75)
+        self.tickets_title.setFont(font)
+        self.tickets_title.setStyleSheet("color: #2c3e50;")
+        self.tickets_title.setObjectName("tickets_title")
+        self.horizontalLayout_3.addWidget(self.tickets_title)
+        self.tickets_search_input = QtWidgets.QLineEdit(self.tickets_page)
+        self.tickets_search_input.setMinimumSize(QtCore.QSize(250, 35))
+        self.tickets_search_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 5px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.tickets_search_input.setClearButtonEnabled(True)
+        self.tickets_search_input.setObjectName("tickets_search_input")
+        self.horizontalLayout_3.addWidget(self.tickets_search_input)
+        self.status_filter = QtWidgets.QComboBox(self.tickets_page)
+        self.status_filter.setMinimumSize(QtCore.QSize(150, 35))
+        self.status_filter.setStyleSheet("QComboBox {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 5px;\n"
+"    font-size: 14px;\n"
+"}")
+        self.status_filter.setObjectName("status_filter")
+        self.horizontalLayout_3.addWidget(self.status_filter)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem1)
+        self.verticalLayout_6.addLayout(self.horizontalLayout_3)
+        self.tickets_table = QtWidgets.QTableView(self.tickets_page)
+        self.tickets_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.tickets_table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.tickets_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tickets_table.setStyleSheet("QTableView {\n"
+"    border: 1px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    background-color: white;\n"
+"}\n"
+"QTableView::item {\n"
+"    padding: 8px;\n"
+"}\n"
+"QHeaderView::section {\n"
+"    background-color: #ecf0f1;\n"
+"    padding: 8px;\n"
+"    border: none;\n"
+"    border-right: 1px solid #bdc3c7;\n"
+"    border-bottom: 1px solid #bdc3c7;\n"
+"}")
+        self.tickets_table.setObjectName("tickets_table")
+        self.verticalLayout_6.addWidget(self.tickets_table)
+        self.stackedWidget.addWidget(self.tickets_page)
+        self.new_ticket_page = QtWidgets.QWidget()
+        self.new_ticket_page.setObjectName("new_ticket_page")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.new_ticket_page)
+        self.verticalLayout_7.setContentsMargins(30, 30, 30, 30)
+        self.verticalLayout_7.setSpacing(20)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.new_ticket_title = QtWidgets.QLabel(self.new_ticket_page)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        font.setBold(True)
+        font.setWeight(75)
+        self.new_ticket_title.setFont(font)
+        self.new_ticket_title.setStyleSheet("color: #2c3e50;")
+        self.new_ticket_title.setObjectName("new_ticket_title")
+        self.verticalLayout_7.addWidget(self.new_ticket_title)
+        self.ticket_form_frame = QtWidgets.QFrame(self.new_ticket_page)
+        self.ticket_form_frame.setStyleSheet("background-color: white; border: 1px solid #bdc3c7; border-radius: 10px;")
+        self.ticket_form_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.ticket_form_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.ticket_form_frame.setObjectName("ticket_form_frame")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.ticket_form_frame)
+        self.verticalLayout_8.setContentsMargins(30, 30, 30, 30)
+        self.verticalLayout_8.setSpacing(20)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.titulo_label = QtWidgets.QLabel(self.ticket_form_frame)
+        self.titulo_label.setStyleSheet("color: #34495e; font-weight: bold; font-size: 14px;")
+        self.titulo_label.setObjectName("titulo_label")
+        self.verticalLayout_8.addWidget(self.titulo_label)
+        self.titulo_input = QtWidgets.QLineEdit(self.ticket_form_frame)
+        self.titulo_input.setMinimumSize(QtCore.QSize(0, 40))
+        self.titulo_input.setStyleSheet("QLineEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.titulo_input.setObjectName("titulo_input")
+        self.verticalLayout_8.addWidget(self.titulo_input)
+        self.descricao_label = QtWidgets.QLabel(self.ticket_form_frame)
+        self.descricao_label.setStyleSheet("color: #34495e; font-weight: bold; font-size: 14px;")
+        self.descricao_label.setObjectName("descricao_label")
+        self.verticalLayout_8.addWidget(self.descricao_label)
+        self.descricao_input = QtWidgets.QTextEdit(self.ticket_form_frame)
+        self.descricao_input.setMinimumSize(QtCore.QSize(0, 120))
+        self.descricao_input.setStyleSheet("QTextEdit {\n"
+"    border: 2px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    padding: 8px;\n"
+"    font-size: 14px;\n"
+"}\n"
+"QTextEdit:focus {\n"
+"    border-color: #3498db;\n"
+"}")
+        self.descricao_input.setObjectName("descricao_input")
+        self.verticalLayout_8.addWidget(self.descricao_input)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem2)
+        self.cancelar_btn = QtWidgets.QPushButton(self.ticket_form_frame)
+        self.cancelar_btn.setMinimumSize(QtCore.QSize(120, 40))
+        self.cancelar_btn.setStyleSheet("QPushButton {\n"
+"    background-color: #95a5a6;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    border-radius: 5px;\n"
+"    font-size: 14px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #7f8c8d;\n"
+"}")
+        self.cancelar_btn.setObjectName("cancelar_btn")
+        self.horizontalLayout_4.addWidget(self.cancelar_btn)
+        self.criar_ticket_btn = QtWidgets.QPushButton(self.ticket_form_frame)
+        self.criar_ticket_btn.setMinimumSize(QtCore.QSize(120, 40))
+        self.criar_ticket_btn.setStyleSheet("QPushButton {\n"
+"    background-color: #3498db;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    border-radius: 5px;\n"
+"    font-size: 14px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #2980b9;\n"
+"}")
+        self.criar_ticket_btn.setObjectName("criar_ticket_btn")
+        self.horizontalLayout_4.addWidget(self.criar_ticket_btn)
+        self.verticalLayout_8.addLayout(self.horizontalLayout_4)
+        self.verticalLayout_7.addWidget(self.ticket_form_frame)
+        self.stackedWidget.addWidget(self.new_ticket_page)
+        self.users_page = QtWidgets.QWidget()
+        self.users_page.setObjectName("users_page")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.users_page)
+        self.verticalLayout_9.setContentsMargins(30, 30, 30, 30)
+        self.verticalLayout_9.setSpacing(20)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.users_title = QtWidgets.QLabel(self.users_page)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        font.setBold(True)
+        font.setWeight(75)
+        self.users_title.setFont(font)
+        self.users_title.setStyleSheet("color: #2c3e50;")
+        self.users_title.setObjectName("users_title")
+        self.horizontalLayout_5.addWidget(self.users_title)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem3)
+        self.add_user_btn = QtWidgets.QPushButton(self.users_page)
+        self.add_user_btn.setMinimumSize(QtCore.QSize(120, 40))
+        self.add_user_btn.setStyleSheet("QPushButton {\n"
+"    background-color: #27ae60;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    border-radius: 5px;\n"
+"    font-size: 14px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #229954;\n"
+"}")
+        self.add_user_btn.setObjectName("add_user_btn")
+        self.horizontalLayout_5.addWidget(self.add_user_btn)
+        self.verticalLayout_9.addLayout(self.horizontalLayout_5)
+        self.users_table = QtWidgets.QTableWidget(self.users_page)
+        self.users_table.setStyleSheet("QTableWidget {\n"
+"    border: 1px solid #bdc3c7;\n"
+"    border-radius: 5px;\n"
+"    background-color: white;\n"
+"}\n"
+"QTableWidget::item {\n"
+"    padding: 8px;\n"
+"}\n"
+"QHeaderView::section {\n"
+"    background-color: #ecf0f1;\n"
+"    padding: 8px;\n"
+"    border: none;\n"
+"    border-right: 1px solid #bdc3c7;\n"
+"    border-bottom: 1px solid #bdc3c7;\n"
+"}")
+        self.users_table.setObjectName("users_table")
+        self.users_table.setColumnCount(0)
+        self.users_table.setRowCount(0)
+        self.verticalLayout_9.addWidget(self.users_table)
+        self.stackedWidget.addWidget(self.users_page)
+        self.horizontalLayout.addWidget(self.stackedWidget)
+        MainTicketsWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainTicketsWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainTicketsWindow)
+
+    def retranslateUi(self, MainTicketsWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainTicketsWindow.setWindowTitle(_translate("MainTicketsWindow", "Sistema de Gestão de Tickets"))
+        self.logo_label.setText(_translate("MainTicketsWindow", "🎫 Sistema de Tickets"))
+        self.dashboard_btn.setText(_translate("MainTicketsWindow", "📊 Dashboard"))
+        self.tickets_btn.setText(_translate("MainTicketsWindow", "🎫 Meus Tickets"))
+        self.new_ticket_btn.setText(_translate("MainTicketsWindow", "➕ Novo Ticket"))
+        self.users_btn.setText(_translate("MainTicketsWindow", "👥 Usuários"))
+        self.logout_btn.setText(_translate("MainTicketsWindow", "🚪 Sair"))
+        self.dashboard_title.setText(_translate("MainTicketsWindow", "Dashboard"))
+        self.tickets_abertos_label.setText(_translate("MainTicketsWindow", "0"))
+        self.tickets_abertos_text.setText(_translate("MainTicketsWindow", "Tickets Abertos"))
+        self.tickets_pausados_label.setText(_translate("MainTicketsWindow", "0"))
+        self.tickets_pausados_text.setText(_translate("MainTicketsWindow", "Tickets Pausados"))
+        self.tickets_fechados_label.setText(_translate("MainTicketsWindow", "0"))
+        self.tickets_fechados_text.setText(_translate("MainTicketsWindow", "Tickets Fechados"))
+        self.recent_tickets_label.setText(_translate("MainTicketsWindow", "Tickets Recentes"))
+        self.tickets_title.setText(_translate("MainTicketsWindow", "Meus Tickets"))
+        self.tickets_search_input.setPlaceholderText(_translate("MainTicketsWindow", "Buscar nos tickets..."))
+        self.new_ticket_title.setText(_translate("MainTicketsWindow", "Novo Ticket"))
+        self.titulo_label.setText(_translate("MainTicketsWindow", "Título:"))
+        self.titulo_input.setPlaceholderText(_translate("MainTicketsWindow", "Digite o título do ticket"))
+        self.descricao_label.setText(_translate("MainTicketsWindow", "Descrição:"))
+        self.descricao_input.setPlaceholderText(_translate("MainTicketsWindow", "Descreva detalhadamente o problema ou solicitação"))
+        self.cancelar_btn.setText(_translate("MainTicketsWindow", "Cancelar"))
+        self.criar_ticket_btn.setText(_translate("MainTicketsWindow", "Criar Ticket"))
+        self.users_title.setText(_translate("MainTicketsWindow", "Gerenciar Usuários"))
+        self.add_user_btn.setText(_translate("MainTicketsWindow", "+ Adicionar Usuário"))
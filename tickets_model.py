@@ -0,0 +1,468 @@
+from PyQt5.QtCore import (Qt, QAbstractListModel, QAbstractTableModel, QModelIndex, QEvent,
+                          pyqtSignal)
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
+
+
+class TicketsTableModel(QAbstractTableModel):
+    """Modelo de tickets para QTableView, com carregamento sob demanda (fetchMore)
+    
+    As linhas ficam guardadas como tuplas na ordem de FIELDS, em vez de um
+    QTableWidgetItem por célula, e apenas as linhas visíveis são desenhadas.
+    
+    Quando uma lista nova substitui a atual (set_tickets, primeira página de
+    set_fetcher), as linhas são comparadas pelo id e o modelo emite apenas as
+    inserções, remoções e dataChanged necessários, preservando a seleção e a
+    rolagem; uma recarga custa proporcional ao que mudou.
+    
+    Com um TicketIndex (ticket_index.py), as linhas carregadas são indexadas
+    à medida que chegam e set_filter() filtra por texto e status localmente,
+    sem nova consulta ao banco.
+    """
+    
+    FIELDS = ('id', 'titulo', 'status', 'data_criacao', 'descricao', 'cliente_id', 'cliente_nome')
+    COLUMNS = (('ID', 'id'), ('Título', 'titulo'), ('Status', 'status'), ('Data Criação', 'data_criacao'))
+    ACTIONS_COLUMN = len(COLUMNS)
+    
+    def __init__(self, with_actions=False, ticket_index=None, parent=None):
+        super().__init__(parent)
+        self.with_actions = with_actions
+        self.ticket_index = ticket_index
+        self._index_dirty = False
+        self._rows = []
+        self._visible = None  # linhas de _rows que passam no filtro local (None = todas)
+        self._filter = None
+        self._fetcher = None
+        self._cursor = None
+        self._exhausted = True
+        self._loading = False
+        self._stale = False  # linhas de uma listagem anterior, até a primeira página chegar
+        self._generation = 0
+        self._field_index = [self.FIELDS.index(field) for _, field in self.COLUMNS]
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self._visible is not None:
+            return len(self._visible)
+        return len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS) + (1 if self.with_actions else 0)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._row(index.row())
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == self.ACTIONS_COLUMN:
+                return None
+            value = row[self._field_index[column]]
+            if column == 2:
+                return value.title() if value else ''
+            return '' if value is None else str(value)
+        if role == Qt.UserRole:
+            return row[0]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return super().headerData(section, orientation, role)
+        if section < len(self.COLUMNS):
+            return self.COLUMNS[section][0]
+        return 'Ações'
+    
+    def ticket(self, row):
+        """Retorna o ticket da linha como dicionário"""
+        return self._to_ticket(self._row(row))
+    
+    def _row(self, row):
+        if self._visible is not None:
+            return self._rows[self._visible[row]]
+        return self._rows[row]
+    
+    @property
+    def loading(self):
+        return self._loading
+    
+    @property
+    def exhausted(self):
+        """True quando todas as páginas da listagem atual já foram carregadas"""
+        return self._exhausted
+    
+    @property
+    def filtered(self):
+        return self._visible is not None
+    
+    def set_filter(self, text=None, status=None):
+        """Mostra apenas as linhas carregadas que contêm o texto e têm o status
+        
+        Retorna False, sem alterar o modelo, se não há índice ou se ele estourou
+        o limite de memória; nesse caso a filtragem deve ser feita no servidor.
+        """
+        if self.ticket_index is None:
+            return False
+        if self._index_dirty:
+            self._rebuild_index()
+        if self.ticket_index.overflowed:
+            return False
+        visible = self.ticket_index.search(text=text, status=status)
+        self.beginResetModel()
+        self._visible = visible
+        self._filter = (text, status) if visible is not None else None
+        self.endResetModel()
+        return True
+    
+    def set_tickets(self, tickets):
+        """Substitui todas as linhas por uma lista fixa de tickets"""
+        self._reset(None, exhausted=True, rows=[self._to_row(ticket) for ticket in tickets])
+    
+    def set_fetcher(self, fetcher):
+        """Reinicia o modelo com uma função fetcher(cursor, done)
+        
+        O fetcher busca a página seguinte ao cursor (de forma síncrona ou em
+        segundo plano) e chama done(tickets, next_cursor) ao terminar. A
+        primeira página é pedida imediatamente; as demais quando a view pede
+        mais linhas ao rolar até o fim.
+        
+        As linhas atuais continuam na tela até a primeira página chegar, para
+        que filtros trocados em sequência não redesenhem a tabela vazia a cada
+        troca; só o resultado do último fetcher é exibido.
+        """
+        self._start(fetcher, exhausted=False)
+        self._stale = True
+        self.fetchMore(QModelIndex())
+    
+    def _reset(self, fetcher, exhausted, rows=None):
+        self._start(fetcher, exhausted)
+        self._set_rows(rows or [])
+    
+    def _start(self, fetcher, exhausted):
+        self._fetcher = fetcher
+        self._cursor = None
+        self._exhausted = exhausted
+        self._loading = False
+        self._generation += 1  # descarta respostas de fetchers anteriores
+    
+    def _set_rows(self, rows):
+        self._stale = False
+        if self._visible is not None:
+            # As linhas exibidas são um subconjunto filtrado; recomeça do zero
+            self.beginResetModel()
+            self._rows = rows
+            self._visible = None
+            self._filter = None
+            self.endResetModel()
+            self._rebuild_index()
+            return
+        
+        was_empty = not self._rows
+        if self._merge_rows(rows) and self.ticket_index is not None:
+            if was_empty:
+                self._rebuild_index()
+            else:
+                # As posições mudaram; o índice é refeito só quando for usado
+                self._index_dirty = True
+    
+    def _rebuild_index(self):
+        self._index_dirty = False
+        if self.ticket_index is not None:
+            self.ticket_index.clear()
+            self.ticket_index.add(map(self._to_ticket, self._rows), 0)
+    
+    def _merge_rows(self, rows):
+        """Transforma as linhas atuais em rows com o mínimo de sinais
+        
+        Remove os ids que saíram, reordena (layoutChanged) se a ordem relativa
+        dos que ficaram mudou, insere os novos em blocos e emite dataChanged
+        para os que mudaram de conteúdo. Retorna True se algo mudou.
+        """
+        new_ids = {row[0] for row in rows}
+        changed = False
+        
+        # Remoções, de baixo para cima, em blocos contíguos
+        end = len(self._rows)
+        while end > 0:
+            if self._rows[end - 1][0] in new_ids:
+                end -= 1
+                continue
+            start = end - 1
+            while start > 0 and self._rows[start - 1][0] not in new_ids:
+                start -= 1
+            self.beginRemoveRows(QModelIndex(), start, end - 1)
+            del self._rows[start:end]
+            self.endRemoveRows()
+            changed = True
+            end = start
+        
+        kept = {row[0]: row for row in self._rows}
+        order = [row[0] for row in rows if row[0] in kept]
+        if order != [row[0] for row in self._rows]:
+            self._reorder([kept[ticket_id] for ticket_id in order])
+            changed = True
+        
+        # Inserções e atualizações, de cima para baixo
+        updated = []
+        position = 0
+        while position < len(rows):
+            if position < len(self._rows) and self._rows[position][0] == rows[position][0]:
+                if self._rows[position] != rows[position]:
+                    self._rows[position] = rows[position]
+                    updated.append(position)
+                position += 1
+                continue
+            next_id = self._rows[position][0] if position < len(self._rows) else None
+            end = position
+            while end < len(rows) and rows[end][0] != next_id:
+                end += 1
+            self.beginInsertRows(QModelIndex(), position, end - 1)
+            self._rows[position:position] = rows[position:end]
+            self.endInsertRows()
+            changed = True
+            position = end
+        
+        last_column = self.columnCount() - 1
+        for start, end in _ranges(updated):
+            self.dataChanged.emit(self.index(start, 0), self.index(end, last_column))
+        return changed or bool(updated)
+    
+    def _reorder(self, rows):
+        """Troca as linhas por uma permutação delas, mantendo seleção e índices persistentes"""
+        self.layoutAboutToBeChanged.emit()
+        positions = {row[0]: position for position, row in enumerate(rows)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(positions[self._rows[index.row()][0]], index.column())
+                       for index in old_indexes]
+        self._rows = rows
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def append_tickets(self, tickets):
+        """Adiciona tickets ao final do modelo"""
+        if not tickets:
+            return
+        first = len(self._rows)
+        if self.ticket_index is not None and not self._index_dirty:
+            self.ticket_index.add(tickets, first)
+        if self._visible is not None:
+            # Com filtro local ativo, as novas linhas só aparecem se passarem nele
+            self._rows.extend(self._to_row(ticket) for ticket in tickets)
+            if not self.set_filter(*self._filter):
+                self._show_all()
+            return
+        self.beginInsertRows(QModelIndex(), first, first + len(tickets) - 1)
+        self._rows.extend(self._to_row(ticket) for ticket in tickets)
+        self.endInsertRows()
+    
+    def apply_changes(self, tickets, accept=None, insert=True):
+        """Aplica tickets criados ou alterados (ex.: do ChangeFeed) às linhas carregadas
+        
+        Tickets já presentes são atualizados no lugar, ou removidos se
+        accept(ticket) for falso (ex.: mudaram para um status fora do filtro).
+        Tickets novos aceitos entram no topo, que é onde a listagem por data
+        de criação os colocaria; com insert=False (resultados de uma busca)
+        eles são ignorados.
+        """
+        positions = {row[0]: position for position, row in enumerate(self._rows)}
+        updated, removed, added = [], [], []
+        for ticket in tickets:
+            row = self._to_row(ticket)
+            position = positions.get(row[0])
+            wanted = accept is None or accept(ticket)
+            if position is None:
+                if wanted and insert:
+                    added.append(row)
+            elif not wanted:
+                removed.append(position)
+            elif self._rows[position] != row:
+                self._rows[position] = row
+                updated.append(position)
+        if not (updated or removed or added):
+            return
+        added.sort(key=lambda row: row[0], reverse=True)
+        if self.ticket_index is not None:
+            self._index_dirty = True
+        
+        if self._visible is not None:
+            for position in sorted(removed, reverse=True):
+                del self._rows[position]
+            self._rows[0:0] = added
+            if not self.set_filter(*self._filter):
+                self._show_all()
+            return
+        
+        last_column = self.columnCount() - 1
+        for start, end in _ranges(sorted(updated)):
+            self.dataChanged.emit(self.index(start, 0), self.index(end, last_column))
+        for start, end in reversed(list(_ranges(sorted(removed)))):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._rows[start:end + 1]
+            self.endRemoveRows()
+        if added:
+            self.beginInsertRows(QModelIndex(), 0, len(added) - 1)
+            self._rows[0:0] = added
+            self.endInsertRows()
+    
+    def _show_all(self):
+        self.beginResetModel()
+        self._visible = None
+        self._filter = None
+        self.endResetModel()
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._fetcher is not None and not self._exhausted and not self._loading
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._loading = True
+        generation = self._generation
+        
+        def done(tickets, next_cursor):
+            if generation != self._generation:
+                return
+            self._loading = False
+            self._cursor = next_cursor
+            self._exhausted = next_cursor is None
+            if self._stale:
+                self._set_rows([self._to_row(ticket) for ticket in tickets])
+            else:
+                self.append_tickets(tickets)
+        
+        self._fetcher(self._cursor, done)
+    
+    def _to_row(self, ticket):
+        return tuple(ticket.get(field) for field in self.FIELDS)
+    
+    def _to_ticket(self, row):
+        return dict(zip(self.FIELDS, row))
+
+
+def _ranges(positions):
+    """Agrupa posições crescentes em intervalos contíguos (início, fim)"""
+    start = previous = None
+    for position in positions:
+        if previous is not None and position == previous + 1:
+            previous = position
+            continue
+        if start is not None:
+            yield start, previous
+        start = previous = position
+    if start is not None:
+        yield start, previous
+
+
+class CommentsListModel(QAbstractListModel):
+    """Comentários de um ticket para QListView, carregados em páginas (fetchMore)
+    
+    Cada comentário é guardado já formatado (autor, data e texto), então o
+    modelo inteiro serve de cache da conversa renderizada: reabrir o ticket
+    reaproveita as páginas carregadas e continua do mesmo cursor. Depois da
+    última página, refresh() busca apenas os comentários posteriores ao
+    último exibido.
+    """
+    
+    page_loaded = pyqtSignal()
+    
+    def __init__(self, fetcher, parent=None):
+        super().__init__(parent)
+        self._fetcher = fetcher  # fetcher(cursor, done) -> done(comentarios, next_cursor)
+        self._rows = []          # (id, texto formatado)
+        self._cursor = None
+        self._exhausted = False
+        self._loading = False
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][1]
+        if role == Qt.UserRole:
+            return self._rows[index.row()][0]
+        return None
+    
+    @property
+    def loading(self):
+        return self._loading
+    
+    @property
+    def exhausted(self):
+        """True quando todos os comentários já foram carregados"""
+        return self._exhausted
+    
+    def refresh(self):
+        """Volta a buscar a partir do último comentário exibido (novos comentários)"""
+        if self._exhausted:
+            self._exhausted = False
+            self.fetchMore(QModelIndex())
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return not self._exhausted and not self._loading
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._loading = True
+        
+        def done(comments, next_cursor):
+            self._loading = False
+            self.add_page(comments, next_cursor)
+        
+        self._fetcher(self._cursor, done)
+    
+    def add_page(self, comments, next_cursor):
+        """Acrescenta uma página de comentários (ex.: buscada antecipadamente)"""
+        if comments:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(comments) - 1)
+            self._rows.extend((comment['id'], self._render(comment)) for comment in comments)
+            self.endInsertRows()
+            last = comments[-1]
+            self._cursor = (last['data_comentario'], last['id'])
+        # Sem próxima página, o cursor fica no último comentário para refresh()
+        self._exhausted = next_cursor is None
+        self.page_loaded.emit()
+    
+    @staticmethod
+    def _render(comment):
+        author = comment.get('usuario_nome') or ''
+        return f"{author} · {comment.get('data_comentario')}\n{comment.get('texto') or ''}"
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Desenha um botão na célula sem criar um QPushButton por linha"""
+    
+    clicked = pyqtSignal(QModelIndex)
+    
+    def __init__(self, text, parent=None):
+        super().__init__(parent)
+        self.text = text
+    
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(4, 2, -4, -2)
+        button.text = self.text
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        if option.state & QStyle.State_MouseOver:
+            button.state |= QStyle.State_MouseOver
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if option.rect.contains(event.pos()):
+                self.clicked.emit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
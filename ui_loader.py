@@ -0,0 +1,54 @@
+"""Carregamento das interfaces do Qt Designer
+
+Em produção as janelas usam as classes Python pré-geradas pelo build_ui.py
+(login_ui.py, register_ui.py, tickets_main_ui.py, ...), evitando ler e interpretar
+o XML dos arquivos .ui a cada inicialização. Em modo de desenvolvimento
+(APP_CONFIG['ui_dev_mode'] ou TICKETS_UI_DEV=1), ou se o módulo gerado não
+existir ou estiver desatualizado em relação ao .ui, cai para uic.loadUi.
+"""
+import importlib
+import os
+
+import startup_timing
+from config import APP_CONFIG
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def dev_mode():
+    """Indica se as interfaces devem ser lidas diretamente dos arquivos .ui"""
+    return APP_CONFIG.get('ui_dev_mode') or os.environ.get('TICKETS_UI_DEV') == '1'
+
+def compiled_form(name):
+    """Retorna a classe Ui_* pré-gerada para o formulário, ou None"""
+    ui_path = os.path.join(BASE_DIR, f'{name}.ui')
+    py_path = os.path.join(BASE_DIR, f'{name}_ui.py')
+    if not os.path.exists(py_path):
+        return None
+    if os.path.exists(ui_path) and os.path.getmtime(ui_path) > os.path.getmtime(py_path):
+        return None
+    
+    module = importlib.import_module(f'{name}_ui')
+    for attr, value in vars(module).items():
+        if attr.startswith('Ui_') and isinstance(value, type):
+            return value
+    return None
+
+def load_ui(name, widget):
+    """Monta o formulário `name` (sem extensão) sobre o widget informado
+    
+    Assim como uic.loadUi, os widgets do formulário ficam acessíveis como
+    atributos do próprio widget (ex.: self.login_btn).
+    """
+    form = None if dev_mode() else compiled_form(name)
+    if form is None:
+        from PyQt5 import uic  # importado só quando necessário, é caro
+        uic.loadUi(os.path.join(BASE_DIR, f'{name}.ui'), widget)
+        startup_timing.mark(f'{name}.ui (uic.loadUi)')
+        return widget
+    
+    ui = form()
+    ui.setupUi(widget)
+    for attr, value in vars(ui).items():
+        setattr(widget, attr, value)
+    startup_timing.mark(f'{name}.ui (pré-compilado)')
+    return widget
@@ -0,0 +1,293 @@
+import functools
+import itertools
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+
+from config import POOL_CONFIG
+
+
+class WorkerSignals(QObject):
+    """Sinais emitidos pela thread de trabalho de volta para a thread da interface"""
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class DbTask(QRunnable):
+    """Executa uma chamada ao DatabaseManager fora da thread da interface"""
+    
+    def __init__(self, task_id, fn, args, kwargs):
+        super().__init__()
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.signals = WorkerSignals()
+        # O QueryRunner guarda a referência até o sinal de término ser tratado;
+        # com autoDelete o Qt apagaria a tarefa antes, e cancel() tocaria em um
+        # objeto já destruído
+        self.setAutoDelete(False)
+    
+    def run(self):
+        if self.cancelled:
+            # Ainda avisa o QueryRunner para que ele libere a tarefa
+            self.signals.finished.emit(self.task_id, None)
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.task_id, str(e))
+            return
+        self.signals.finished.emit(self.task_id, result)
+
+
+class QueryRunner(QObject):
+    """Despacha consultas para um QThreadPool e entrega os resultados via sinais
+    
+    Cada consulta pertence a um canal (ex.: 'tickets'). Uma nova consulta no
+    mesmo canal cancela a anterior: se ainda estiver na fila ela nem chega a
+    rodar, e se já estiver rodando seu resultado é descartado.
+    
+    Com delay, a consulta só é despachada depois de delay ms sem outra chamada
+    no mesmo canal, o que agrupa rajadas de eventos (digitação, setas no
+    combo) em uma única consulta com os valores finais.
+    """
+    
+    busy_changed = pyqtSignal(bool)
+    
+    def __init__(self, parent=None, max_threads=None):
+        super().__init__(parent)
+        self.thread_pool = QThreadPool(self)
+        # Não adianta ter mais threads que conexões disponíveis no pool
+        self.thread_pool.setMaxThreadCount(max_threads or POOL_CONFIG['max_size'])
+        self._ids = itertools.count(1)
+        self._tasks = {}
+        self._latest = {}
+        self._timers = {}
+    
+    @property
+    def busy(self):
+        return bool(self._tasks)
+    
+    def run(self, channel, fn, *args, on_result=None, on_error=None, delay=0, **kwargs):
+        """Agenda fn(*args, **kwargs) no canal informado e retorna o id da tarefa
+        
+        Com delay (ms), retorna None e só agenda a consulta quando o canal
+        fica delay ms sem novas chamadas.
+        """
+        self.cancel(channel)
+        
+        if delay:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(functools.partial(
+                self._run_delayed, channel, timer, fn, args, kwargs, on_result, on_error))
+            self._timers[channel] = timer
+            timer.start(delay)
+            return None
+        
+        task = DbTask(next(self._ids), fn, args, kwargs)
+        task.channel = channel
+        task.on_result = on_result
+        task.on_error = on_error
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        
+        was_busy = self.busy
+        self._tasks[task.task_id] = task
+        self._latest[channel] = task.task_id
+        self.thread_pool.start(task)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return task.task_id
+    
+    def cancel(self, channel):
+        """Cancela a consulta pendente do canal, se houver"""
+        timer = self._timers.pop(channel, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        
+        task_id = self._latest.pop(channel, None)
+        task = self._tasks.get(task_id)
+        if task is None:
+            return
+        task.cancelled = True
+        if self.thread_pool.tryTake(task):
+            self._forget(task)
+    
+    def wait(self, msecs=-1):
+        """Aguarda o término das consultas em andamento"""
+        return self.thread_pool.waitForDone(msecs)
+    
+    def _run_delayed(self, channel, timer, fn, args, kwargs, on_result, on_error):
+        if self._timers.get(channel) is not timer:
+            return
+        del self._timers[channel]
+        timer.deleteLater()
+        self.run(channel, fn, *args, on_result=on_result, on_error=on_error, **kwargs)
+    
+    @pyqtSlot(int, object)
+    def _on_finished(self, task_id, result):
+        task = self._take_current(task_id)
+        if task is not None and task.on_result is not None:
+            task.on_result(result)
+    
+    @pyqtSlot(int, str)
+    def _on_failed(self, task_id, message):
+        task = self._take_current(task_id)
+        if task is None:
+            return
+        if task.on_error is not None:
+            task.on_error(message)
+        else:
+            print(f"Erro na consulta em segundo plano: {message}")
+    
+    def _take_current(self, task_id):
+        """Remove a tarefa concluída e a retorna se ela ainda for a mais recente do canal"""
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        self._forget(task)
+        if task.cancelled or self._latest.get(task.channel) != task_id:
+            return None
+        del self._latest[task.channel]
+        return task
+    
+    def _forget(self, task):
+        self._tasks.pop(task.task_id, None)
+        if not self._tasks:
+            self.busy_changed.emit(False)
+
+
+class ChangeFeed(QObject):
+    """Acompanha o diário ticket_events e entrega à interface apenas o que mudou
+    
+    A cada interval ms busca os eventos posteriores ao último visto (via
+    DatabaseManager.get_ticket_changes) e emite changed(resultado) quando há
+    algo novo. No MySQL, transações que fazem commit fora de ordem podem
+    gravar um id menor que o último já lido; por isso cada leitura repete
+    os últimos LOOKBACK ids, ignorando os eventos já entregues.
+    """
+    
+    LOOKBACK = 200
+    
+    changed = pyqtSignal(object)
+    
+    def __init__(self, db, interval, user_id=None, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.user_id = user_id
+        # Runner próprio, para as consultas periódicas não marcarem a tela como ocupada
+        self.runner = QueryRunner(self, max_threads=1)
+        self.last_event = None
+        self._first_event = None  # último evento anterior ao start(), nunca repetido
+        self._seen = set()
+        self._polling = False
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.poll)
+    
+    def start(self):
+        """Marca o ponto de partida no diário e começa a consultar periodicamente"""
+        self.timer.start()
+        self.poll()
+    
+    def stop(self):
+        self.timer.stop()
+        self.runner.cancel('changes')
+        self._polling = False
+    
+    def poll(self):
+        """Busca os eventos novos agora (ex.: logo após uma alteração feita nesta tela)"""
+        if self._polling:
+            return
+        self._polling = True
+        since = self.last_event
+        if since is not None:
+            since = max(self._first_event, since - self.LOOKBACK)
+        self.runner.run('changes', self.db.get_ticket_changes, since,
+                        user_id=self.user_id, seen=frozenset(self._seen),
+                        on_result=self._on_result, on_error=self._on_error)
+    
+    def _on_result(self, result):
+        self._polling = False
+        first = self.last_event is None
+        if first:
+            self._first_event = result['last_event'] or 0
+        self.last_event = max(self.last_event or 0, result['last_event'] or 0)
+        self._seen.update(event['id'] for event in result['events'])
+        self._seen = {event_id for event_id in self._seen if event_id > self.last_event - self.LOOKBACK}
+        if not first and result['events']:
+            self.changed.emit(result)
+        if result['more']:
+            self.poll()
+    
+    def _on_error(self, message):
+        self._polling = False
+        print(f"Erro ao acompanhar alterações de tickets: {message}")
+
+
+class CommentPrefetcher(QObject):
+    """Busca antecipadamente a primeira página de comentários dos tickets em vista
+    
+    A tela informa, em ordem de prioridade, os tickets que o usuário está
+    vendo (request); depois de delay ms sem novos pedidos, os que ainda não
+    estão guardados são buscados juntos em uma única consulta
+    (DatabaseManager.get_comments_first_pages), em segundo plano. As páginas
+    ficam em um cache LRU de até max_size tickets, de onde take() as retira
+    ao abrir o ticket.
+    """
+    
+    def __init__(self, db, limit, max_size=100, delay=150, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.limit = limit
+        self.max_size = max_size
+        self.delay = delay
+        # Runner próprio, para a busca antecipada não marcar a tela como ocupada
+        self.runner = QueryRunner(self, max_threads=1)
+        self._pages = OrderedDict()  # ticket_id -> (comentarios, next_cursor)
+        self._generation = 0
+    
+    def request(self, ticket_ids):
+        """Agenda a busca dos tickets informados que ainda não estão no cache"""
+        missing = [ticket_id for ticket_id in dict.fromkeys(ticket_ids) if ticket_id not in self._pages]
+        if not missing:
+            self.runner.cancel('prefetch')
+            return
+        generation = self._generation
+        self.runner.run('prefetch', self.db.get_comments_first_pages, missing[:self.max_size],
+                        limit=self.limit,
+                        delay=self.delay,
+                        on_result=lambda pages: self._store(pages, generation),
+                        on_error=self._on_error)
+    
+    def take(self, ticket_id):
+        """Retira a página guardada do ticket, ou None"""
+        return self._pages.pop(ticket_id, None)
+    
+    def discard(self, ticket_ids):
+        """Descarta páginas que ficaram desatualizadas (ex.: comentário novo)"""
+        if not ticket_ids:
+            return
+        self._generation += 1  # resultados em andamento podem ser anteriores à mudança
+        for ticket_id in ticket_ids:
+            self._pages.pop(ticket_id, None)
+    
+    def stop(self):
+        self.runner.cancel('prefetch')
+    
+    def _on_error(self, message):
+        # Sem a página antecipada o diálogo busca os comentários ao abrir
+        print(f"Erro na busca antecipada de comentários: {message}")
+    
+    def _store(self, pages, generation):
+        if generation != self._generation:
+            return
+        for ticket_id, page in pages.items():
+            self._pages[ticket_id] = page
+            self._pages.move_to_end(ticket_id)
+        while len(self._pages) > self.max_size:
+            self._pages.popitem(last=False)